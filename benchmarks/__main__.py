@@ -0,0 +1,117 @@
+"""
+Suíte de benchmarks.
+
+Uso:
+    python -m benchmarks list
+    python -m benchmarks run [--suite micro|use_cases|endpoints] [-k nome]
+                             [--save NOME_OU_CAMINHO]
+    python -m benchmarks compare BASELINE ATUAL [--threshold 0.10]
+
+Baselines salvos só com o nome ficam em benchmarks/baselines/<nome>.json.
+O compare termina com código 1 se algum benchmark ficou mais lento que o
+limite.
+"""
+
+import argparse
+import sys
+
+from benchmarks import endpoints, micro, use_cases  # noqa: F401
+from benchmarks.runner import (
+    DEFAULT_THRESHOLD,
+    SUITES,
+    BenchmarkResult,
+    compare,
+    load,
+    resolve_path,
+    run_sync,
+    save,
+    select,
+)
+
+
+def _report(name: str, result: BenchmarkResult) -> None:
+    print(
+        f'{name:<40} {result.median_us:>12.2f} µs '
+        f'(min {result.min_us:.2f}, max {result.max_us:.2f})',
+        flush=True,
+    )
+
+
+def _run(args: argparse.Namespace) -> int:
+    benchmarks = select(args.suite, args.keyword)
+    if not benchmarks:
+        print('Nenhum benchmark selecionado', file=sys.stderr)
+        return 1
+
+    results = run_sync(benchmarks, _report)
+    if args.save:
+        path = resolve_path(args.save)
+        save(results, path)
+        print(f'Resultados salvos em {path}')
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = load(resolve_path(args.baseline))
+    current = load(resolve_path(args.current))
+
+    regressions = 0
+    for item in compare(baseline, current):
+        regressed = item.is_regression(args.threshold)
+        regressions += regressed
+        print(
+            f'{item.name:<40} {item.baseline_us:>12.2f} → '
+            f'{item.current_us:>12.2f} µs  {item.ratio:6.2f}x'
+            f'{"  REGRESSÃO" if regressed else ""}'
+        )
+
+    for name in sorted(baseline.keys() - current.keys()):
+        print(f'{name:<40} ausente na execução atual')
+    for name in sorted(current.keys() - baseline.keys()):
+        print(f'{name:<40} novo, sem baseline')
+
+    if regressions:
+        print(
+            f'{regressions} regressão(ões) acima de {args.threshold:.0%}',
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help='lista os benchmarks registrados')
+
+    run_parser = commands.add_parser('run', help='executa os benchmarks')
+    run_parser.add_argument(
+        '--suite',
+        action='append',
+        choices=SUITES,
+    )
+    run_parser.add_argument('-k', dest='keyword')
+    run_parser.add_argument('--save')
+
+    compare_parser = commands.add_parser(
+        'compare', help='compara duas execuções salvas'
+    )
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument(
+        '--threshold', type=float, default=DEFAULT_THRESHOLD
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == 'list':
+        for bench in select():
+            print(bench.name)
+        return 0
+    if args.command == 'run':
+        return _run(args)
+    return _compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Benchmarks ponta a ponta: requisições HTTP reais contra a aplicação, em
+processo, via ASGI. Os repositórios e o cache da listagem são trocados
+pelos de memória, para que nenhuma requisição chegue ao banco.
+"""
+
+from itertools import count
+
+import httpx
+
+from app.infrastructure.cache.user_list_cache import (
+    InMemoryVersionStore,
+    UserListCache,
+)
+from app.infrastructure.config.settings import settings
+from app.infrastructure.dependencies.auth_dependencies import (
+    get_refresh_token_repository,
+)
+from app.infrastructure.dependencies.user_dependencies import (
+    get_primary_user_repository,
+    get_user_list_cache,
+    get_user_repository,
+)
+from app.infrastructure.repositories.in_memory_refresh_token_repository import (  # noqa: E501
+    InMemoryRefreshTokenRepository,
+)
+from app.infrastructure.security.jwt import create_access_token
+from app.infrastructure.security.password import get_password_hash
+from app.main import app
+from benchmarks.micro import PASSWORD
+from benchmarks.runner import benchmark
+from benchmarks.seed import seeded_repository
+
+USERS = 10_000
+EXPORT_USERS = 1_000
+PAGE_SIZE = 100
+BASE_URL = f'http://benchmark{settings.API_PREFIX}'
+
+
+async def _client(users: int, password_hash: str = 'hash'):
+    repository, seeded = await seeded_repository(users, password_hash)
+    refresh_tokens = InMemoryRefreshTokenRepository()
+    list_cache = UserListCache(
+        max_size=settings.USER_LIST_CACHE_MAX_SIZE,
+        ttl=settings.USER_LIST_CACHE_TTL,
+        versions=InMemoryVersionStore(),
+    )
+    app.dependency_overrides.update({
+        get_user_repository: lambda: repository,
+        # Autenticação e login leem só do primário
+        get_primary_user_repository: lambda: repository,
+        get_refresh_token_repository: lambda: refresh_tokens,
+        get_user_list_cache: lambda: list_cache,
+    })
+
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=BASE_URL
+    )
+    token = create_access_token(str(seeded[0].id))
+    client.headers['Authorization'] = f'Bearer {token}'
+    return client, seeded
+
+
+async def _get(client: httpx.AsyncClient, url: str) -> None:
+    response = await client.get(url)
+    response.raise_for_status()
+
+
+@benchmark('endpoints.get_user', number=1_000)
+async def get_user():
+    client, users = await _client(USERS)
+    url = f'/users/{users[USERS // 2].id}/'
+    return lambda: _get(client, url)
+
+
+@benchmark('endpoints.list_users', number=300)
+async def list_users():
+    client, _ = await _client(USERS)
+    url = f'/users/?page=10&page_size={PAGE_SIZE}'
+    return lambda: _get(client, url)
+
+
+@benchmark('endpoints.list_users_by_cursor', number=200)
+async def list_users_by_cursor():
+    client, _ = await _client(USERS)
+    first_page = await client.get(
+        f'/users/?pagination=cursor&page_size={PAGE_SIZE}'
+    )
+    url = (
+        f'/users/?page_size={PAGE_SIZE}'
+        f'&cursor={first_page.json()["next_cursor"]}'
+    )
+    return lambda: _get(client, url)
+
+
+@benchmark('endpoints.export_users_ndjson', number=5)
+async def export_users_ndjson():
+    client, _ = await _client(EXPORT_USERS)
+    return lambda: _get(client, '/users/export?format=ndjson')
+
+
+@benchmark('endpoints.create_user', number=3, repeat=3)
+async def create_user():
+    client, _ = await _client(1)
+    sequence = count()
+
+    async def execute():
+        response = await client.post(
+            '/users/',
+            json={
+                'name': 'Maria Silva',
+                'email': f'maria{next(sequence)}@example.com',
+                'password': PASSWORD,
+            },
+        )
+        response.raise_for_status()
+
+    return execute
+
+
+@benchmark('endpoints.login', number=3, repeat=3)
+async def login():
+    client, users = await _client(1, get_password_hash(PASSWORD))
+    form = {'username': users[0].email, 'password': PASSWORD}
+
+    async def execute():
+        response = await client.post('/auth/login', data=form)
+        response.raise_for_status()
+
+    return execute
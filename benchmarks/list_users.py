@@ -0,0 +1,147 @@
+"""
+Latência do GET /users/ com 100 itens por página, comparando:
+
+- antes: itens validados com UserResponse(...) e resposta validada e
+  serializada de novo pelo response_model (APIRoute);
+- from_user: itens montados com UserResponse.from_user, ainda em APIRoute;
+- depois: from_user + ORJSONModelRoute, que serializa uma única vez.
+
+O banco e a autenticação são substituídos por dependências em memória, de
+modo que a diferença medida é só a da camada de resposta.
+
+Uso:
+    python -m benchmarks.list_users
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.routing import APIRoute
+
+from app.domain.entities.user import User
+from app.infrastructure.dependencies.auth_dependencies import get_current_user
+from app.infrastructure.dependencies.user_dependencies import (
+    get_list_users_use_case,
+)
+from app.presentation.controllers.user_controller import list_users
+from app.presentation.schemas.common.pagination import (
+    CursorPaginatedResponse,
+    PaginatedResponse,
+)
+from app.presentation.schemas.user.response import UserResponse
+from app.presentation.serializers.orjson_response import ORJSONModelRoute
+from app.use_cases.user.list_users import ListUsersOutput
+
+PAGE_SIZE = 100
+REQUESTS = 2_000
+WARMUP = 200
+
+USERS = [
+    User(
+        id=uuid4(),
+        name=f'Usuário {i}',
+        email=f'usuario{i}@example.com',
+        password='hash',
+        created_at=datetime.now(),
+    )
+    for i in range(PAGE_SIZE)
+]
+
+
+class InMemoryListUsersUseCase:
+    async def execute(self, input_data) -> ListUsersOutput:  # noqa: PLR6301
+        return ListUsersOutput(users=USERS, total=10_000, total_pages=100)
+
+
+async def validated_list_users(
+    page: int = 1,
+    page_size: int = 10,
+    use_case: InMemoryListUsersUseCase = Depends(get_list_users_use_case),
+):
+    """
+    Corpo do controller antes do ORJSONModelRoute
+    """
+    data = await use_case.execute(input_data=None)
+    return PaginatedResponse(
+        page=page,
+        page_size=page_size,
+        items=[
+            UserResponse(
+                id=user.id,
+                name=user.name,
+                email=user.email,
+                created_at=user.created_at,
+            )
+            for user in data.users
+        ],
+        total=data.total,
+        total_pages=data.total_pages,
+    )
+
+
+def build_app(route_class: type[APIRoute], endpoint=list_users) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+    router.add_api_route(
+        '/users/',
+        endpoint,
+        methods=['GET'],
+        response_model=PaginatedResponse[UserResponse]
+        | CursorPaginatedResponse[UserResponse],
+        dependencies=[Depends(get_current_user)],
+    )
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_current_user] = lambda: USERS[0]
+    app.dependency_overrides[get_list_users_use_case] = (
+        InMemoryListUsersUseCase
+    )
+    return app
+
+
+async def measure(app: FastAPI) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    url = f'/users/?page_size={PAGE_SIZE}'
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://bench'
+    ) as client:
+        for _ in range(WARMUP):
+            (await client.get(url)).raise_for_status()
+
+        latencies = []
+        for _ in range(REQUESTS):
+            start = time.perf_counter()
+            (await client.get(url)).raise_for_status()
+            latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+
+def percentile(latencies: list[float], p: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+
+async def main() -> None:
+    results = {
+        'antes': await measure(build_app(APIRoute, validated_list_users)),
+        'from_user': await measure(build_app(APIRoute)),
+        'depois': await measure(build_app(ORJSONModelRoute)),
+    }
+
+    for name, latencies in results.items():
+        print(
+            f'{name:<10} '
+            f'p50 {percentile(latencies, 0.50) * 1e3:7.3f} ms  '
+            f'p99 {percentile(latencies, 0.99) * 1e3:7.3f} ms'
+        )
+
+    before = percentile(results['antes'], 0.50)
+    after = percentile(results['depois'], 0.50)
+    print(f'speedup p50: {before / after:.2f}x')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,418 @@
+"""
+Gerador de carga para encontrar o limite de vazão por worker.
+
+Dispara uma mistura de POST /users/, POST /auth/login, GET /users/{id}/ e
+GET /users/ contra a aplicação em processo (ASGI, app.main:app) ou contra
+uma URL, com concorrência fixa (loop fechado) ou taxa fixa (loop aberto), e
+reporta latências p50/p95/p99/max e a taxa de erros por rota.
+
+Uso:
+    # Popula tb_users (ou o repositório em memória) com senhas pré-computadas
+    python -m benchmarks.load seed --users 100000
+
+    # Em processo, 32 clientes simultâneos por 30s
+    python -m benchmarks.load run --concurrency 32 --duration 30
+
+    # Contra um servidor, 200 req/s
+    python -m benchmarks.load run --url http://localhost:8000 --rps 200
+
+Com USER_REPOSITORY_BACKEND=memory os dados só existem no processo: use
+`run --seed-users N` para popular antes da carga.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from uuid import uuid4
+
+import httpx
+
+from app.constants import UserRepositoryBackend
+from app.domain.entities.user import User
+from app.infrastructure.config.database import async_session
+from app.infrastructure.config.settings import settings
+from app.infrastructure.dependencies.auth_dependencies import (
+    get_login_throttle,
+)
+from app.infrastructure.dependencies.user_dependencies import (
+    in_memory_user_repository,
+)
+from app.infrastructure.repositories.sqlmodel_user_repository import (
+    SqlModelUserRepository,
+)
+from app.infrastructure.security.login_throttle import (
+    InMemoryThrottleStore,
+    LoginThrottle,
+)
+from app.infrastructure.security.password import get_password_hash
+from app.main import app
+
+PASSWORD = 'L0adTest!'
+EMAIL_PREFIX = 'loadtest'
+EMAIL_DOMAIN = 'example.com'
+DEFAULT_MIX = 'signup=1,login=1,get_user=10,list_users=5'
+# Limites dos buckets do histograma, em ms
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# Em processo toda a carga sai de um único IP: sem limite de login, para
+# medir a rota e não as respostas 429
+UNLIMITED_THROTTLE = LoginThrottle(
+    InMemoryThrottleStore(),
+    email_limit=sys.maxsize,
+    ip_limit=sys.maxsize,
+    window_seconds=settings.LOGIN_THROTTLE_WINDOW,
+)
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    def percentile(self, p: float) -> float:
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    def histogram(self) -> dict[str, int]:
+        buckets = dict.fromkeys(
+            [f'<={bound}ms' for bound in HISTOGRAM_BOUNDS_MS] + ['>max'], 0
+        )
+        for latency in self.latencies:
+            ms = latency * 1e3
+            bound = next((b for b in HISTOGRAM_BOUNDS_MS if ms <= b), None)
+            buckets[f'<={bound}ms' if bound else '>max'] += 1
+        return buckets
+
+    def summary(self, elapsed: float) -> dict:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'error_rate': self.errors / self.requests,
+            'rps': self.requests / elapsed,
+            'p50_ms': self.percentile(0.50) * 1e3,
+            'p95_ms': self.percentile(0.95) * 1e3,
+            'p99_ms': self.percentile(0.99) * 1e3,
+            'max_ms': max(self.latencies) * 1e3,
+            'statuses': dict(self.statuses),
+            'histogram': self.histogram(),
+        }
+
+
+@dataclass
+class Scenario:
+    client: httpx.AsyncClient
+    users: list[tuple[str, str]]  # (id, email) de usuários semeados
+    token: str
+    run_id: str = field(default_factory=lambda: uuid4().hex[:8])
+    signups: int = 0
+
+    async def signup(self) -> httpx.Response:
+        self.signups += 1
+        return await self.client.post(
+            '/users/',
+            json={
+                'name': 'Carga Teste',
+                'email': f'{EMAIL_PREFIX}-{self.run_id}-{self.signups}'
+                f'@{EMAIL_DOMAIN}',
+                'password': PASSWORD,
+            },
+        )
+
+    async def login(self) -> httpx.Response:
+        _, email = random.choice(self.users)
+        return await self.client.post(
+            '/auth/login', data={'username': email, 'password': PASSWORD}
+        )
+
+    async def get_user(self) -> httpx.Response:
+        user_id, _ = random.choice(self.users)
+        return await self.client.get(
+            f'/users/{user_id}/', headers=self._auth()
+        )
+
+    async def list_users(self) -> httpx.Response:
+        return await self.client.get(
+            f'/users/?page={random.randint(1, 10)}&page_size=50'
+            '&count_mode=estimated',
+            headers=self._auth(),
+        )
+
+    def _auth(self) -> dict[str, str]:
+        return {'Authorization': f'Bearer {self.token}'}
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    weights = {}
+    for item in mix.split(','):
+        name, _, weight = item.partition('=')
+        if name not in {'signup', 'login', 'get_user', 'list_users'}:
+            raise argparse.ArgumentTypeError(f'rota desconhecida: {name}')
+        weights[name] = int(weight or 1)
+    return weights
+
+
+async def seed(total: int, batch_size: int) -> None:
+    # Um único hash para todos: o custo do argon2 não entra na semeadura
+    password_hash = get_password_hash(PASSWORD)
+
+    if settings.USER_REPOSITORY_BACKEND == UserRepositoryBackend.MEMORY:
+        await _seed_batches(
+            in_memory_user_repository.create_many,
+            total,
+            batch_size,
+            password_hash,
+        )
+        return
+
+    async with async_session() as session:
+        await _seed_batches(
+            SqlModelUserRepository(session).create_many,
+            total,
+            batch_size,
+            password_hash,
+        )
+
+
+async def _seed_batches(
+    create_many: Callable[[list[User]], Awaitable[list[User]]],
+    total: int,
+    batch_size: int,
+    password_hash: str,
+) -> None:
+    created = 0
+    for start in range(0, total, batch_size):
+        # Emails determinísticos: semear de novo só completa o que faltar
+        created += len(
+            await create_many([
+                User(
+                    name=f'Carga {i}',
+                    email=f'{EMAIL_PREFIX}{i}@{EMAIL_DOMAIN}',
+                    password=password_hash,
+                )
+                for i in range(start, min(start + batch_size, total))
+            ])
+        )
+        print(f'\r{min(start + batch_size, total)}/{total}', end='')
+    print(f'\n{created} usuários criados')
+
+
+async def prepare(client: httpx.AsyncClient, pool_size: int) -> Scenario:
+    login = await client.post(
+        '/auth/login',
+        data={
+            'username': f'{EMAIL_PREFIX}0@{EMAIL_DOMAIN}',
+            'password': PASSWORD,
+        },
+    )
+    if login.status_code != httpx.codes.OK:
+        raise SystemExit(
+            'Não foi possível autenticar com os usuários semeados; '
+            'rode `python -m benchmarks.load seed` antes'
+        )
+    token = login.json()['access_token']
+
+    users, cursor = [], None
+    while len(users) < pool_size:
+        url = '/users/?pagination=cursor&page_size=100'
+        if cursor:
+            url += f'&cursor={cursor}'
+        page = (
+            await client.get(url, headers={'Authorization': f'Bearer {token}'})
+        ).json()
+        users += [
+            (item['id'], item['email'])
+            for item in page['items']
+            if item['email'].startswith(EMAIL_PREFIX)
+            and '-' not in item['email']
+        ]
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+
+    return Scenario(client=client, users=users[:pool_size], token=token)
+
+
+async def _timed(
+    stats: dict[str, RouteStats],
+    route: str,
+    call: Callable[[], Awaitable[httpx.Response]],
+    scheduled_at: float,
+) -> None:
+    try:
+        response = await call()
+        status = response.status_code
+    except httpx.HTTPError:
+        status = 0
+    # No loop aberto a latência conta a partir do horário agendado, para não
+    # esconder a fila que se forma quando o servidor não acompanha a taxa
+    elapsed = time.perf_counter() - scheduled_at
+
+    route_stats = stats[route]
+    route_stats.latencies.append(elapsed)
+    route_stats.statuses[status] += 1
+    if status == 0 or status >= httpx.codes.BAD_REQUEST:
+        route_stats.errors += 1
+
+
+async def run_closed_loop(
+    scenario: Scenario,
+    weights: dict[str, int],
+    concurrency: int,
+    duration: float,
+) -> dict[str, RouteStats]:
+    stats: dict[str, RouteStats] = defaultdict(RouteStats)
+    routes, route_weights = list(weights), list(weights.values())
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            route = random.choices(routes, route_weights)[0]
+            await _timed(
+                stats, route, getattr(scenario, route), time.perf_counter()
+            )
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return stats
+
+
+async def run_open_loop(
+    scenario: Scenario,
+    weights: dict[str, int],
+    rps: float,
+    duration: float,
+) -> dict[str, RouteStats]:
+    stats: dict[str, RouteStats] = defaultdict(RouteStats)
+    routes, route_weights = list(weights), list(weights.values())
+    tasks = set()
+    start = time.perf_counter()
+
+    for i in range(int(rps * duration)):
+        scheduled_at = start + i / rps
+        await asyncio.sleep(max(0.0, scheduled_at - time.perf_counter()))
+        route = random.choices(routes, route_weights)[0]
+        task = asyncio.create_task(
+            _timed(stats, route, getattr(scenario, route), scheduled_at)
+        )
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    await asyncio.gather(*tasks)
+    return stats
+
+
+def report(stats: dict[str, RouteStats], elapsed: float) -> dict:
+    summary = {
+        route: route_stats.summary(elapsed)
+        for route, route_stats in sorted(stats.items())
+    }
+    total = sum(item['requests'] for item in summary.values())
+    errors = sum(item['errors'] for item in summary.values())
+
+    print(
+        f'\n{"rota":<12} {"req":>7} {"rps":>8} {"erros":>7} '
+        f'{"p50":>9} {"p95":>9} {"p99":>9} {"max":>9}'
+    )
+    for route, item in summary.items():
+        print(
+            f'{route:<12} {item["requests"]:>7} {item["rps"]:>8.1f} '
+            f'{item["error_rate"]:>6.1%} '
+            f'{item["p50_ms"]:>7.1f}ms {item["p95_ms"]:>7.1f}ms '
+            f'{item["p99_ms"]:>7.1f}ms {item["max_ms"]:>7.1f}ms'
+        )
+    print(
+        f'{"total":<12} {total:>7} {total / elapsed:>8.1f} '
+        f'{errors / max(total, 1):>6.1%}'
+    )
+
+    for route, item in summary.items():
+        print(f'\n{route}')
+        peak = max(item['histogram'].values()) or 1
+        for bucket, amount in item['histogram'].items():
+            if amount:
+                bar = '#' * max(1, round(40 * amount / peak))
+                print(f'  {bucket:>9} {amount:>7} {bar}')
+
+    return {'elapsed': elapsed, 'routes': summary}
+
+
+async def run(args: argparse.Namespace) -> int:
+    if args.url:
+        transport = httpx.AsyncHTTPTransport(retries=0)
+        base_url = f'{args.url.rstrip("/")}{settings.API_PREFIX}'
+    else:
+        app.dependency_overrides[get_login_throttle] = (
+            lambda: UNLIMITED_THROTTLE
+        )
+        transport = httpx.ASGITransport(app=app)
+        base_url = f'http://loadtest{settings.API_PREFIX}'
+
+    if args.seed_users:
+        await seed(args.seed_users, args.batch_size)
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, timeout=30, limits=limits
+    ) as client:
+        scenario = await prepare(client, args.user_pool)
+        print(
+            f'{len(scenario.users)} usuários no pool, '
+            f'{args.duration:.0f}s, mix {args.mix}'
+        )
+
+        start = time.perf_counter()
+        if args.rps:
+            stats = await run_open_loop(
+                scenario, args.mix, args.rps, args.duration
+            )
+        else:
+            stats = await run_closed_loop(
+                scenario, args.mix, args.concurrency, args.duration
+            )
+        elapsed = time.perf_counter() - start
+
+    result = report(stats, elapsed)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(result, file, indent=2)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.load')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = commands.add_parser('seed', help='popula tb_users')
+    seed_parser.add_argument('--users', type=int, default=100_000)
+    seed_parser.add_argument('--batch-size', type=int, default=1_000)
+
+    run_parser = commands.add_parser('run', help='executa a carga')
+    run_parser.add_argument('--url', help='padrão: app.main:app em processo')
+    load = run_parser.add_mutually_exclusive_group()
+    load.add_argument('--concurrency', type=int, default=16)
+    load.add_argument('--rps', type=float)
+    run_parser.add_argument('--duration', type=float, default=30)
+    run_parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX)
+    run_parser.add_argument('--user-pool', type=int, default=1_000)
+    run_parser.add_argument('--seed-users', type=int, default=0)
+    run_parser.add_argument('--batch-size', type=int, default=1_000)
+    run_parser.add_argument('--json', help='salva o resumo em JSON')
+
+    args = parser.parse_args(argv)
+    if args.command == 'seed':
+        asyncio.run(seed(args.users, args.batch_size))
+        return 0
+    return asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
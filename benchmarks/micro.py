@@ -0,0 +1,51 @@
+"""
+Microbenchmarks das primitivas de segurança e da validação de entrada
+"""
+
+from uuid import uuid4
+
+from app.infrastructure.security.jwt import (
+    create_access_token,
+    decode_access_token,
+)
+from app.infrastructure.security.password import (
+    get_password_hash,
+    verify_password,
+)
+from app.presentation.schemas.user.request import UserCreateRequest
+from benchmarks.runner import benchmark
+
+PASSWORD = 'S3nha!Forte'
+
+
+@benchmark('micro.get_password_hash', number=3, repeat=3)
+def password_hash():
+    return lambda: get_password_hash(PASSWORD)
+
+
+@benchmark('micro.verify_password', number=3, repeat=3)
+def password_verify():
+    hashed = get_password_hash(PASSWORD)
+    return lambda: verify_password(PASSWORD, hashed)
+
+
+@benchmark('micro.create_access_token', number=5_000)
+def access_token_create():
+    subject = str(uuid4())
+    return lambda: create_access_token(subject)
+
+
+@benchmark('micro.decode_access_token', number=5_000)
+def access_token_decode():
+    token = create_access_token(str(uuid4()))
+    return lambda: decode_access_token(token)
+
+
+@benchmark('micro.user_create_request', number=5_000)
+def user_create_request():
+    data = {
+        'name': 'maria da silva',
+        'email': 'maria.silva@example.com',
+        'password': PASSWORD,
+    }
+    return lambda: UserCreateRequest.model_validate(data)
@@ -0,0 +1,177 @@
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+BASELINES_DIR = Path(__file__).parent / 'baselines'
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10
+SUITES = ('micro', 'use_cases', 'endpoints')
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # Prepara o cenário e retorna a função medida (síncrona ou assíncrona)
+    setup: Callable[[], Any]
+    number: int
+    repeat: int = DEFAULT_REPEAT
+
+    @property
+    def suite(self) -> str:
+        return self.name.split('.', 1)[0]
+
+
+@dataclass
+class BenchmarkResult:
+    number: int
+    repeat: int
+    median_us: float
+    min_us: float
+    max_us: float
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_us / self.baseline_us
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+registry: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, number: int, repeat: int = DEFAULT_REPEAT):
+    """
+    Registra a função decorada como o setup de um benchmark
+    """
+
+    def register(setup: Callable[[], Any]) -> Callable[[], Any]:
+        registry[name] = Benchmark(name, setup, number, repeat)
+        return setup
+
+    return register
+
+
+async def _call_setup(bench: Benchmark) -> Callable[[], Any]:
+    target = bench.setup()
+    if inspect.isawaitable(target):
+        target = await target
+    return target
+
+
+async def measure(bench: Benchmark) -> BenchmarkResult:
+    target = await _call_setup(bench)
+    is_async = inspect.isawaitable(first := target())
+    if is_async:
+        await first
+
+    rounds = []
+    for _ in range(bench.repeat):
+        start = time.perf_counter()
+        if is_async:
+            for _ in range(bench.number):
+                await target()
+        else:
+            for _ in range(bench.number):
+                target()
+        rounds.append((time.perf_counter() - start) / bench.number * 1e6)
+
+    return BenchmarkResult(
+        number=bench.number,
+        repeat=bench.repeat,
+        median_us=statistics.median(rounds),
+        min_us=min(rounds),
+        max_us=max(rounds),
+    )
+
+
+def select(
+    suites: Optional[list[str]] = None, keyword: Optional[str] = None
+) -> list[Benchmark]:
+    selected = [
+        bench
+        for bench in registry.values()
+        if (not suites or bench.suite in suites)
+        and (not keyword or keyword in bench.name)
+    ]
+    return sorted(selected, key=lambda bench: SUITES.index(bench.suite))
+
+
+async def run(
+    benchmarks: list[Benchmark],
+    report: Callable[[str, BenchmarkResult], None] = lambda *_: None,
+) -> dict[str, BenchmarkResult]:
+    results = {}
+    for bench in benchmarks:
+        results[bench.name] = await measure(bench)
+        report(bench.name, results[bench.name])
+    return results
+
+
+def run_sync(
+    benchmarks: list[Benchmark],
+    report: Callable[[str, BenchmarkResult], None] = lambda *_: None,
+) -> dict[str, BenchmarkResult]:
+    return asyncio.run(run(benchmarks, report))
+
+
+def resolve_path(name_or_path: str) -> Path:
+    """
+    Aceita um caminho para um JSON ou apenas o nome de um baseline salvo
+    em benchmarks/baselines
+    """
+    path = Path(name_or_path)
+    if path.suffix == '.json' or len(path.parts) > 1:
+        return path
+    return BASELINES_DIR / f'{name_or_path}.json'
+
+
+def save(results: dict[str, BenchmarkResult], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+        },
+        'results': {name: asdict(result) for name, result in results.items()},
+    }
+    path.write_text(json.dumps(payload, indent=2) + '\n', encoding='utf-8')
+
+
+def load(path: Path) -> dict[str, BenchmarkResult]:
+    payload = json.loads(path.read_text(encoding='utf-8'))
+    return {
+        name: BenchmarkResult(**result)
+        for name, result in payload['results'].items()
+    }
+
+
+def compare(
+    baseline: dict[str, BenchmarkResult],
+    current: dict[str, BenchmarkResult],
+) -> list[Comparison]:
+    return [
+        Comparison(
+            name=name,
+            baseline_us=baseline[name].median_us,
+            current_us=current[name].median_us,
+        )
+        for name in sorted(baseline.keys() & current.keys())
+    ]
@@ -0,0 +1,29 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.domain.entities.user import User
+from app.infrastructure.repositories.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+
+
+async def seeded_repository(
+    total: int, password_hash: str = 'hash'
+) -> tuple[InMemoryUserRepository, list[User]]:
+    """
+    Repositório em memória com `total` usuários, em ordem de criação
+    """
+    repository = InMemoryUserRepository()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    users = await repository.create_many([
+        User(
+            id=uuid4(),
+            name=f'Usuário {i}',
+            email=f'usuario{i}@example.com',
+            password=password_hash,
+            created_at=start + timedelta(seconds=i),
+            updated_at=start + timedelta(seconds=i),
+        )
+        for i in range(total)
+    ])
+    return repository, users
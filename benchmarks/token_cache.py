@@ -0,0 +1,47 @@
+"""
+Microbenchmark da verificação de um bearer token: decode completo
+(assinatura HS512 + TokenPayload) vs. consulta ao VerifiedTokenCache.
+
+Uso:
+    python -m benchmarks.token_cache
+"""
+
+import timeit
+from uuid import uuid4
+
+from app.infrastructure.cache.token_cache import VerifiedTokenCache
+from app.infrastructure.config.settings import settings
+from app.infrastructure.security.jwt import (
+    create_access_token,
+    decode_access_token,
+)
+
+NUMBER = 10_000
+REPEAT = 5
+
+
+def best_per_call(fn, number: int = NUMBER, repeat: int = REPEAT) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    token = create_access_token(str(uuid4()))
+    cache = VerifiedTokenCache(
+        max_size=settings.JWT_VERIFIED_CACHE_MAX_SIZE,
+        ttl=settings.JWT_EXPIRATION * 60,
+    )
+    cache.set(token, decode_access_token(token))
+
+    decode = best_per_call(lambda: decode_access_token(token))
+    cached = best_per_call(lambda: cache.get(token))
+
+    print(f'decode_access_token: {decode * 1e6:8.2f} µs/call')
+    print(f'VerifiedTokenCache:  {cached * 1e6:8.2f} µs/call')
+    print(
+        f'savings:             {(decode - cached) * 1e6:8.2f} µs/request '
+        f'({decode / cached:.1f}x)'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""
+Benchmarks de UseCase.execute contra o InMemoryUserRepository. O hash de
+senha continua passando pelo password_hasher real.
+"""
+
+from itertools import count
+
+from app.constants import CountMode
+from app.domain.repositories.user_repository import UserCursor
+from app.infrastructure.cache.token_cache import VerifiedTokenCache
+from app.infrastructure.cache.user_cache import AuthenticatedUserCache
+from app.infrastructure.repositories.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+from app.infrastructure.security.jwt import create_access_token
+from app.infrastructure.security.password import get_password_hash
+from app.use_cases.auth.login_user import LoginUserInput, LoginUserUseCase
+from app.use_cases.auth.verify_token import (
+    VerifyTokenInput,
+    VerifyTokenUseCase,
+)
+from app.use_cases.user.create_user import CreateUserInput, CreateUserUseCase
+from app.use_cases.user.create_users_bulk import (
+    CreateUsersBulkInput,
+    CreateUsersBulkUseCase,
+)
+from app.use_cases.user.export_users import (
+    ExportUsersInput,
+    ExportUsersUseCase,
+)
+from app.use_cases.user.get_user import GetUserInput, GetUserUseCase
+from app.use_cases.user.list_users import ListUsersInput, ListUsersUseCase
+from app.use_cases.user.list_users_by_cursor import (
+    ListUsersByCursorInput,
+    ListUsersByCursorUseCase,
+)
+from benchmarks.micro import PASSWORD
+from benchmarks.runner import benchmark
+from benchmarks.seed import seeded_repository
+
+USERS = 10_000
+PAGE_SIZE = 100
+BULK_SIZE = 8
+
+
+@benchmark('use_cases.create_user', number=3, repeat=3)
+def create_user():
+    use_case = CreateUserUseCase(InMemoryUserRepository())
+    sequence = count()
+
+    def execute():
+        i = next(sequence)
+        return use_case.execute(
+            CreateUserInput(
+                name='Maria Silva',
+                email=f'maria{i}@example.com',
+                password=PASSWORD,
+            )
+        )
+
+    return execute
+
+
+@benchmark('use_cases.create_users_bulk', number=1, repeat=3)
+def create_users_bulk():
+    use_case = CreateUsersBulkUseCase(InMemoryUserRepository())
+    sequence = count()
+
+    def execute():
+        batch = next(sequence)
+        return use_case.execute(
+            CreateUsersBulkInput(
+                users=[
+                    CreateUserInput(
+                        name='Maria Silva',
+                        email=f'maria{batch}.{i}@example.com',
+                        password=PASSWORD,
+                    )
+                    for i in range(BULK_SIZE)
+                ]
+            )
+        )
+
+    return execute
+
+
+@benchmark('use_cases.get_user', number=10_000)
+async def get_user():
+    repository, users = await seeded_repository(USERS)
+    use_case = GetUserUseCase(repository)
+    input_data = GetUserInput(user_id=users[USERS // 2].id)
+    return lambda: use_case.execute(input_data)
+
+
+@benchmark('use_cases.list_users', number=1_000)
+async def list_users():
+    repository, _ = await seeded_repository(USERS)
+    use_case = ListUsersUseCase(repository)
+    input_data = ListUsersInput(
+        page=10, page_size=PAGE_SIZE, count_mode=CountMode.EXACT
+    )
+    return lambda: use_case.execute(input_data)
+
+
+@benchmark('use_cases.list_users_by_cursor', number=200)
+async def list_users_by_cursor():
+    repository, users = await seeded_repository(USERS)
+    use_case = ListUsersByCursorUseCase(repository)
+    input_data = ListUsersByCursorInput(
+        page_size=PAGE_SIZE,
+        cursor=UserCursor.from_user(users[USERS // 2]),
+    )
+    return lambda: use_case.execute(input_data)
+
+
+@benchmark('use_cases.export_users', number=5)
+async def export_users():
+    repository, _ = await seeded_repository(USERS)
+    use_case = ExportUsersUseCase(repository)
+
+    async def execute():
+        data = await use_case.execute(ExportUsersInput())
+        async for _ in data.users:
+            pass
+
+    return execute
+
+
+@benchmark('use_cases.login_user', number=3, repeat=3)
+async def login_user():
+    repository, users = await seeded_repository(1, get_password_hash(PASSWORD))
+    use_case = LoginUserUseCase(repository)
+    input_data = LoginUserInput(email=users[0].email, password=PASSWORD)
+    return lambda: use_case.execute(input_data)
+
+
+@benchmark('use_cases.verify_token', number=10_000)
+async def verify_token():
+    repository, users = await seeded_repository(1)
+    use_case = VerifyTokenUseCase(
+        repository,
+        user_cache=AuthenticatedUserCache(max_size=100, ttl=60),
+        token_cache=VerifiedTokenCache(max_size=100, ttl=60),
+    )
+    input_data = VerifyTokenInput(token=create_access_token(str(users[0].id)))
+    return lambda: use_case.execute(input_data)
+
+
+@benchmark('use_cases.verify_token_uncached', number=5_000)
+async def verify_token_uncached():
+    repository, users = await seeded_repository(1)
+    # ttl=0: nada é guardado, toda chamada decodifica e consulta o repositório
+    use_case = VerifyTokenUseCase(
+        repository,
+        user_cache=AuthenticatedUserCache(max_size=100, ttl=0),
+        token_cache=VerifiedTokenCache(max_size=100, ttl=0),
+    )
+    input_data = VerifyTokenInput(token=create_access_token(str(users[0].id)))
+    return lambda: use_case.execute(input_data)
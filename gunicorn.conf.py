@@ -0,0 +1,26 @@
+"""
+Configuração do gunicorn, carregada automaticamente a partir do diretório
+de trabalho. Prepara o modo multiprocesso do prometheus_client: cada worker
+grava as métricas em PROMETHEUS_MULTIPROC_DIR e o /metrics soma todos eles.
+"""
+
+import os
+import shutil
+
+# Precisa estar definida antes do primeiro import do prometheus_client, que
+# escolhe o armazenamento dos valores nesse momento
+prometheus_dir = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus-multiproc'
+)
+
+from prometheus_client import multiprocess  # noqa: E402
+
+
+def on_starting(server):
+    # Arquivos de uma execução anterior somariam valores antigos
+    shutil.rmtree(prometheus_dir, ignore_errors=True)
+    os.makedirs(prometheus_dir)
+
+
+def child_exit(server, worker):
+    multiprocess.mark_process_dead(worker.pid)
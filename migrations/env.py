@@ -24,6 +24,14 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = entities.SQLModel.metadata
 
+# Índices criados só nas migrações, porque dependem de extensões do Postgres
+# (pg_trgm) que o metadata não cria
+MIGRATION_ONLY_INDEXES = {'ix_tb_users_name_trgm', 'ix_tb_users_email_trgm'}
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    return not (type_ == 'index' and name in MIGRATION_ONLY_INDEXES)
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -48,6 +56,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -59,6 +68,7 @@ def do_run_migrations(connection: Connection) -> None:
         connection=connection,
         target_metadata=target_metadata,
         compare_type=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
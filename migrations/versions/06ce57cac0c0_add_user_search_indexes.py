@@ -0,0 +1,66 @@
+"""add user search indexes
+
+Revision ID: 06ce57cac0c0
+Revises: ecd3398967fa
+Create Date: 2026-10-18 14:12:19.116175
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '06ce57cac0c0'
+down_revision: Union[str, None] = 'ecd3398967fa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Índices de prefixo, para lower(...) LIKE 'x%'
+PATTERN_INDEXES = {
+    'ix_tb_users_lower_name_pattern': 'lower(name) text_pattern_ops',
+    'ix_tb_users_lower_email_pattern': 'lower(email) text_pattern_ops',
+}
+# Índices de trigramas, para ILIKE '%x%'
+TRIGRAM_INDEXES = {
+    'ix_tb_users_name_trgm': 'name',
+    'ix_tb_users_email_trgm': 'email',
+}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Os índices GIN de trigramas são os mais lentos de construir; com
+    # CONCURRENTLY os quatro índices de busca são criados sem bloquear os
+    # cadastros em tb_users. Se um deles falhar, fica INVALID e precisa ser
+    # removido antes de rodar a migração de novo.
+    with op.get_context().autocommit_block():
+        for name, expression in PATTERN_INDEXES.items():
+            op.create_index(
+                name,
+                'tb_users',
+                [sa.text(expression)],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+        for name, column in TRIGRAM_INDEXES.items():
+            op.create_index(
+                name,
+                'tb_users',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in (*TRIGRAM_INDEXES, *PATTERN_INDEXES):
+            op.drop_index(
+                name, table_name='tb_users', postgresql_concurrently=True
+            )
@@ -0,0 +1,41 @@
+"""add created_at id index
+
+Revision ID: a218788f555d
+Revises: b4d2e3210ead
+Create Date: 2026-10-18 09:12:41.503117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a218788f555d'
+down_revision: Union[str, None] = 'b4d2e3210ead'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # O índice (created_at, id) percorre tb_users inteira; com CONCURRENTLY
+    # cadastros e trocas de senha seguem durante a criação. Não roda dentro
+    # de uma transação, daí o autocommit_block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tb_users_created_at_id',
+            'tb_users',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tb_users_created_at_id',
+            table_name='tb_users',
+            postgresql_concurrently=True,
+        )
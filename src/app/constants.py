@@ -25,3 +25,40 @@ class Environment(StrEnum):
     @property
     def is_deployed(self) -> bool:
         return self in {self.STAGING, self.PRODUCTION}  # pragma: no cover
+
+
+class PasswordHasherPool(StrEnum):
+    THREAD = 'thread'
+    PROCESS = 'process'
+
+
+class CountMode(StrEnum):
+    EXACT = 'exact'
+    ESTIMATED = 'estimated'
+    NONE = 'none'
+
+
+class PaginationMode(StrEnum):
+    OFFSET = 'offset'
+    CURSOR = 'cursor'
+
+
+class ExportFormat(StrEnum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
+class UserRepositoryBackend(StrEnum):
+    POSTGRES = 'postgres'
+    MEMORY = 'memory'
+
+
+class TracingExporter(StrEnum):
+    NONE = 'none'
+    MEMORY = 'memory'
+    FILE = 'file'
+
+
+class LoginThrottleBackend(StrEnum):
+    MEMORY = 'memory'
+    POSTGRES = 'postgres'
@@ -1,5 +1,15 @@
 from sqlmodel import SQLModel
 
-from .user import User
+from .cache_version import CacheVersion
+from .login_throttle import LoginThrottleWindow
+from .refresh_token import RefreshToken
+from .user import User, UserReadModel
 
-__all__ = ['SQLModel', 'User']
+__all__ = [
+    'SQLModel',
+    'CacheVersion',
+    'LoginThrottleWindow',
+    'RefreshToken',
+    'User',
+    'UserReadModel',
+]
@@ -0,0 +1,14 @@
+from sqlalchemy import BigInteger
+from sqlmodel import Field, SQLModel
+
+
+class CacheVersion(SQLModel, table=True):
+    """
+    Versão de um conjunto de dados em cache, incrementada a cada escrita e
+    lida por todos os workers e instâncias
+    """
+
+    __tablename__ = 'tb_cache_versions'
+
+    name: str = Field(max_length=64, primary_key=True)
+    version: int = Field(default=0, sa_type=BigInteger, nullable=False)
@@ -0,0 +1,15 @@
+from sqlalchemy import BigInteger
+from sqlmodel import Field, SQLModel
+
+
+class LoginThrottleWindow(SQLModel, table=True):
+    """
+    Tentativas de login de uma chave (email ou IP) em uma janela fixa de
+    tempo, usadas pelo limite compartilhado entre os workers
+    """
+
+    __tablename__ = 'tb_login_throttle'
+
+    key: str = Field(max_length=320, primary_key=True)
+    window_index: int = Field(sa_type=BigInteger, primary_key=True)
+    hits: int = Field(default=0, nullable=False)
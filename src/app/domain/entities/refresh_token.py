@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import DateTime, text
+from sqlmodel import Field, SQLModel
+
+
+class RefreshToken(SQLModel, table=True):
+    """
+    Refresh token emitido no login. Só o hash (sha256) do token é gravado.
+    Todos os tokens gerados a partir de um mesmo login compartilham o
+    family_id, que permite revogar a cadeia inteira se um token já usado
+    reaparecer.
+    """
+
+    __tablename__ = 'tb_refresh_tokens'
+
+    id: Optional[UUID] = Field(
+        default=None,
+        primary_key=True,
+        sa_column_kwargs={'server_default': text('gen_random_uuid()')},
+    )
+    user_id: UUID = Field(
+        foreign_key='tb_users.id', ondelete='CASCADE', index=True
+    )
+    family_id: UUID = Field(index=True, nullable=False)
+    token_hash: str = Field(max_length=64, unique=True, nullable=False)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(ZoneInfo('UTC')),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={'server_default': text('current_timestamp(6)')},
+    )
+    expires_at: datetime = Field(
+        nullable=False, sa_type=DateTime(timezone=True)
+    )
+    revoked_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True)
+    )
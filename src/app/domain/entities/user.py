@@ -1,14 +1,30 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import text
+from sqlalchemy import Index, func, literal_column, text
 from sqlmodel import Field, SQLModel
 
 
 class User(SQLModel, table=True):
     __tablename__ = 'tb_users'
+    __table_args__ = (
+        Index('ix_tb_users_created_at_id', 'created_at', 'id'),
+        # Busca por prefixo (lower(...) LIKE 'x%'). Os índices de trigramas
+        # da busca por trecho ficam só na migração, pois exigem o pg_trgm.
+        Index(
+            'ix_tb_users_lower_name_pattern',
+            func.lower(literal_column('name')).label('lower_name'),
+            postgresql_ops={'lower_name': 'text_pattern_ops'},
+        ),
+        Index(
+            'ix_tb_users_lower_email_pattern',
+            func.lower(literal_column('email')).label('lower_email'),
+            postgresql_ops={'lower_email': 'text_pattern_ops'},
+        ),
+    )
 
     id: Optional[UUID] = Field(
         default=None,
@@ -30,3 +46,17 @@ class User(SQLModel, table=True):
         nullable=False,
         sa_column_kwargs={'server_default': text('current_timestamp(6)')},
     )
+
+
+@dataclass(frozen=True, slots=True)
+class UserReadModel:
+    """
+    Projeção somente leitura do usuário, sem a senha, usada nas consultas
+    que só alimentam respostas
+    """
+
+    id: UUID
+    name: str
+    email: str
+    created_at: datetime
+    updated_at: datetime
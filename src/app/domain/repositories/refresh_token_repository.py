@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.domain.entities.refresh_token import RefreshToken
+
+
+class RefreshTokenRepository(ABC):
+    @abstractmethod
+    async def create(self, token: RefreshToken) -> RefreshToken:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def rotate(
+        self, token_hash: str, new_token_hash: str, expires_at: datetime
+    ) -> Optional[RefreshToken]:
+        """
+        Revoga o token se ele ainda estiver ativo e, na mesma operação, cria
+        o seu substituto na mesma família. Retorna o novo token, ou None se
+        o token não existe, expirou ou já foi usado.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def find_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def revoke_family(self, family_id: UUID) -> None:
+        pass  # pragma: no cover
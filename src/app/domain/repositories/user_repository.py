@@ -1,23 +1,122 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from app.domain.entities.user import User
+from app.domain.entities.user import User, UserReadModel
+
+# Termos mais curtos não formam um trigrama: a busca fica só por prefixo
+SEARCH_MIN_SUBSTRING_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class UserCursor:
+    created_at: datetime
+    id: UUID
+
+    @classmethod
+    def from_user(cls, user: User | UserReadModel) -> 'UserCursor':
+        return cls(created_at=user.created_at, id=user.id)
+
+
+@dataclass(frozen=True)
+class UserVersion:
+    """
+    Só o necessário para validar um ETag, sem carregar o usuário inteiro
+    """
+
+    id: UUID
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User | UserReadModel) -> 'UserVersion':
+        return cls(id=user.id, updated_at=user.updated_at)
 
 
 class UserRepository(ABC):
     @abstractmethod
-    async def create(self, user: User) -> User:
+    async def create(self, user: User) -> Optional[User]:
+        """
+        Insere o usuário e retorna None se o email já estiver cadastrado
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def create_many(self, users: list[User]) -> list[User]:
+        """
+        Insere os usuários em lote, ignorando os que já existem por email
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def update_password(self, user_id: UUID, password: str) -> None:
+        """
+        Substitui o hash da senha do usuário
+        """
         pass  # pragma: no cover
 
     @abstractmethod
     async def find_by_email(self, email: str) -> Optional[User]:
+        """
+        Retorna a entidade completa, com o hash da senha, para o login
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def find_by_emails(self, emails: list[str]) -> list[User]:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def find_by_id(self, user_id: UUID) -> Optional[UserReadModel]:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def find_by_ids(self, user_ids: list[UUID]) -> list[UserReadModel]:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def find_version(self, user_id: UUID) -> Optional[UserVersion]:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def index(self, page: int, page_size: int) -> list[UserReadModel]:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def index_versions(
+        self, page: int, page_size: int
+    ) -> list[UserVersion]:
+        """
+        Versões dos usuários da mesma página retornada por index
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def count(self, estimated: bool = False) -> int:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def index_by_cursor(
+        self,
+        limit: int,
+        cursor: Optional[UserCursor] = None,
+        backwards: bool = False,
+    ) -> list[UserReadModel]:
         pass  # pragma: no cover
 
     @abstractmethod
-    async def find_by_id(self, user_id: UUID) -> Optional[User]:
+    async def search(self, query: str, limit: int) -> list[UserReadModel]:
+        """
+        Busca por nome ou email, sem diferenciar maiúsculas: por prefixo ou,
+        a partir de SEARCH_MIN_SUBSTRING_LENGTH caracteres, por trecho.
+        Ordena pela relevância: email igual ao termo, email começando com
+        ele, nome começando com ele, alguma palavra do nome começando com
+        ele e, por último, o termo no meio do texto.
+        """
         pass  # pragma: no cover
 
     @abstractmethod
-    async def index(self, page: int, page_size: int) -> list[User]:
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[UserReadModel]:
         pass  # pragma: no cover
@@ -0,0 +1,45 @@
+import hashlib
+import time
+from typing import Optional
+
+from app.infrastructure.cache.ttl_cache import CacheStats, TTLCache
+from app.infrastructure.config.settings import settings
+from app.infrastructure.security.jwt import TokenPayload
+
+
+class VerifiedTokenCache:
+    """
+    Cache dos tokens cuja assinatura já foi verificada. As entradas são
+    indexadas pelo digest do token e expiram junto com o próprio token.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._cache: TTLCache[bytes, TokenPayload] = TTLCache(
+            max_size, ttl, name='verified_token'
+        )
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, token: str) -> Optional[TokenPayload]:
+        return self._cache.get(self._key(token))
+
+    def set(self, token: str, payload: TokenPayload) -> None:
+        remaining = payload.exp.timestamp() - time.time()
+        self._cache.set(
+            self._key(token), payload, ttl=min(remaining, self._cache.ttl)
+        )
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+verified_token_cache = VerifiedTokenCache(
+    max_size=settings.JWT_VERIFIED_CACHE_MAX_SIZE,
+    ttl=settings.JWT_EXPIRATION * 60,
+)
@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Hashable, Optional, TypeVar
+
+from app.infrastructure.metrics.prometheus import cache_lookups
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / lookups
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Cache LRU em memória, limitado por tamanho e com expiração por entrada.
+    Não é compartilhado entre processos: cada worker mantém o seu. Com um
+    `name`, hits e misses também vão para a métrica cache_lookups_total.
+    """
+
+    def __init__(self, max_size: int, ttl: float, name: Optional[str] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.name = name
+        self.stats = CacheStats()
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._hits = self._misses = None
+        if name is not None:
+            self._hits = cache_lookups.labels(name, 'hit')
+            self._misses = cache_lookups.labels(name, 'miss')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._miss()
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._miss()
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        if self._hits is not None:
+            self._hits.inc()
+        return value
+
+    def _miss(self) -> None:
+        self.stats.misses += 1
+        if self._misses is not None:
+            self._misses.inc()
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,47 @@
+from typing import Optional
+from uuid import UUID
+
+from app.domain.entities.user import User, UserReadModel
+from app.infrastructure.cache.ttl_cache import CacheStats, TTLCache
+from app.infrastructure.config.settings import settings
+
+
+class AuthenticatedUserCache:
+    """
+    Cache por worker dos usuários carregados na autenticação, evitando uma
+    consulta ao banco a cada requisição protegida. Alterações feitas em
+    outros workers só são vistas após o TTL.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._cache: TTLCache[UUID, UserReadModel] = TTLCache(
+            max_size, ttl, name='authenticated_user'
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, user_id: UUID) -> Optional[UserReadModel]:
+        return self._cache.get(user_id)
+
+    def set(self, user: UserReadModel) -> None:
+        self._cache.set(user.id, user)
+
+    def on_user_created(self, user: User) -> None:
+        self._cache.delete(user.id)
+
+    def on_user_updated(self, user: User) -> None:
+        self._cache.delete(user.id)
+
+    def on_user_deleted(self, user_id: UUID) -> None:
+        self._cache.delete(user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+authenticated_user_cache = AuthenticatedUserCache(
+    max_size=settings.AUTH_USER_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL,
+)
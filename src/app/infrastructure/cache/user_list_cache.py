@@ -0,0 +1,216 @@
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Hashable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.constants import UserRepositoryBackend
+from app.domain.entities.cache_version import CacheVersion
+from app.domain.entities.user import User
+from app.infrastructure.cache.ttl_cache import CacheStats, TTLCache
+from app.infrastructure.config.database import engine
+from app.infrastructure.config.settings import settings
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    """
+    Página de GET /users/ já serializada, com os seus validadores HTTP
+    """
+
+    body: bytes
+    etag: str
+    last_modified: Optional[datetime]
+
+
+class VersionStore(ABC):
+    @abstractmethod
+    async def current(self) -> int:
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def bump(self) -> None:
+        pass  # pragma: no cover
+
+    def changed_recently(self) -> bool:  # noqa: PLR6301
+        """
+        Se a versão mudou há pouco, quando uma réplica ainda pode não ter a
+        escrita que a mudou
+        """
+        return False
+
+
+class InMemoryVersionStore(VersionStore):
+    """
+    Versão do próprio processo, para o repositório em memória, em que cada
+    worker também tem os seus próprios usuários
+    """
+
+    def __init__(self):
+        self.version = 0
+
+    async def current(self) -> int:
+        return self.version
+
+    async def bump(self) -> None:
+        self.version += 1
+
+
+class PostgresVersionStore(VersionStore):
+    """
+    Versão em tb_cache_versions, compartilhada entre workers e instâncias.
+    Lida no primário, já que uma réplica atrasada devolveria uma versão
+    antiga, e guardada no worker por `ttl` segundos: um acerto no cache não
+    vai ao banco, e uma escrita em outro worker aparece em até `ttl`.
+
+    Por `read_after_write_window` segundos depois de ver a versão mudar,
+    `changed_recently` avisa que as réplicas podem ainda não ter a escrita.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        name: str = 'users',
+        ttl: float = 0,
+        read_after_write_window: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.engine = engine
+        self.name = name
+        self.ttl = ttl
+        self.read_after_write_window = read_after_write_window
+        self.clock = clock
+        self._version: Optional[int] = None
+        self._read_at = 0.0
+        self._changed_at: Optional[float] = None
+
+    async def current(self) -> int:
+        now = self.clock()
+        if self._version is None or now - self._read_at >= self.ttl:
+            stmt = select(CacheVersion.version).where(
+                CacheVersion.name == self.name
+            )
+            async with self.engine.connect() as conn:
+                version = (await conn.execute(stmt)).scalar_one_or_none()
+            self._observe(version or 0, now)
+        return self._version
+
+    async def bump(self) -> None:
+        stmt = (
+            insert(CacheVersion)
+            .values(name=self.name, version=1)
+            .on_conflict_do_update(
+                index_elements=['name'],
+                set_={'version': CacheVersion.version + 1},
+            )
+            .returning(CacheVersion.version)
+        )
+        async with self.engine.begin() as conn:
+            version = (await conn.execute(stmt)).scalar_one()
+        # O worker que escreveu passa a usar a versão nova na hora
+        self._observe(version, self.clock())
+
+    def changed_recently(self) -> bool:
+        return (
+            self._changed_at is not None
+            and self.clock() - self._changed_at < self.read_after_write_window
+        )
+
+    def _observe(self, version: int, now: float) -> None:
+        # A versão só cresce: uma leitura concorrente mais lenta que um bump
+        # não pode voltar para a anterior
+        if self._version is not None and version > self._version:
+            self._changed_at = now
+        if self._version is None or version > self._version:
+            self._version = version
+        self._read_at = now
+
+
+class UserListCache:
+    """
+    Cache por worker das páginas da listagem de usuários. Toda chave inclui
+    a versão da tabela de usuários, incrementada depois de cada escrita e
+    compartilhada entre os workers: depois dela as páginas antigas não são
+    mais encontradas em nenhum worker e saem pelo LRU.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        versions: Optional[VersionStore] = None,
+    ):
+        self._cache: TTLCache[tuple, CachedPage] = TTLCache(
+            max_size, ttl, name='user_list'
+        )
+        self.versions = versions or InMemoryVersionStore()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.max_size > 0 and self._cache.ttl > 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    async def key(self, *parts: Hashable) -> tuple:
+        """
+        Chave da página na versão atual. Deve ser obtida antes da consulta,
+        para que uma escrita concorrente não grave dados antigos na versão
+        nova.
+        """
+        return (await self.versions.current(), *parts)
+
+    def get(self, key: tuple) -> Optional[CachedPage]:
+        return self._cache.get(key)
+
+    def set(self, key: tuple, page: CachedPage) -> None:
+        # Logo depois de uma escrita a página pode ter vindo de uma réplica
+        # atrasada: guardá-la na versão nova serviria dados antigos até o TTL
+        if self.versions.changed_recently():
+            return
+        self._cache.set(key, page)
+
+    async def invalidate(self) -> None:
+        """
+        Muda a versão. Deve rodar depois do commit da escrita, senão outro
+        worker pode gravar a página antiga já na versão nova.
+        """
+        await self.versions.bump()
+
+    async def on_user_created(self, user: User) -> None:
+        await self.invalidate()
+
+    async def on_user_updated(self, user: User) -> None:
+        await self.invalidate()
+
+    async def on_user_deleted(self, user_id: UUID) -> None:
+        await self.invalidate()
+
+
+def _build_version_store() -> VersionStore:
+    if settings.USER_REPOSITORY_BACKEND == UserRepositoryBackend.MEMORY:
+        return InMemoryVersionStore()
+    return PostgresVersionStore(
+        engine,
+        ttl=settings.USER_LIST_CACHE_VERSION_TTL,
+        # Sem réplicas toda leitura vai ao primário e já vê a escrita
+        read_after_write_window=(
+            settings.DB_READ_AFTER_WRITE_WINDOW
+            if settings.DATABASE_REPLICA_URLS
+            else 0
+        ),
+    )
+
+
+user_list_cache = UserListCache(
+    max_size=settings.USER_LIST_CACHE_MAX_SIZE,
+    ttl=settings.USER_LIST_CACHE_TTL,
+    versions=_build_version_store(),
+)
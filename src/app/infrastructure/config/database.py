@@ -1,23 +1,102 @@
 from collections.abc import AsyncIterator
+from itertools import count
 
+from fastapi import Depends
 from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.constants import DB_NAMING_CONVENTION, Environment
 from app.infrastructure.config.settings import settings
+from app.infrastructure.metrics.database import (
+    instrument_engine,
+    instrumented_pool_class,
+)
 
 metadata = MetaData(naming_convention=DB_NAMING_CONVENTION)
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.ENVIRONMENT == Environment.LOCAL,
-    future=True,
+
+
+def _create_engine(url: str, database: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        echo=settings.ENVIRONMENT == Environment.LOCAL
+        if settings.DB_ECHO is None
+        else settings.DB_ECHO,
+        future=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        poolclass=instrumented_pool_class(database),
+    )
+    instrument_engine(engine, database, settings.DB_POOL_SIZE)
+    return engine
+
+
+engine = _create_engine(settings.DATABASE_URL, 'primary')
+async_session = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
 )
 
+replica_engines = [
+    _create_engine(url, f'replica_{i}')
+    for i, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+replica_sessions = [
+    async_sessionmaker(replica, class_=AsyncSession, expire_on_commit=False)
+    for replica in replica_engines
+]
+_replica_counter = count()
+
 
 async def get_session() -> AsyncIterator[AsyncSession]:
-    async_session = async_sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
     async with async_session() as session:
         yield session
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Sessionmaker do primário, para quem precisa abrir sessões próprias fora
+    da sessão da requisição
+    """
+    return async_session
+
+
+def get_read_sessionmaker(
+    sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Próxima réplica do round-robin, ou o primário se não houver réplicas
+    """
+    if not replica_sessions:
+        return sessionmaker
+    return replica_sessions[next(_replica_counter) % len(replica_sessions)]
+
+
+async def get_read_session(
+    session: AsyncSession = Depends(get_session),
+    sessionmaker: async_sessionmaker[AsyncSession] = Depends(
+        get_read_sessionmaker
+    ),
+) -> AsyncIterator[AsyncSession]:
+    """
+    Sessão somente leitura em uma das réplicas, em round-robin. Sem réplicas
+    configuradas é a própria sessão do primário.
+    """
+    if not replica_sessions:
+        yield session
+        return
+
+    async with sessionmaker() as read_session:
+        yield read_session
+
+
+async def dispose_engines() -> None:
+    await engine.dispose()
+    for replica in replica_engines:
+        await replica.dispose()
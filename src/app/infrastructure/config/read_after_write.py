@@ -0,0 +1,72 @@
+"""
+Leituras no primário logo depois das escritas do próprio cliente.
+
+Uma réplica pode levar alguns instantes para receber uma escrita. O
+ReadAfterWriteMiddleware lê do cookie `last_write` o instante da última
+escrita do cliente e abre um WriteTracker em uma ContextVar; enquanto essa
+escrita tiver menos de DB_READ_AFTER_WRITE_WINDOW segundos, as leituras da
+requisição vão ao primário. Uma requisição que escreve renova o cookie. As
+requisições dos outros clientes continuam indo às réplicas.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from app.infrastructure.config.settings import settings
+
+COOKIE_NAME = 'last_write'
+
+
+@dataclass
+class WriteTracker:
+    # Instante (time.time) da última escrita do cliente: o cookie passa por
+    # workers e instâncias diferentes, então não pode ser time.monotonic
+    last_write_at: Optional[float] = None
+    wrote: bool = False
+
+    def mark_written(self) -> None:
+        self.wrote = True
+        self.last_write_at = time.time()
+
+    def written_recently(self) -> bool:
+        if self.last_write_at is None:
+            return False
+        # Um instante no futuro é um cookie forjado: é ignorado
+        elapsed = time.time() - self.last_write_at
+        return 0 <= elapsed < settings.DB_READ_AFTER_WRITE_WINDOW
+
+
+_current: ContextVar[Optional[WriteTracker]] = ContextVar(
+    'write_tracker', default=None
+)
+
+
+@contextmanager
+def track_writes(
+    last_write_at: Optional[float] = None,
+) -> Iterator[WriteTracker]:
+    tracker = WriteTracker(last_write_at)
+    token = _current.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current.reset(token)
+
+
+def mark_written() -> None:
+    tracker = _current.get()
+    if tracker is not None:
+        tracker.mark_written()
+
+
+def written_recently() -> bool:
+    """
+    Se o cliente da requisição atual escreveu há menos de
+    DB_READ_AFTER_WRITE_WINDOW segundos
+    """
+    tracker = _current.get()
+    return tracker is not None and tracker.written_recently()
@@ -1,6 +1,15 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Annotated, Optional
 
-from app.constants import Environment
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+from app.constants import (
+    Environment,
+    LoginThrottleBackend,
+    PasswordHasherPool,
+    TracingExporter,
+    UserRepositoryBackend,
+)
 
 
 class Settings(BaseSettings):
@@ -13,10 +22,52 @@ class Settings(BaseSettings):
 
     ENVIRONMENT: Environment = Environment.LOCAL
     DATABASE_URL: str
+    DATABASE_REPLICA_URLS: Annotated[list[str], NoDecode] = []
+    DB_READ_AFTER_WRITE_WINDOW: float = 5
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_ECHO: Optional[bool] = None
+    DB_QUERY_HEADERS: Optional[bool] = None
+    DB_SLOW_QUERY_THRESHOLD: float = 0.2
+    USER_REPOSITORY_BACKEND: UserRepositoryBackend = (
+        UserRepositoryBackend.POSTGRES
+    )
     API_PREFIX: str = '/v1'
     JWT_SECRET: str
     JWT_EXPIRATION: int = 60
+    REFRESH_TOKEN_EXPIRATION_DAYS: int = 30
     JWT_ALGORITHM: str = 'HS512'
+    JWT_VERIFIED_CACHE_MAX_SIZE: int = 10_000
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65_536
+    ARGON2_PARALLELISM: int = 4
+    PASSWORD_HASHER_POOL: PasswordHasherPool = PasswordHasherPool.THREAD
+    PASSWORD_HASHER_WORKERS: int = 4
+    PASSWORD_HASHER_MAX_PENDING: int = 32
+    USERS_COUNT_ESTIMATE_TTL: int = 60
+    USERS_COUNT_EXACT_THRESHOLD: int = 10_000
+    AUTH_USER_CACHE_TTL: int = 30
+    AUTH_USER_CACHE_MAX_SIZE: int = 10_000
+    USER_LIST_CACHE_TTL: int = 5
+    USER_LIST_CACHE_MAX_SIZE: int = 1_000
+    USER_LIST_CACHE_VERSION_TTL: float = 1
+    LOGIN_THROTTLE_BACKEND: LoginThrottleBackend = LoginThrottleBackend.MEMORY
+    LOGIN_THROTTLE_WINDOW: int = 60
+    LOGIN_THROTTLE_EMAIL_LIMIT: int = 5
+    LOGIN_THROTTLE_IP_LIMIT: int = 30
+    SERVER_TIMING: Optional[bool] = None
+    TRACING_EXPORTER: TracingExporter = TracingExporter.NONE
+    TRACING_FILE: str = 'traces.jsonl'
+
+    @field_validator('DATABASE_REPLICA_URLS', mode='before')
+    @classmethod
+    def split_replica_urls(cls, value):
+        if isinstance(value, str):
+            return [url.strip() for url in value.split(',') if url.strip()]
+        return value
 
 
 settings: Settings = Settings()
@@ -2,18 +2,37 @@ from http import HTTPStatus
 
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.domain.entities.user import User
+from app.constants import UserRepositoryBackend
+from app.domain.entities.user import UserReadModel
+from app.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
 from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.config.database import get_session
 from app.infrastructure.config.settings import settings
 from app.infrastructure.dependencies.user_dependencies import (
-    get_user_repository,
+    get_primary_user_repository,
+)
+from app.infrastructure.repositories.in_memory_refresh_token_repository import (  # noqa: E501
+    InMemoryRefreshTokenRepository,
+)
+from app.infrastructure.repositories.sqlmodel_refresh_token_repository import (  # noqa: E501
+    SqlModelRefreshTokenRepository,
+)
+from app.infrastructure.security.login_throttle import (
+    LoginThrottle,
+    login_throttle,
 )
 from app.use_cases.auth.verify_token import (
     VerifyTokenInput,
     VerifyTokenUseCase,
 )
 
+# Usado com USER_REPOSITORY_BACKEND=memory, um por worker
+in_memory_refresh_token_repository = InMemoryRefreshTokenRepository()
+
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f'{settings.API_PREFIX}/auth/login'
 )
@@ -21,8 +40,8 @@ oauth2_scheme = OAuth2PasswordBearer(
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    user_repository: UserRepository = Depends(get_user_repository),
-) -> User:
+    user_repository: UserRepository = Depends(get_primary_user_repository),
+) -> UserReadModel:
     use_case = VerifyTokenUseCase(user_repository)
     result = await use_case.execute(VerifyTokenInput(token=token))
 
@@ -34,3 +53,15 @@ async def get_current_user(
         )
 
     return result.user
+
+
+def get_login_throttle() -> LoginThrottle:
+    return login_throttle  # pragma: no cover
+
+
+def get_refresh_token_repository(
+    session: AsyncSession = Depends(get_session),
+) -> RefreshTokenRepository:
+    if settings.USER_REPOSITORY_BACKEND == UserRepositoryBackend.MEMORY:
+        return in_memory_refresh_token_repository  # pragma: no cover
+    return SqlModelRefreshTokenRepository(session)  # pragma: no cover
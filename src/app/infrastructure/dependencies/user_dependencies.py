@@ -1,34 +1,141 @@
+from typing import Optional
+
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.infrastructure.config.database import get_session
+from app.constants import UserRepositoryBackend
+from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.cache.user_list_cache import (
+    UserListCache,
+    user_list_cache,
+)
+from app.infrastructure.config.database import (
+    get_read_session,
+    get_read_sessionmaker,
+    get_session,
+    get_sessionmaker,
+)
+from app.infrastructure.config.read_after_write import written_recently
+from app.infrastructure.config.settings import settings
+from app.infrastructure.repositories.coalescing_user_repository import (
+    CoalescingUserRepository,
+    user_by_id_loader_for,
+)
+from app.infrastructure.repositories.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
 from app.infrastructure.repositories.sqlmodel_user_repository import (
     SqlModelUserRepository,
 )
 from app.use_cases.user.create_user import CreateUserUseCase
+from app.use_cases.user.create_users_bulk import CreateUsersBulkUseCase
+from app.use_cases.user.export_users import ExportUsersUseCase
 from app.use_cases.user.get_user import GetUserUseCase
+from app.use_cases.user.get_user_version import GetUserVersionUseCase
 from app.use_cases.user.list_users import ListUsersUseCase
+from app.use_cases.user.list_users_by_cursor import ListUsersByCursorUseCase
+from app.use_cases.user.list_users_version import ListUsersVersionUseCase
+from app.use_cases.user.search_users import SearchUsersUseCase
+
+# Usado com USER_REPOSITORY_BACKEND=memory, um por worker
+in_memory_user_repository = InMemoryUserRepository()
 
 
 def get_user_repository(
     session: AsyncSession = Depends(get_session),
-) -> SqlModelUserRepository:
-    return SqlModelUserRepository(session)  # pragma: no cover
+    read_session: AsyncSession = Depends(get_read_session),
+    sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
+    read_sessionmaker: async_sessionmaker[AsyncSession] = Depends(
+        get_read_sessionmaker
+    ),
+) -> UserRepository:
+    if settings.USER_REPOSITORY_BACKEND == UserRepositoryBackend.MEMORY:
+        return in_memory_user_repository  # pragma: no cover
+    # Logo depois de uma escrita do cliente a réplica pode ainda não ter o
+    # usuário
+    if written_recently():
+        read_sessionmaker = sessionmaker  # pragma: no cover
+    return CoalescingUserRepository(  # pragma: no cover
+        SqlModelUserRepository(session, read_session),
+        user_by_id_loader_for(read_sessionmaker),
+    )
+
+
+def get_primary_user_repository(
+    session: AsyncSession = Depends(get_session),
+    sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
+) -> UserRepository:
+    """
+    Repositório que lê só do primário, para a autenticação: um usuário
+    recém-criado precisa ser encontrado mesmo com a réplica atrasada
+    """
+    if settings.USER_REPOSITORY_BACKEND == UserRepositoryBackend.MEMORY:
+        return in_memory_user_repository  # pragma: no cover
+    return CoalescingUserRepository(  # pragma: no cover
+        SqlModelUserRepository(session), user_by_id_loader_for(sessionmaker)
+    )
+
+
+def get_user_list_cache() -> Optional[UserListCache]:
+    if not user_list_cache.enabled:
+        return None  # pragma: no cover
+    return user_list_cache  # pragma: no cover
 
 
 def get_create_user_use_case(
-    user_repository: SqlModelUserRepository = Depends(get_user_repository),
+    user_repository: UserRepository = Depends(get_user_repository),
+    list_cache: Optional[UserListCache] = Depends(get_user_list_cache),
 ) -> CreateUserUseCase:
-    return CreateUserUseCase(user_repository)  # pragma: no cover
+    return CreateUserUseCase(user_repository, list_cache)  # pragma: no cover
+
+
+def get_create_users_bulk_use_case(
+    user_repository: UserRepository = Depends(get_user_repository),
+    list_cache: Optional[UserListCache] = Depends(get_user_list_cache),
+) -> CreateUsersBulkUseCase:
+    return CreateUsersBulkUseCase(  # pragma: no cover
+        user_repository, list_cache
+    )
 
 
 def get_get_user_use_case(
-    user_repository: SqlModelUserRepository = Depends(get_user_repository),
+    user_repository: UserRepository = Depends(get_user_repository),
 ) -> GetUserUseCase:
     return GetUserUseCase(user_repository)  # pragma: no cover
 
 
+def get_get_user_version_use_case(
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> GetUserVersionUseCase:
+    return GetUserVersionUseCase(user_repository)  # pragma: no cover
+
+
 def get_list_users_use_case(
-    user_repository: SqlModelUserRepository = Depends(get_user_repository),
+    user_repository: UserRepository = Depends(get_user_repository),
 ) -> ListUsersUseCase:
     return ListUsersUseCase(user_repository)  # pragma: no cover
+
+
+def get_list_users_version_use_case(
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> ListUsersVersionUseCase:
+    return ListUsersVersionUseCase(user_repository)  # pragma: no cover
+
+
+def get_list_users_by_cursor_use_case(
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> ListUsersByCursorUseCase:
+    return ListUsersByCursorUseCase(user_repository)  # pragma: no cover
+
+
+def get_search_users_use_case(
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> SearchUsersUseCase:
+    return SearchUsersUseCase(user_repository)  # pragma: no cover
+
+
+def get_export_users_use_case(
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> ExportUsersUseCase:
+    return ExportUsersUseCase(user_repository)  # pragma: no cover
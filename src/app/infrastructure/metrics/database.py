@@ -0,0 +1,83 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.infrastructure.metrics.prometheus import (
+    db_pool_checked_out,
+    db_pool_checkout_wait,
+    db_pool_overflow,
+    db_query_duration,
+)
+from app.infrastructure.metrics.query_stats import record_query
+
+STATEMENTS = frozenset({'SELECT', 'INSERT', 'UPDATE', 'DELETE'})
+
+
+def statement_type(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement else ''
+    return keyword if keyword in STATEMENTS else 'OTHER'
+
+
+def instrumented_pool_class(database: str) -> type[AsyncAdaptedQueuePool]:
+    """
+    Pool que mede quanto tempo cada checkout esperou por uma conexão livre
+    (ou pela abertura de uma nova)
+    """
+
+    class InstrumentedPool(AsyncAdaptedQueuePool):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                db_pool_checkout_wait.labels(database).observe(
+                    time.perf_counter() - start
+                )
+
+    return InstrumentedPool
+
+
+def instrument_engine(
+    engine: AsyncEngine, database: str, pool_size: int
+) -> None:
+    """
+    Registra a duração das queries, por engine e por requisição, e as
+    conexões em uso do engine
+    """
+    sync_engine = engine.sync_engine
+    # Contagem própria: pool.checkedout() ainda inclui a conexão durante o
+    # evento de checkin
+    checked_out = 0
+
+    def publish():
+        db_pool_checked_out.labels(database).set(checked_out)
+        db_pool_overflow.labels(database).set(max(0, checked_out - pool_size))
+
+    @event.listens_for(sync_engine, 'checkout')
+    def on_checkout(*_):
+        nonlocal checked_out
+        checked_out += 1
+        publish()
+
+    @event.listens_for(sync_engine, 'checkin')
+    def on_checkin(*_):
+        nonlocal checked_out
+        checked_out -= 1
+        publish()
+
+    @event.listens_for(sync_engine, 'before_cursor_execute', named=True)
+    def before_execute(context, **_):
+        if context is not None:
+            context._query_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, 'after_cursor_execute', named=True)
+    def after_execute(statement, parameters, context, **_):
+        start = getattr(context, '_query_start', None)
+        if start is not None:
+            elapsed = time.perf_counter() - start
+            db_query_duration.labels(
+                database, statement_type(statement)
+            ).observe(elapsed)
+            record_query(statement, parameters, elapsed)
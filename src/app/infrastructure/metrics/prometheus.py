@@ -0,0 +1,85 @@
+"""
+Métricas no formato do Prometheus.
+
+Com a variável PROMETHEUS_MULTIPROC_DIR definida (gunicorn.conf.py faz isso)
+cada worker grava os valores em arquivos nesse diretório, e o /metrics
+agrega todos os workers, não só o que atendeu a requisição.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Buckets em segundos, ajustados para cada tipo de operação
+HTTP_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1, 2.5, 5, 10,
+)  # fmt: skip
+QUERY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5,
+)  # fmt: skip
+HASH_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2.5, 5, 10)
+
+http_request_duration = Histogram(
+    'http_request_duration_seconds',
+    'Duração das requisições HTTP por rota e status',
+    ['method', 'route', 'status'],
+    buckets=HTTP_BUCKETS,
+)
+
+db_query_duration = Histogram(
+    'db_query_duration_seconds',
+    'Duração das queries SQL por banco e tipo de comando',
+    ['database', 'statement'],
+    buckets=QUERY_BUCKETS,
+)
+db_pool_checked_out = Gauge(
+    'db_pool_checked_out_connections',
+    'Conexões do pool em uso',
+    ['database'],
+    multiprocess_mode='livesum',
+)
+db_pool_overflow = Gauge(
+    'db_pool_overflow_connections',
+    'Conexões em uso além de DB_POOL_SIZE',
+    ['database'],
+    multiprocess_mode='livesum',
+)
+db_pool_checkout_wait = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Tempo para obter uma conexão do pool',
+    ['database'],
+    buckets=QUERY_BUCKETS,
+)
+
+password_hash_duration = Histogram(
+    'password_hash_duration_seconds',
+    'Duração do hash e da verificação de senhas, incluindo a fila do pool',
+    ['operation'],
+    buckets=HASH_BUCKETS,
+)
+
+cache_lookups = Counter(
+    'cache_lookups',
+    'Consultas aos caches em memória, por cache e resultado (hit ou miss)',
+    ['cache', 'result'],
+)
+
+
+def latest_metrics() -> tuple[bytes, str]:
+    """
+    Serializa as métricas, agregando os workers no modo multiprocesso
+    """
+    registry = REGISTRY
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,115 @@
+"""
+Contagem de queries e tempo de banco por requisição.
+
+O QueryStats ativo fica em uma ContextVar. Cada query executada soma no
+QueryStats ativo e nos que o envolvem, de modo que um `assert_max_queries`
+em volta de uma requisição inteira também enxerga as queries contadas pelo
+middleware.
+"""
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Quantidade de parâmetros descritos no log antes de resumir o restante
+MAX_SHAPE_ITEMS = 10
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    seconds: float = 0.0
+    statements: list[str] = field(default_factory=list)
+    scope: Optional[dict] = None
+    parent: Optional['QueryStats'] = None
+
+    @property
+    def route(self) -> Optional[str]:
+        if self.scope is None:
+            return None
+        route = self.scope.get('route')
+        return getattr(route, 'path_format', self.scope.get('path'))
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar(
+    'query_stats', default=None
+)
+
+
+@contextmanager
+def track_queries(scope: Optional[dict] = None) -> Iterator[QueryStats]:
+    stats = QueryStats(scope=scope, parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def parameters_shape(parameters: Any) -> str:
+    """
+    Descreve os parâmetros pelos nomes e tipos, sem expor os valores
+    """
+    if isinstance(parameters, dict):
+        items = [
+            f'{key}: {type(value).__name__}'
+            for key, value in list(parameters.items())[:MAX_SHAPE_ITEMS]
+        ]
+        if len(parameters) > MAX_SHAPE_ITEMS:
+            items.append(f'+{len(parameters) - MAX_SHAPE_ITEMS}')
+        return '{' + ', '.join(items) + '}'
+
+    if isinstance(parameters, (list, tuple)):
+        # executemany: uma lista de conjuntos de parâmetros
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f'{len(parameters)} x {parameters_shape(parameters[0])}'
+        items = [type(value).__name__ for value in parameters]
+        return '(' + ', '.join(items) + ')'
+
+    return type(parameters).__name__
+
+
+def record_query(statement: str, parameters: Any, seconds: float) -> None:
+    stats = _current.get()
+    route = None
+    while stats is not None:
+        stats.queries += 1
+        stats.seconds += seconds
+        stats.statements.append(statement)
+        route = route or stats.route
+        stats = stats.parent
+
+    if seconds >= settings.DB_SLOW_QUERY_THRESHOLD:
+        logger.warning(
+            'Query lenta (%.1f ms) em %s: %s | parâmetros: %s',
+            seconds * 1e3,
+            route or '-',
+            ' '.join(statement.split()),
+            parameters_shape(parameters),
+        )
+
+
+@contextmanager
+def assert_max_queries(budget: int) -> Iterator[QueryStats]:
+    """
+    Falha se o bloco executar mais de `budget` queries:
+
+        with assert_max_queries(2):
+            await client.get(f'/v1/users/{user_id}/')
+    """
+    with track_queries() as stats:
+        yield stats
+
+    if stats.queries > budget:
+        executed = '\n'.join(f'  {sql}' for sql in stats.statements)
+        raise AssertionError(
+            f'{stats.queries} queries executadas, o limite é {budget}:\n'
+            f'{executed}'
+        )
@@ -0,0 +1,198 @@
+import asyncio
+import contextvars
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.domain.entities.user import User, UserReadModel
+from app.domain.repositories.user_repository import (
+    UserCursor,
+    UserRepository,
+    UserVersion,
+)
+from app.infrastructure.repositories.sqlmodel_user_repository import (
+    SqlModelUserRepository,
+)
+from app.infrastructure.tracing.tracer import traced
+
+
+@dataclass
+class CoalescingStats:
+    lookups: int = 0
+    queries: int = 0
+    # Buscas que encontraram uma consulta em andamento para o mesmo id
+    coalesced: int = 0
+    # Buscas por ids diferentes que entraram no mesmo WHERE id IN (...)
+    batched: int = 0
+
+    @property
+    def queries_saved(self) -> int:
+        return self.lookups - self.queries
+
+
+class UserByIdLoader:
+    """
+    Agrupa as buscas por id feitas no mesmo worker: buscas concorrentes pelo
+    mesmo id compartilham a consulta em andamento e as feitas na mesma volta
+    do event loop viram um único WHERE id IN (...).
+    """
+
+    def __init__(
+        self, fetch: Callable[[list[UUID]], Awaitable[list[UserReadModel]]]
+    ):
+        self.fetch = fetch
+        self.stats = CoalescingStats()
+        self._in_flight: dict[
+            UUID, asyncio.Future[Optional[UserReadModel]]
+        ] = {}
+        self._queued: list[UUID] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, user_id: UUID) -> Optional[UserReadModel]:
+        self.stats.lookups += 1
+
+        future = self._in_flight.get(user_id)
+        if future is not None:
+            self.stats.coalesced += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._in_flight[user_id] = future
+            if not self._queued:
+                loop.call_soon(self._dispatch, context=contextvars.Context())
+            else:
+                self.stats.batched += 1
+            self._queued.append(user_id)
+
+        # O cancelamento de quem espera não cancela a busca dos demais
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        user_ids, self._queued = self._queued, []
+        self.stats.queries += 1
+        # O lote atende várias requisições: roda em um contexto vazio, para
+        # que a query e os spans não sejam atribuídos a quem abriu o lote
+        task = asyncio.get_running_loop().create_task(
+            self._load_batch(user_ids), context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, user_ids: list[UUID]) -> None:
+        futures = [self._in_flight[user_id] for user_id in user_ids]
+        try:
+            users = {user.id: user for user in await self.fetch(user_ids)}
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for user_id, future in zip(user_ids, futures):
+                if not future.done():
+                    future.set_result(users.get(user_id))
+        finally:
+            for user_id, future in zip(user_ids, futures):
+                # Cancelado no meio da consulta: quem espera também é cancelado
+                future.cancel()
+                self._in_flight.pop(user_id, None)
+
+
+class CoalescingUserRepository(UserRepository):
+    """
+    Repositório que delega tudo ao repositório envolvido, exceto find_by_id,
+    que passa pelo UserByIdLoader do worker. Depois de uma escrita as buscas
+    voltam a ir direto ao repositório envolvido.
+    """
+
+    def __init__(
+        self, user_repository: UserRepository, loader: UserByIdLoader
+    ):
+        self.user_repository = user_repository
+        self.loader = loader
+        self._has_written = False
+
+    async def create(self, user: User) -> Optional[User]:
+        self._has_written = True
+        return await self.user_repository.create(user)
+
+    async def create_many(self, users: list[User]) -> list[User]:
+        self._has_written = True
+        return await self.user_repository.create_many(users)
+
+    async def update_password(self, user_id: UUID, password: str) -> None:
+        self._has_written = True
+        await self.user_repository.update_password(user_id, password)
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        return await self.user_repository.find_by_email(email)
+
+    async def find_by_emails(self, emails: list[str]) -> list[User]:
+        return await self.user_repository.find_by_emails(emails)
+
+    @traced('CoalescingUserRepository.find_by_id', layer='repository')
+    async def find_by_id(self, user_id: UUID) -> Optional[UserReadModel]:
+        if self._has_written:
+            return await self.user_repository.find_by_id(user_id)
+        return await self.loader.load(user_id)
+
+    async def find_version(self, user_id: UUID) -> Optional[UserVersion]:
+        return await self.user_repository.find_version(user_id)
+
+    async def find_by_ids(self, user_ids: list[UUID]) -> list[UserReadModel]:
+        return await self.user_repository.find_by_ids(user_ids)
+
+    async def index(self, page: int, page_size: int) -> list[UserReadModel]:
+        return await self.user_repository.index(page, page_size)
+
+    async def index_versions(
+        self, page: int, page_size: int
+    ) -> list[UserVersion]:
+        return await self.user_repository.index_versions(page, page_size)
+
+    async def count(self, estimated: bool = False) -> int:
+        return await self.user_repository.count(estimated)
+
+    async def index_by_cursor(
+        self,
+        limit: int,
+        cursor: Optional[UserCursor] = None,
+        backwards: bool = False,
+    ) -> list[UserReadModel]:
+        return await self.user_repository.index_by_cursor(
+            limit, cursor, backwards
+        )
+
+    async def search(self, query: str, limit: int) -> list[UserReadModel]:
+        return await self.user_repository.search(query, limit)
+
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[UserReadModel]:
+        return self.user_repository.stream(batch_size)
+
+
+async def _find_users_by_ids(
+    sessionmaker: async_sessionmaker[AsyncSession], user_ids: list[UUID]
+) -> list[UserReadModel]:
+    # A consulta agrupada atende várias requisições, então usa sessão própria
+    async with sessionmaker() as session:
+        return await SqlModelUserRepository(session).find_by_ids(user_ids)
+
+
+# Um loader por sessionmaker (primário e cada réplica), um conjunto por worker
+_user_by_id_loaders: dict[
+    async_sessionmaker[AsyncSession], UserByIdLoader
+] = {}
+
+
+def user_by_id_loader_for(
+    sessionmaker: async_sessionmaker[AsyncSession],
+) -> UserByIdLoader:
+    loader = _user_by_id_loaders.get(sessionmaker)
+    if loader is None:
+        loader = UserByIdLoader(partial(_find_users_by_ids, sessionmaker))
+        _user_by_id_loaders[sessionmaker] = loader
+    return loader
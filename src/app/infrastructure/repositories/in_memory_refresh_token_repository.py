@@ -0,0 +1,94 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID, uuid4
+from zoneinfo import ZoneInfo
+
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+from app.infrastructure.cache.ttl_cache import TTLCache
+from app.infrastructure.tracing.tracer import trace_methods
+
+
+def _now() -> datetime:
+    return datetime.now(ZoneInfo('UTC'))
+
+
+@trace_methods(layer='repository')
+class InMemoryRefreshTokenRepository(RefreshTokenRepository):
+    """
+    Refresh tokens na memória do worker, indexados pelo hash. Usado com
+    USER_REPOSITORY_BACKEND=memory.
+
+    Os tokens ativos ficam em ordem de criação: cada inserção descarta os
+    mais antigos já expirados e, acima de `max_tokens`, os mais antigos.
+    Um token revogado sai dos ativos e fica só até expirar, limitado ao
+    mesmo tamanho, para que o seu reuso ainda revogue a família.
+    """
+
+    def __init__(self, max_tokens: int = 100_000):
+        self.max_tokens = max_tokens
+        self._by_hash: dict[str, RefreshToken] = {}
+        self._revoked: TTLCache[str, RefreshToken] = TTLCache(
+            max_tokens, ttl=0
+        )
+
+    async def create(self, token: RefreshToken) -> RefreshToken:
+        if token.id is None:
+            token.id = uuid4()
+        self._by_hash[token.token_hash] = token
+        self._prune(_now())
+        return token
+
+    async def rotate(
+        self, token_hash: str, new_token_hash: str, expires_at: datetime
+    ) -> Optional[RefreshToken]:
+        token = self._by_hash.get(token_hash)
+        now = _now()
+        if token is None or token.expires_at <= now:
+            return None
+
+        self._revoke(token, now)
+        return await self.create(
+            RefreshToken(
+                user_id=token.user_id,
+                family_id=token.family_id,
+                token_hash=new_token_hash,
+                expires_at=expires_at,
+            )
+        )
+
+    async def find_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        return self._by_hash.get(token_hash) or self._revoked.get(token_hash)
+
+    async def revoke_family(self, family_id: UUID) -> None:
+        now = _now()
+        family = [
+            token
+            for token in self._by_hash.values()
+            if token.family_id == family_id
+        ]
+        for token in family:
+            self._revoke(token, now)
+
+    def _revoke(self, token: RefreshToken, now: datetime) -> None:
+        token.revoked_at = now
+        del self._by_hash[token.token_hash]
+        self._revoked.set(
+            token.token_hash,
+            token,
+            ttl=(token.expires_at - now).total_seconds(),
+        )
+
+    def _prune(self, now: datetime) -> None:
+        # Com a mesma validade para todos, os primeiros da ordem de criação
+        # são os primeiros a expirar
+        while self._by_hash:
+            oldest = next(iter(self._by_hash.values()))
+            if (
+                oldest.expires_at > now
+                and len(self._by_hash) <= self.max_tokens
+            ):
+                break
+            del self._by_hash[oldest.token_hash]
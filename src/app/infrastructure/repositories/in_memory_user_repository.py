@@ -0,0 +1,178 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Optional
+from uuid import UUID, uuid4
+from zoneinfo import ZoneInfo
+
+from app.domain.entities.user import User, UserReadModel
+from app.domain.repositories.user_repository import (
+    SEARCH_MIN_SUBSTRING_LENGTH,
+    UserCursor,
+    UserRepository,
+    UserVersion,
+)
+from app.infrastructure.tracing.tracer import trace_methods
+
+
+def _sort_key(user: User) -> tuple[datetime, UUID]:
+    return user.created_at, user.id
+
+
+def _read_model(user: User) -> UserReadModel:
+    return UserReadModel(
+        id=user.id,
+        name=user.name,
+        email=user.email,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
+def _relevance(user: User, term: str) -> Optional[int]:
+    """
+    Mesma ordem de relevância da busca no banco; None se não casa
+    """
+    name, email = user.name.lower(), user.email.lower()
+    substring = len(term) >= SEARCH_MIN_SUBSTRING_LENGTH
+    matches = (
+        email == term,
+        email.startswith(term),
+        name.startswith(term),
+        substring and f' {term}' in name,
+        substring and (term in name or term in email),
+    )
+    return next(
+        (rank for rank, matched in enumerate(matches) if matched), None
+    )
+
+
+@trace_methods(layer='repository')
+class InMemoryUserRepository(UserRepository):
+    """
+    Repositório em memória, indexado por id, por email (exato, como o
+    unique do banco) e por (created_at, id), a mesma ordem do índice do
+    banco.
+    Nenhum método suspende a execução, então as operações são atômicas
+    dentro do event loop. Os dados não são compartilhados entre processos.
+    """
+
+    def __init__(self):
+        self._by_id: dict[UUID, User] = {}
+        self._by_email: dict[str, User] = {}
+        self._ordered: list[User] = []
+
+    def __len__(self) -> int:
+        return len(self._ordered)
+
+    def _insert(self, user: User) -> Optional[User]:
+        if user.email in self._by_email:
+            return None
+        if user.id is None:
+            user.id = uuid4()
+
+        self._by_id[user.id] = user
+        self._by_email[user.email] = user
+        insort(self._ordered, user, key=_sort_key)
+        return user
+
+    async def create(self, user: User) -> Optional[User]:
+        return self._insert(user)
+
+    async def create_many(self, users: list[User]) -> list[User]:
+        return [created for user in users if (created := self._insert(user))]
+
+    async def update_password(self, user_id: UUID, password: str) -> None:
+        user = self._by_id.get(user_id)
+        if user is not None:
+            user.password = password
+            user.updated_at = datetime.now(ZoneInfo('UTC'))
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        return self._by_email.get(email)
+
+    async def find_by_emails(self, emails: list[str]) -> list[User]:
+        found = {}
+        for email in emails:
+            user = self._by_email.get(email)
+            if user is not None:
+                found[user.id] = user
+        return list(found.values())
+
+    async def find_by_id(self, user_id: UUID) -> Optional[UserReadModel]:
+        user = self._by_id.get(user_id)
+        return _read_model(user) if user else None
+
+    async def find_version(self, user_id: UUID) -> Optional[UserVersion]:
+        user = self._by_id.get(user_id)
+        return UserVersion.from_user(user) if user else None
+
+    async def find_by_ids(self, user_ids: list[UUID]) -> list[UserReadModel]:
+        return [
+            _read_model(self._by_id[user_id])
+            for user_id in dict.fromkeys(user_ids)
+            if user_id in self._by_id
+        ]
+
+    async def index(self, page: int, page_size: int) -> list[UserReadModel]:
+        start = (page - 1) * page_size
+        return [
+            _read_model(user)
+            for user in self._ordered[start : start + page_size]
+        ]
+
+    async def index_versions(
+        self, page: int, page_size: int
+    ) -> list[UserVersion]:
+        start = (page - 1) * page_size
+        return [
+            UserVersion.from_user(user)
+            for user in self._ordered[start : start + page_size]
+        ]
+
+    async def count(self, estimated: bool = False) -> int:
+        return len(self._ordered)
+
+    async def index_by_cursor(
+        self,
+        limit: int,
+        cursor: Optional[UserCursor] = None,
+        backwards: bool = False,
+    ) -> list[UserReadModel]:
+        if backwards:
+            end = len(self._ordered)
+            if cursor is not None:
+                end = bisect_left(
+                    self._ordered,
+                    (cursor.created_at, cursor.id),
+                    key=_sort_key,
+                )
+            users = self._ordered[max(end - limit, 0) : end]
+        else:
+            start = 0
+            if cursor is not None:
+                start = bisect_right(
+                    self._ordered,
+                    (cursor.created_at, cursor.id),
+                    key=_sort_key,
+                )
+            users = self._ordered[start : start + limit]
+
+        return [_read_model(user) for user in users]
+
+    async def search(self, query: str, limit: int) -> list[UserReadModel]:
+        term = query.strip().lower()
+        ranked = []
+        for user in self._ordered:
+            relevance = _relevance(user, term)
+            if relevance is not None:
+                ranked.append((relevance, len(user.name), user.name, user))
+        ranked.sort(key=lambda item: item[:3])
+        return [_read_model(item[3]) for item in ranked[:limit]]
+
+    async def stream(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[UserReadModel]:
+        # Cópia da lista: inserções durante o export não afetam a iteração
+        for user in list(self._ordered):
+            yield _read_model(user)
@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, func, literal, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+from app.infrastructure.tracing.tracer import trace_methods
+
+
+@trace_methods(layer='repository')
+class SqlModelRefreshTokenRepository(RefreshTokenRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, token: RefreshToken) -> RefreshToken:
+        stmt = (
+            insert(RefreshToken)
+            .values(**token.model_dump(exclude_none=True))
+            .returning(RefreshToken)
+        )
+        result = await self.session.exec(stmt)
+        created = result.scalar_one()
+        await self.session.commit()
+        return created
+
+    async def rotate(
+        self, token_hash: str, new_token_hash: str, expires_at: datetime
+    ) -> Optional[RefreshToken]:
+        # Um único comando: o UPDATE só revoga um token ativo e o INSERT só
+        # acontece se o UPDATE revogou alguma linha. Duas rotações
+        # concorrentes do mesmo token não geram dois substitutos.
+        consumed = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > func.now(),
+            )
+            .values(revoked_at=func.now())
+            .returning(RefreshToken.user_id, RefreshToken.family_id)
+            .cte('consumed')
+        )
+        stmt = (
+            insert(RefreshToken)
+            .from_select(
+                [
+                    'user_id',
+                    'family_id',
+                    'token_hash',
+                    'created_at',
+                    'expires_at',
+                ],
+                select(
+                    consumed.c.user_id,
+                    consumed.c.family_id,
+                    literal(new_token_hash),
+                    func.now(),
+                    literal(expires_at, DateTime(timezone=True)),
+                ),
+            )
+            .returning(RefreshToken)
+        )
+        result = await self.session.exec(stmt)
+        rotated = result.scalar_one_or_none()
+        await self.session.commit()
+        return rotated
+
+    async def find_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        # rotate e revoke_family alteram linhas sem passar pela sessão
+        stmt = (
+            select(RefreshToken)
+            .where(RefreshToken.token_hash == token_hash)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.exec(stmt)
+        return result.one_or_none()
+
+    async def revoke_family(self, family_id: UUID) -> None:
+        stmt = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.family_id == family_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=func.now())
+        )
+        await self.session.exec(stmt)
+        await self.session.commit()
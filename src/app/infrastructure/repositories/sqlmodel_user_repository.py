@@ -1,34 +1,267 @@
+import time
+from collections.abc import AsyncIterator
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import case, func, or_, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.domain.entities.user import User
-from app.domain.repositories.user_repository import UserRepository
+from app.domain.entities.user import User, UserReadModel
+from app.domain.repositories.user_repository import (
+    SEARCH_MIN_SUBSTRING_LENGTH,
+    UserCursor,
+    UserRepository,
+    UserVersion,
+)
+from app.infrastructure.config.read_after_write import (
+    mark_written,
+    written_recently,
+)
+from app.infrastructure.config.settings import settings
+from app.infrastructure.tracing.tracer import trace_methods
 
+# Colunas de UserReadModel, na mesma ordem dos campos
+READ_MODEL_COLUMNS = (
+    User.id,
+    User.name,
+    User.email,
+    User.created_at,
+    User.updated_at,
+)
 
+ESTIMATED_COUNT_QUERY = text(
+    'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)'
+)
+
+
+def escape_like(value: str) -> str:
+    """
+    Escapa os curingas do LIKE, para que o termo seja buscado literalmente
+    """
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+@trace_methods(layer='repository')
 class SqlModelUserRepository(UserRepository):
-    def __init__(self, session: AsyncSession):
+    # (estimativa, expira_em) compartilhado entre as requisições do worker
+    _estimated_count: Optional[tuple[int, float]] = None
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        read_session: Optional[AsyncSession] = None,
+    ):
         self.session = session
+        self._read_session = read_session or session
+        self._has_written = False
+
+    @property
+    def read_session(self) -> AsyncSession:
+        # Depois de uma escrita as leituras ficam no primário, para que a
+        # mesma requisição e as seguintes do cliente enxerguem o que acabou
+        # de gravar
+        if self._has_written or written_recently():
+            return self.session
+        return self._read_session
 
-    async def create(self, user: User) -> User:
-        self.session.add(user)
+    def _mark_written(self) -> None:
+        self._has_written = True
+        mark_written()
+
+    async def create(self, user: User) -> Optional[User]:
+        stmt = (
+            insert(User)
+            .values(**user.model_dump(exclude_none=True))
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        result = await self.session.exec(stmt)
+        created = result.scalar_one_or_none()
         await self.session.commit()
-        await self.session.refresh(user)
-        return user
+        self._mark_written()
+        return created
 
-    async def find_by_id(self, user_id: UUID) -> Optional[User]:
-        stmt = select(User).where(User.id == user_id)
+    async def create_many(self, users: list[User]) -> list[User]:
+        if not users:
+            return []
+
+        stmt = (
+            insert(User)
+            .values([user.model_dump(exclude_none=True) for user in users])
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
         result = await self.session.exec(stmt)
-        return result.one_or_none()
+        created = result.scalars().all()
+        await self.session.commit()
+        self._mark_written()
+        return created
+
+    async def update_password(self, user_id: UUID, password: str) -> None:
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(password=password, updated_at=func.now())
+        )
+        await self.session.exec(stmt)
+        await self.session.commit()
+        self._mark_written()
+
+    async def find_by_id(self, user_id: UUID) -> Optional[UserReadModel]:
+        stmt = select(*READ_MODEL_COLUMNS).where(User.id == user_id)
+        result = await self.read_session.exec(stmt)
+        row = result.mappings().one_or_none()
+        return UserReadModel(**row) if row else None
+
+    async def find_by_ids(self, user_ids: list[UUID]) -> list[UserReadModel]:
+        if not user_ids:
+            return []
+
+        stmt = select(*READ_MODEL_COLUMNS).where(User.id.in_(user_ids))
+        result = await self.read_session.exec(stmt)
+        return [UserReadModel(**row) for row in result.mappings()]
+
+    async def find_version(self, user_id: UUID) -> Optional[UserVersion]:
+        stmt = select(User.id, User.updated_at).where(User.id == user_id)
+        result = await self.read_session.exec(stmt)
+        row = result.mappings().one_or_none()
+        return UserVersion(**row) if row else None
 
     async def find_by_email(self, email: str) -> Optional[User]:
+        # Usado no login e nos cadastros: sempre no primário, para que um
+        # usuário recém-criado consiga entrar mesmo com a réplica atrasada
         stmt = select(User).where(User.email == email)
         result = await self.session.exec(stmt)
         return result.one_or_none()
 
-    async def index(self, page: int, page_size: int) -> list[User]:
-        stmt = select(User).offset((page - 1) * page_size).limit(page_size)
+    async def find_by_emails(self, emails: list[str]) -> list[User]:
+        if not emails:
+            return []
+
+        stmt = select(User).where(User.email.in_(emails))
         result = await self.session.exec(stmt)
         return result.all()
+
+    async def index(self, page: int, page_size: int) -> list[UserReadModel]:
+        stmt = (
+            select(*READ_MODEL_COLUMNS)
+            .order_by(User.created_at, User.id)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        result = await self.read_session.exec(stmt)
+        return [UserReadModel(**row) for row in result.mappings()]
+
+    async def index_versions(
+        self, page: int, page_size: int
+    ) -> list[UserVersion]:
+        stmt = (
+            select(User.id, User.updated_at)
+            .order_by(User.created_at, User.id)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        result = await self.read_session.exec(stmt)
+        return [UserVersion(**row) for row in result.mappings()]
+
+    async def index_by_cursor(
+        self,
+        limit: int,
+        cursor: Optional[UserCursor] = None,
+        backwards: bool = False,
+    ) -> list[UserReadModel]:
+        key = tuple_(User.created_at, User.id)
+        stmt = select(*READ_MODEL_COLUMNS).limit(limit)
+
+        if backwards:
+            stmt = stmt.order_by(User.created_at.desc(), User.id.desc())
+            if cursor is not None:
+                stmt = stmt.where(key < tuple_(cursor.created_at, cursor.id))
+        else:
+            stmt = stmt.order_by(User.created_at, User.id)
+            if cursor is not None:
+                stmt = stmt.where(key > tuple_(cursor.created_at, cursor.id))
+
+        result = await self.read_session.exec(stmt)
+        users = [UserReadModel(**row) for row in result.mappings()]
+        if backwards:
+            users.reverse()
+        return users
+
+    async def search(self, query: str, limit: int) -> list[UserReadModel]:
+        term = query.strip().lower()
+        escaped = escape_like(term)
+        name, email = func.lower(User.name), func.lower(User.email)
+
+        # lower(...) LIKE 'x%' usa os índices text_pattern_ops e ILIKE
+        # '%x%' usa os índices GIN de trigramas (gin_trgm_ops)
+        prefix = f'{escaped}%'
+        if len(term) < SEARCH_MIN_SUBSTRING_LENGTH:
+            condition = or_(name.like(prefix), email.like(prefix))
+        else:
+            condition = or_(
+                User.name.ilike(f'%{escaped}%'),
+                User.email.ilike(f'%{escaped}%'),
+            )
+
+        relevance = case(
+            (email == term, 0),
+            (email.like(prefix), 1),
+            (name.like(prefix), 2),
+            (name.like(f'% {escaped}%'), 3),
+            else_=4,
+        )
+        stmt = (
+            select(*READ_MODEL_COLUMNS)
+            .where(condition)
+            .order_by(relevance, func.length(User.name), User.name, User.id)
+            .limit(limit)
+        )
+        result = await self.read_session.exec(stmt)
+        return [UserReadModel(**row) for row in result.mappings()]
+
+    async def stream(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[UserReadModel]:
+        # O stream usa uma sessão própria porque a resposta continua sendo
+        # enviada depois que a sessão da requisição já foi fechada
+        stmt = (
+            select(*READ_MODEL_COLUMNS)
+            .order_by(User.created_at, User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async with AsyncSession(
+            self.read_session.bind, expire_on_commit=False
+        ) as session:
+            result = await session.stream(stmt)
+            async for row in result.mappings():
+                yield UserReadModel(**row)
+
+    async def count(self, estimated: bool = False) -> int:
+        if estimated:
+            estimate = await self._estimate_count()
+            # Tabelas pequenas (ou nunca analisadas) são contadas exatamente
+            if estimate >= settings.USERS_COUNT_EXACT_THRESHOLD:
+                return estimate
+
+        stmt = select(func.count()).select_from(User)
+        result = await self.read_session.exec(stmt)
+        return result.one()
+
+    async def _estimate_count(self) -> int:
+        cached = SqlModelUserRepository._estimated_count
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        result = await self.read_session.exec(
+            ESTIMATED_COUNT_QUERY, params={'table': User.__tablename__}
+        )
+        estimate = result.scalar_one_or_none() or -1
+
+        SqlModelUserRepository._estimated_count = (
+            estimate,
+            time.monotonic() + settings.USERS_COUNT_ESTIMATE_TTL,
+        )
+        return estimate
@@ -0,0 +1,132 @@
+"""
+Calibra os parâmetros do argon2 para a máquina atual.
+
+Mede o tempo de hash e sugere o maior ARGON2_TIME_COST que fica dentro da
+latência alvo. Se nem time_cost=1 cabe no alvo, reduz ARGON2_MEMORY_COST
+pela metade até caber (sem passar de MIN_MEMORY_COST).
+
+    python -m app.infrastructure.security.calibrate --target-ms 250
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.infrastructure.config.settings import settings
+
+PASSWORD = 'Calibr4cao!'
+# Mínimo recomendado pela OWASP para argon2id (19 MiB)
+MIN_MEMORY_COST = 19 * 1024
+MAX_TIME_COST = 20
+
+
+@dataclass
+class Argon2Parameters:
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    latency_ms: float
+
+
+def measure(
+    time_cost: int, memory_cost: int, parallelism: int, samples: int = 3
+) -> float:
+    """
+    Mediana, em ms, do tempo de um hash com os parâmetros informados
+    """
+    hasher = Argon2Hasher(
+        time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+    )
+    durations = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash(PASSWORD)
+        durations.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(durations)
+
+
+def calibrate(
+    target_ms: float,
+    memory_cost: int,
+    parallelism: int,
+    samples: int = 3,
+) -> Argon2Parameters:
+    latency = measure(1, memory_cost, parallelism, samples)
+    while latency > target_ms and memory_cost // 2 >= MIN_MEMORY_COST:
+        memory_cost //= 2
+        latency = measure(1, memory_cost, parallelism, samples)
+
+    time_cost = 1
+    while time_cost < MAX_TIME_COST:
+        next_latency = measure(
+            time_cost + 1, memory_cost, parallelism, samples
+        )
+        if next_latency > target_ms:
+            break
+        time_cost += 1
+        latency = next_latency
+
+    return Argon2Parameters(time_cost, memory_cost, parallelism, latency)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m app.infrastructure.security.calibrate'
+    )
+    parser.add_argument(
+        '--target-ms',
+        type=float,
+        default=250,
+        help='latência desejada para um hash',
+    )
+    parser.add_argument(
+        '--memory-cost',
+        type=int,
+        default=settings.ARGON2_MEMORY_COST,
+        help='memória inicial, em KiB',
+    )
+    parser.add_argument(
+        '--parallelism', type=int, default=settings.ARGON2_PARALLELISM
+    )
+    parser.add_argument('--samples', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    current = measure(
+        settings.ARGON2_TIME_COST,
+        settings.ARGON2_MEMORY_COST,
+        settings.ARGON2_PARALLELISM,
+        args.samples,
+    )
+    print(
+        f'Atual: time_cost={settings.ARGON2_TIME_COST} '
+        f'memory_cost={settings.ARGON2_MEMORY_COST} '
+        f'parallelism={settings.ARGON2_PARALLELISM} -> {current:.1f} ms'
+    )
+
+    suggested = calibrate(
+        args.target_ms, args.memory_cost, args.parallelism, args.samples
+    )
+    print(
+        f'Sugerido para {args.target_ms:.0f} ms: '
+        f'{suggested.latency_ms:.1f} ms por hash, '
+        f'~{1e3 / suggested.latency_ms:.1f} hashes/s por thread\n'
+    )
+    print(f'ARGON2_TIME_COST={suggested.time_cost}')
+    print(f'ARGON2_MEMORY_COST={suggested.memory_cost}')
+    print(f'ARGON2_PARALLELISM={suggested.parallelism}')
+
+    if suggested.latency_ms > args.target_ms:
+        print(
+            '\nNem o custo mínimo cabe no alvo: aumente --target-ms ou '
+            'reserve mais CPU para o hash de senhas',
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,6 +6,7 @@ from jwt import PyJWTError, decode, encode
 from pydantic import BaseModel
 
 from app.infrastructure.config.settings import settings
+from app.infrastructure.tracing.tracer import traced
 
 
 class TokenPayload(BaseModel):
@@ -13,6 +14,7 @@ class TokenPayload(BaseModel):
     exp: datetime
 
 
+@traced('jwt.encode', layer='security')
 def create_access_token(
     subject: str, expires_delta: Optional[timedelta] = None
 ) -> str:
@@ -31,6 +33,7 @@ def create_access_token(
     return encoded_jwt
 
 
+@traced('jwt.decode', layer='security')
 def decode_access_token(token: str):
     try:
         payload = decode(
@@ -0,0 +1,255 @@
+"""
+Limite de tentativas de login por email e por IP, com janela deslizante.
+
+Cada chave tem um contador por janela fixa de LOGIN_THROTTLE_WINDOW
+segundos. A estimativa da janela deslizante soma as tentativas da janela
+atual com as da anterior, ponderadas pela fração que ainda se sobrepõe:
+
+    anterior * (1 - decorrido / janela) + atual
+
+Tentativas bloqueadas também contam, então uma rajada contínua continua
+bloqueada. Um login bem-sucedido zera o contador do email e devolve a
+tentativa ao IP: no limite por IP só contam as falhas, senão os clientes
+atrás de um mesmo NAT ou proxy bloqueariam uns aos outros só por logar.
+"""
+
+import hashlib
+import math
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import aliased
+
+from app.constants import LoginThrottleBackend
+from app.domain.entities.login_throttle import LoginThrottleWindow
+from app.infrastructure.config.database import engine
+from app.infrastructure.config.settings import settings
+
+
+class ThrottleStore(ABC):
+    @abstractmethod
+    async def hit(self, key: str, window: int) -> tuple[int, int]:
+        """
+        Soma uma tentativa na janela `window` e retorna as tentativas dela e
+        da janela anterior
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def release(self, key: str, window: int) -> None:
+        """
+        Desconta uma tentativa da janela `window`, se houver
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        pass  # pragma: no cover
+
+
+class InMemoryThrottleStore(ThrottleStore):
+    """
+    Contadores do próprio processo: com vários workers cada um aplica o
+    limite separadamente
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # chave -> (janela, tentativas, tentativas da janela anterior)
+        self._windows: dict[str, tuple[int, int, int]] = {}
+
+    async def hit(self, key: str, window: int) -> tuple[int, int]:
+        current, hits, previous = self._windows.pop(key, (window, 0, 0))
+        if current != window:
+            previous = hits if current == window - 1 else 0
+            hits = 0
+        hits += 1
+        # Reinserida no fim: o dicionário fica ordenado pelo último acesso
+        self._windows[key] = (window, hits, previous)
+
+        if len(self._windows) > self.max_keys:
+            self._evict(window)
+        return hits, previous
+
+    async def release(self, key: str, window: int) -> None:
+        current, hits, previous = self._windows.get(key, (window, 0, 0))
+        if current == window and hits > 0:
+            self._windows[key] = (window, hits - 1, previous)
+
+    async def reset(self, key: str) -> None:
+        self._windows.pop(key, None)
+
+    def _evict(self, window: int) -> None:
+        stale = [
+            key
+            for key, (current, _, _) in self._windows.items()
+            if current < window - 1
+        ]
+        for key in stale:
+            del self._windows[key]
+        while len(self._windows) > self.max_keys:
+            del self._windows[next(iter(self._windows))]
+
+
+class PostgresThrottleStore(ThrottleStore):
+    """
+    Contadores em tb_login_throttle, compartilhados entre workers e
+    instâncias. Cada tentativa é um único INSERT ... ON CONFLICT.
+    """
+
+    def __init__(self, engine: AsyncEngine, cleanup_every: int = 1_000):
+        self.engine = engine
+        self.cleanup_every = cleanup_every
+        self._hits = 0
+
+    async def hit(self, key: str, window: int) -> tuple[int, int]:
+        previous = aliased(LoginThrottleWindow)
+        previous_hits = (
+            select(previous.hits)
+            .where(previous.key == key, previous.window_index == window - 1)
+            .scalar_subquery()
+        )
+        stmt = (
+            insert(LoginThrottleWindow)
+            .values(key=key, window_index=window, hits=1)
+            .on_conflict_do_update(
+                index_elements=['key', 'window_index'],
+                set_={'hits': LoginThrottleWindow.hits + 1},
+            )
+            .returning(
+                LoginThrottleWindow.hits, func.coalesce(previous_hits, 0)
+            )
+        )
+
+        async with self.engine.begin() as conn:
+            hits, previous_count = (await conn.execute(stmt)).one()
+
+            self._hits += 1
+            if self._hits % self.cleanup_every == 0:
+                await conn.execute(
+                    delete(LoginThrottleWindow).where(
+                        LoginThrottleWindow.window_index < window - 1
+                    )
+                )
+        return hits, previous_count
+
+    async def release(self, key: str, window: int) -> None:
+        stmt = (
+            update(LoginThrottleWindow)
+            .where(
+                LoginThrottleWindow.key == key,
+                LoginThrottleWindow.window_index == window,
+                LoginThrottleWindow.hits > 0,
+            )
+            .values(hits=LoginThrottleWindow.hits - 1)
+        )
+        async with self.engine.begin() as conn:
+            await conn.execute(stmt)
+
+    async def reset(self, key: str) -> None:
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                delete(LoginThrottleWindow).where(
+                    LoginThrottleWindow.key == key
+                )
+            )
+
+
+class LoginThrottle:
+    def __init__(
+        self,
+        store: ThrottleStore,
+        email_limit: int,
+        ip_limit: int,
+        window_seconds: int,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store = store
+        self.email_limit = email_limit
+        self.ip_limit = ip_limit
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self.rejected = 0
+
+    async def check(self, email: str, ip: Optional[str]) -> None:
+        """
+        Registra a tentativa e levanta 429 se o IP ou o email passou do
+        limite. Deve rodar antes de qualquer busca no banco ou hash.
+        """
+        window, elapsed = divmod(self.clock(), self.window_seconds)
+        keys = [(_email_key(email), self.email_limit)]
+        if ip:
+            keys.insert(0, (_ip_key(ip), self.ip_limit))
+
+        for key, limit in keys:
+            hits, previous = await self.store.hit(key, int(window))
+            weight = 1 - elapsed / self.window_seconds
+            if previous * weight + hits > limit:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=HTTPStatus.TOO_MANY_REQUESTS,
+                    detail='Muitas tentativas de login, tente mais tarde',
+                    headers={
+                        'Retry-After': str(
+                            self._retry_after(hits, previous, elapsed, limit)
+                        )
+                    },
+                )
+
+    async def record_success(self, email: str, ip: Optional[str]) -> None:
+        """
+        Zera o contador do email e desconta do IP a tentativa registrada por
+        `check`, que não era uma falha
+        """
+        await self.store.reset(_email_key(email))
+        if ip:
+            window = int(self.clock() // self.window_seconds)
+            await self.store.release(_ip_key(ip), window)
+
+    def _retry_after(
+        self, hits: int, previous: int, elapsed: float, limit: int
+    ) -> int:
+        """
+        Segundos até que uma nova tentativa caiba no limite
+        """
+        size = self.window_seconds
+        # Ainda na janela atual, esperando a anterior perder peso
+        if previous and hits + 1 <= limit:
+            wait = size * (1 - (limit - hits - 1) / previous) - elapsed
+            if wait < size - elapsed:
+                return max(1, math.ceil(wait))
+        # Na próxima janela, esperando a atual perder peso
+        wait = size - elapsed + max(0.0, size * (1 - (limit - 1) / hits))
+        return max(1, math.ceil(wait))
+
+
+def _ip_key(ip: str) -> str:
+    return f'ip:{ip}'
+
+
+def _email_key(email: str) -> str:
+    # O email vem do formulário, sem limite de tamanho: o hash mantém a
+    # chave curta e de tamanho fixo, dentro da coluna de tb_login_throttle
+    normalized = email.strip().lower().encode()
+    return f'email:{hashlib.sha256(normalized).hexdigest()}'
+
+
+def _build_store() -> ThrottleStore:
+    if settings.LOGIN_THROTTLE_BACKEND == LoginThrottleBackend.POSTGRES:
+        return PostgresThrottleStore(engine)
+    return InMemoryThrottleStore()
+
+
+login_throttle = LoginThrottle(
+    _build_store(),
+    email_limit=settings.LOGIN_THROTTLE_EMAIL_LIMIT,
+    ip_limit=settings.LOGIN_THROTTLE_IP_LIMIT,
+    window_seconds=settings.LOGIN_THROTTLE_WINDOW,
+)
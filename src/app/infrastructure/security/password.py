@@ -1,6 +1,33 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Callable, Optional, TypeVar
+
+from fastapi import HTTPException
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.constants import PasswordHasherPool
+from app.infrastructure.config.settings import settings
+from app.infrastructure.metrics.prometheus import password_hash_duration
+from app.infrastructure.tracing.tracer import traced
+
+pwd_context = PasswordHash((
+    Argon2Hasher(
+        time_cost=settings.ARGON2_TIME_COST,
+        memory_cost=settings.ARGON2_MEMORY_COST,
+        parallelism=settings.ARGON2_PARALLELISM,
+    ),
+))
 
-pwd_context = PasswordHash.recommended()
+T = TypeVar('T')
 
 
 def get_password_hash(password: str) -> str:
@@ -10,8 +37,188 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def get_password_hashes(passwords: list[str]) -> list[str]:
+    """
+    Gera os hashes de várias senhas em uma única chamada
+    """
+    return [pwd_context.hash(password) for password in passwords]
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifica se uma senha em texto puro corresponde ao hash armazenado
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    Verifica a senha e, se o hash armazenado usa parâmetros diferentes dos
+    configurados, retorna também um novo hash com os parâmetros atuais
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+@dataclass
+class LatencyStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    @property
+    def average_seconds(self) -> float:
+        if not self.count:
+            return 0.0
+        return self.total_seconds / self.count
+
+
+class PasswordHasher:
+    """
+    Executa o hash e a verificação de senhas em um pool de workers, sem
+    bloquear o event loop. Quando a fila de chamadas pendentes está cheia a
+    chamada falha imediatamente com 503.
+    """
+
+    def __init__(
+        self,
+        pool: PasswordHasherPool = PasswordHasherPool.THREAD,
+        max_workers: int = 4,
+        max_pending: int = 32,
+    ):
+        self.pool = pool
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self.stats = {
+            'hash': LatencyStats(),
+            'hash_many': LatencyStats(),
+            'verify': LatencyStats(),
+            'verify_and_update': LatencyStats(),
+        }
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.pool == PasswordHasherPool.PROCESS:
+                self._executor = ProcessPoolExecutor(self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix='password-hasher'
+                )
+        return self._executor
+
+    def _acquire(self, slots: int = 1) -> None:
+        with self._lock:
+            if self.pending + slots > self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                    detail='Servidor ocupado, tente novamente em instantes',
+                    headers={'Retry-After': '1'},
+                )
+            self.pending += slots
+
+    def _release(self, slots: int = 1) -> None:
+        with self._lock:
+            self.pending -= slots
+
+    async def _run(self, operation: str, fn: Callable[..., T], *args) -> T:
+        self._acquire()
+        return await self._submit(operation, 1, fn, *args)
+
+    async def _submit(
+        self, operation: str, slots: int, fn: Callable[..., T], *args
+    ) -> T:
+        """
+        Envia a chamada ao pool; as vagas já foram reservadas por quem chama
+        """
+        start = time.perf_counter()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release(slots)
+            raise
+        # A vaga só é liberada quando o worker termina, mesmo que a
+        # requisição seja cancelada antes disso.
+        future.add_done_callback(lambda _future: self._release(slots))
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stats[operation].observe(elapsed)
+            password_hash_duration.labels(operation).observe(elapsed)
+
+    @traced('password.hash', layer='security')
+    async def hash(self, password: str) -> str:
+        return await self._run('hash', get_password_hash, password)
+
+    @traced('password.hash_many', layer='security')
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """
+        Hasheia as senhas em partes de até metade da fila, uma parte por
+        vez, cada uma distribuída em um lote por worker. A outra metade fica
+        livre para logins e cadastros concorrentes. Cada senha da parte
+        ocupa uma vaga; se a fila estiver cheia quando uma parte for entrar,
+        a chamada falha com 503.
+        """
+        chunk_size = max(1, self.max_pending // 2)
+        hashes = []
+        for start in range(0, len(passwords), chunk_size):
+            hashes += await self._hash_chunk(
+                passwords[start : start + chunk_size]
+            )
+        return hashes
+
+    async def _hash_chunk(self, passwords: list[str]) -> list[str]:
+        self._acquire(len(passwords))
+        size = -(-len(passwords) // self.max_workers)
+        batches = [
+            passwords[i : i + size] for i in range(0, len(passwords), size)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._submit(
+                    'hash_many', len(batch), get_password_hashes, batch
+                )
+                for batch in batches
+            )
+        )
+        return [hashed for batch in results for hashed in batch]
+
+    @traced('password.verify', layer='security')
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(
+            'verify', verify_password, plain_password, hashed_password
+        )
+
+    @traced('password.verify_and_update', layer='security')
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        return await self._run(
+            'verify_and_update',
+            verify_and_update_password,
+            plain_password,
+            hashed_password,
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    pool=settings.PASSWORD_HASHER_POOL,
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    max_pending=settings.PASSWORD_HASHER_MAX_PENDING,
+)
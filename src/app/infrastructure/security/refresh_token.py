@@ -0,0 +1,29 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from app.infrastructure.config.settings import settings
+from app.infrastructure.tracing.tracer import traced
+
+
+def generate_refresh_token() -> str:
+    """
+    Token opaco com 256 bits aleatórios
+    """
+    return secrets.token_urlsafe(32)
+
+
+@traced('refresh_token.hash', layer='security')
+def hash_refresh_token(token: str) -> str:
+    """
+    sha256 basta: o token já tem entropia alta, então não precisa de um hash
+    lento como o das senhas
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def refresh_token_expiration() -> datetime:
+    return datetime.now(ZoneInfo('UTC')) + timedelta(
+        days=settings.REFRESH_TOKEN_EXPIRATION_DAYS
+    )
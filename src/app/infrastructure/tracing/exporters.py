@@ -0,0 +1,99 @@
+import json
+import logging
+import queue
+import threading
+from collections import deque
+from typing import Optional, Protocol
+
+from app.infrastructure.tracing.span import Span
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class InMemorySpanExporter:
+    """
+    Guarda os últimos spans finalizados, para inspeção e testes
+    """
+
+    def __init__(self, max_spans: int = 10_000):
+        self.spans: deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class FileSpanExporter:
+    """
+    Grava um JSON por linha para cada span finalizado. `export` só coloca o
+    span na fila: uma thread serializa e grava os spans em lotes, com o
+    arquivo aberto uma única vez, sem bloquear o event loop. Com a fila
+    cheia o span é descartado e contado em `dropped`.
+    """
+
+    def __init__(
+        self, path: str, max_queue: int = 10_000, batch_size: int = 512
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.dropped = 0
+        # None na fila encerra a thread
+        self._queue: queue.Queue[Optional[Span]] = queue.Queue(max_queue)
+        self._thread = threading.Thread(
+            target=self._run, name='span-exporter', daemon=True
+        )
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """
+        Espera a gravação dos spans já colocados na fila
+        """
+        self._queue.join()
+
+    def shutdown(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        with open(self.path, 'a', encoding='utf-8') as file:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                spans = [span for span in batch if span is not None]
+                try:
+                    file.writelines(
+                        json.dumps(span.to_dict(), default=str) + '\n'
+                        for span in spans
+                    )
+                    file.flush()
+                except OSError:
+                    logger.exception('Falha ao gravar spans em %s', self.path)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+
+                if len(spans) < len(batch):
+                    return
@@ -0,0 +1,138 @@
+"""
+Rastreamento em spans, no modelo do OpenTelemetry (trace_id, span_id,
+parent_id, atributos e status), sem dependências externas.
+
+Os spans só são registrados dentro de um span raiz, aberto pelo
+TracingMiddleware em cada requisição. Fora disso os decorators apenas
+chamam a função original.
+"""
+
+import inspect
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from secrets import token_hex
+from typing import Any, Optional, TypeVar
+
+from app.constants import TracingExporter
+from app.infrastructure.config.settings import settings
+from app.infrastructure.tracing.exporters import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    SpanExporter,
+)
+from app.infrastructure.tracing.span import Span, Trace
+
+T = TypeVar('T')
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    'current_span', default=None
+)
+
+
+class Tracer:
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        self.exporter = exporter
+
+    @contextmanager
+    def start_span(
+        self, name: str, root: bool = False, **attributes: Any
+    ) -> Iterator[Optional[Span]]:
+        parent = _current_span.get()
+        if parent is None and not root:
+            yield None
+            return
+
+        span = Span(
+            name=name,
+            trace=parent.trace if parent else Trace(trace_id=token_hex(16)),
+            span_id=token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException:
+            span.status = 'ERROR'
+            raise
+        else:
+            span.status = 'OK'
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+            span.trace.spans.append(span)
+            if self.exporter is not None:
+                self.exporter.export(span)
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+def _build_exporter() -> Optional[SpanExporter]:
+    match settings.TRACING_EXPORTER:
+        case TracingExporter.MEMORY:
+            return InMemorySpanExporter()
+        case TracingExporter.FILE:
+            return FileSpanExporter(settings.TRACING_FILE)
+    return None
+
+
+tracer = Tracer(_build_exporter())
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def traced(name: str, **attributes: Any) -> Callable[[T], T]:
+    """
+    Envolve uma função, síncrona ou assíncrona, em um span
+    """
+
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await fn(*args, **kwargs)
+                with tracer.start_span(name, **attributes):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return fn(*args, **kwargs)
+            with tracer.start_span(name, **attributes):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_methods(layer: str) -> Callable[[type[T]], type[T]]:
+    """
+    Decorator de classe: cria um span `Classe.metodo` para cada método
+    público assíncrono definido na própria classe. Geradores assíncronos
+    (stream) ficam de fora, já que são consumidos depois da chamada.
+    """
+
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith('_') and inspect.iscoroutinefunction(value):
+                setattr(
+                    cls,
+                    attr,
+                    traced(f'{cls.__name__}.{attr}', layer=layer)(value),
+                )
+        return cls
+
+    return decorator
@@ -1,12 +1,57 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.constants import Environment, TracingExporter
+from app.infrastructure.config.database import dispose_engines
 from app.infrastructure.config.settings import settings
+from app.infrastructure.security.password import password_hasher
+from app.infrastructure.tracing.tracer import tracer
 from app.presentation.controllers.auth_controller import router as auth_router
+from app.presentation.controllers.metrics_controller import (
+    router as metrics_router,
+)
 from app.presentation.controllers.user_controller import router as user_router
+from app.presentation.middlewares.metrics_middleware import MetricsMiddleware
+from app.presentation.middlewares.query_stats_middleware import (
+    QueryStatsMiddleware,
+)
+from app.presentation.middlewares.read_after_write_middleware import (
+    ReadAfterWriteMiddleware,
+)
+from app.presentation.middlewares.tracing_middleware import TracingMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    password_hasher.shutdown()
+    tracer.shutdown()
+    await dispose_engines()
+
 
 app = FastAPI(
     title='FastAPI Clean Architecture',
+    lifespan=lifespan,
+)
+app.add_middleware(
+    QueryStatsMiddleware,
+    expose_headers=settings.ENVIRONMENT != Environment.PRODUCTION
+    if settings.DB_QUERY_HEADERS is None
+    else settings.DB_QUERY_HEADERS,
+)
+app.add_middleware(MetricsMiddleware)
+# Sem réplicas todas as leituras já vão ao primário
+if settings.DATABASE_REPLICA_URLS:
+    app.add_middleware(ReadAfterWriteMiddleware)
+
+server_timing = (
+    settings.ENVIRONMENT != Environment.PRODUCTION
+    if settings.SERVER_TIMING is None
+    else settings.SERVER_TIMING
 )
+if server_timing or settings.TRACING_EXPORTER != TracingExporter.NONE:
+    app.add_middleware(TracingMiddleware, server_timing=server_timing)
 
 app.include_router(
     user_router, prefix=f'{settings.API_PREFIX}/users', tags=['users']
@@ -14,3 +59,4 @@ app.include_router(
 app.include_router(
     auth_router, prefix=f'{settings.API_PREFIX}/auth', tags=['auth']
 )
+app.include_router(metrics_router)
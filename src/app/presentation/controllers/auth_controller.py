@@ -1,15 +1,31 @@
 from http import HTTPStatus
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
+from app.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
 from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.cache.user_list_cache import UserListCache
 from app.infrastructure.config.settings import settings
+from app.infrastructure.dependencies.auth_dependencies import (
+    get_login_throttle,
+    get_refresh_token_repository,
+)
 from app.infrastructure.dependencies.user_dependencies import (
-    get_user_repository,
+    get_primary_user_repository,
+    get_user_list_cache,
 )
+from app.infrastructure.security.login_throttle import LoginThrottle
+from app.presentation.schemas.auth.request import RefreshTokenRequest
 from app.presentation.schemas.auth.response import TokenResponse
 from app.use_cases.auth.login_user import LoginUserInput, LoginUserUseCase
+from app.use_cases.auth.refresh_token import (
+    RefreshTokenInput,
+    RefreshTokenUseCase,
+)
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(
@@ -18,11 +34,23 @@ oauth2_scheme = OAuth2PasswordBearer(
 
 
 @router.post('/login', response_model=TokenResponse)
-async def login(
+async def login(  # noqa: PLR0913, PLR0917
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    user_repository: UserRepository = Depends(get_user_repository),
+    user_repository: UserRepository = Depends(get_primary_user_repository),
+    throttle: LoginThrottle = Depends(get_login_throttle),
+    refresh_token_repository: RefreshTokenRepository = Depends(
+        get_refresh_token_repository
+    ),
+    list_cache: Optional[UserListCache] = Depends(get_user_list_cache),
 ):
-    use_case = LoginUserUseCase(user_repository)
+    client_ip = request.client.host if request.client else None
+    # Antes de qualquer busca no banco ou verificação do argon2
+    await throttle.check(form_data.username, client_ip)
+
+    use_case = LoginUserUseCase(
+        user_repository, refresh_token_repository, list_cache
+    )
     input_data = LoginUserInput(
         email=form_data.username,
         password=form_data.password,
@@ -37,4 +65,32 @@ async def login(
             headers={'WWW-Authenticate': 'Bearer'},
         )
 
-    return TokenResponse(access_token=result.access_token)
+    await throttle.record_success(form_data.username, client_ip)
+    return TokenResponse(
+        access_token=result.access_token, refresh_token=result.refresh_token
+    )
+
+
+@router.post('/refresh', response_model=TokenResponse)
+async def refresh(
+    body: RefreshTokenRequest,
+    refresh_token_repository: RefreshTokenRepository = Depends(
+        get_refresh_token_repository
+    ),
+):
+    # Sem argon2 nem busca do usuário: um sha256 e um único comando no banco
+    use_case = RefreshTokenUseCase(refresh_token_repository)
+    result = await use_case.execute(
+        RefreshTokenInput(refresh_token=body.refresh_token)
+    )
+
+    if not result.success or not result.access_token:
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail='Refresh token inválido ou expirado',
+            headers={'WWW-Authenticate': 'Bearer'},
+        )
+
+    return TokenResponse(
+        access_token=result.access_token, refresh_token=result.refresh_token
+    )
@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+from app.infrastructure.metrics.prometheus import latest_metrics
+
+router = APIRouter()
+
+
+@router.get('/metrics', include_in_schema=False)
+def metrics():
+    content, media_type = latest_metrics()
+    return Response(content=content, media_type=media_type)
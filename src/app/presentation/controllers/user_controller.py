@@ -1,22 +1,92 @@
 from http import HTTPStatus
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 
+from app.constants import CountMode, ExportFormat, PaginationMode
+from app.domain.repositories.user_repository import UserVersion
+from app.infrastructure.cache.user_list_cache import CachedPage, UserListCache
 from app.infrastructure.dependencies.auth_dependencies import get_current_user
 from app.infrastructure.dependencies.user_dependencies import (
     get_create_user_use_case,
+    get_create_users_bulk_use_case,
+    get_export_users_use_case,
     get_get_user_use_case,
+    get_get_user_version_use_case,
+    get_list_users_by_cursor_use_case,
     get_list_users_use_case,
+    get_list_users_version_use_case,
+    get_search_users_use_case,
+    get_user_list_cache,
+)
+from app.presentation.schemas.common.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from app.presentation.schemas.common.pagination import (
+    CursorPaginatedResponse,
+    PaginatedResponse,
+)
+from app.presentation.schemas.user.request import (
+    MAX_BULK_USERS,
+    UserCreateRequest,
+)
+from app.presentation.schemas.user.response import (
+    BulkUserCreateResponse,
+    BulkUserResult,
+    BulkUserStatus,
+    UserResponse,
+    UserSearchResponse,
 )
-from app.presentation.schemas.common.pagination import PaginatedResponse
-from app.presentation.schemas.user.request import UserCreateRequest
-from app.presentation.schemas.user.response import UserResponse
+from app.presentation.serializers.etag import (
+    etag_matches,
+    last_modified,
+    not_modified,
+    page_etag,
+    user_etag,
+    validator_headers,
+)
+from app.presentation.serializers.orjson_response import (
+    ORJSONModelResponse,
+    ORJSONModelRoute,
+)
+from app.presentation.serializers.user_export import iter_csv, iter_ndjson
 from app.use_cases.user.create_user import CreateUserUseCase
+from app.use_cases.user.create_users_bulk import (
+    CreateUsersBulkInput,
+    CreateUsersBulkUseCase,
+)
+from app.use_cases.user.export_users import (
+    ExportUsersInput,
+    ExportUsersUseCase,
+)
 from app.use_cases.user.get_user import GetUserInput, GetUserUseCase
+from app.use_cases.user.get_user_version import (
+    GetUserVersionInput,
+    GetUserVersionUseCase,
+)
 from app.use_cases.user.list_users import ListUsersInput, ListUsersUseCase
+from app.use_cases.user.list_users_by_cursor import (
+    ListUsersByCursorInput,
+    ListUsersByCursorUseCase,
+)
+from app.use_cases.user.list_users_version import ListUsersVersionUseCase
+from app.use_cases.user.search_users import (
+    SearchUsersInput,
+    SearchUsersUseCase,
+)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONModelRoute)
 
 
 @router.post('/', response_model=UserResponse, status_code=HTTPStatus.CREATED)
@@ -27,16 +97,101 @@ async def create_user(
     try:
         data = await use_case.execute(input_data=user_request)
 
-        return UserResponse(
-            id=data.user.id,
-            name=data.user.name,
-            email=data.user.email,
-            created_at=data.user.created_at,
-        )
+        return UserResponse.from_user(data.user)
     except ValueError as e:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
 
+@router.post(
+    '/bulk',
+    response_model=BulkUserCreateResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def create_users_bulk(
+    users_request: list[UserCreateRequest] = Body(
+        ..., min_length=1, max_length=MAX_BULK_USERS
+    ),
+    use_case: CreateUsersBulkUseCase = Depends(get_create_users_bulk_use_case),
+):
+    data = await use_case.execute(
+        input_data=CreateUsersBulkInput(users=users_request)
+    )
+
+    items = [
+        BulkUserResult(
+            index=index,
+            email=result.email,
+            status=BulkUserStatus.CREATED
+            if result.created
+            else BulkUserStatus.CONFLICT,
+            user=UserResponse.from_user(result.user)
+            if result.created
+            else None,
+        )
+        for index, result in enumerate(data.results)
+    ]
+    created = sum(item.status == BulkUserStatus.CREATED for item in items)
+
+    return BulkUserCreateResponse(
+        created=created,
+        conflicts=len(items) - created,
+        items=items,
+    )
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: 'application/x-ndjson',
+    ExportFormat.CSV: 'text/csv; charset=utf-8',
+}
+
+
+@router.get('/export', dependencies=[Depends(get_current_user)])
+async def export_users(
+    format: ExportFormat = Query(
+        ExportFormat.NDJSON, description='Output format'
+    ),
+    use_case: ExportUsersUseCase = Depends(get_export_users_use_case),
+):
+    data = await use_case.execute(input_data=ExportUsersInput())
+
+    if format == ExportFormat.CSV:
+        body = iter_csv(data.users)
+    else:
+        body = iter_ndjson(data.users)
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            'Content-Disposition': f'attachment; filename="users.{format}"'
+        },
+    )
+
+
+@router.get(
+    '/search',
+    response_model=UserSearchResponse,
+    dependencies=[Depends(get_current_user)],
+)
+async def search_users(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=150,
+        description='Name or email prefix; substring from 3 characters',
+    ),
+    limit: int = Query(20, ge=1, le=100, description='Maximum results'),
+    use_case: SearchUsersUseCase = Depends(get_search_users_use_case),
+):
+    data = await use_case.execute(
+        input_data=SearchUsersInput(query=q, limit=limit)
+    )
+
+    return UserSearchResponse(
+        query=q, items=[UserResponse.from_user(user) for user in data.users]
+    )
+
+
 @router.get(
     '/{user_id}/',
     response_model=UserResponse,
@@ -44,47 +199,106 @@ async def create_user(
 )
 async def get_user(
     user_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
     use_case: GetUserUseCase = Depends(get_get_user_use_case),
+    version_use_case: GetUserVersionUseCase = Depends(
+        get_get_user_version_use_case
+    ),
 ):
+    if if_none_match:
+        # Só id e updated_at: o usuário inteiro é buscado apenas se mudou
+        version = (
+            await version_use_case.execute(
+                input_data=GetUserVersionInput(user_id=user_id)
+            )
+        ).version
+        if version is None:
+            raise HTTPException(status_code=HTTPStatus.NOT_FOUND)
+
+        etag = user_etag(version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, version.updated_at)
+
     data = await use_case.execute(input_data=GetUserInput(user_id=user_id))
 
-    if data is None:
+    if data is None or data.user is None:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND)
 
-    return UserResponse(
-        id=data.user.id,
-        name=data.user.name,
-        email=data.user.email,
-        created_at=data.user.created_at,
+    response.headers.update(
+        validator_headers(
+            user_etag(UserVersion.from_user(data.user)), data.user.updated_at
+        )
     )
+    return UserResponse.from_user(data.user)
 
 
 @router.get(
     '/',
-    response_model=PaginatedResponse[UserResponse],
+    response_model=PaginatedResponse[UserResponse]
+    | CursorPaginatedResponse[UserResponse],
     dependencies=[Depends(get_current_user)],
 )
-async def list_users(
+async def list_users(  # noqa: PLR0913, PLR0917
+    response: Response,
     page: int = Query(1, ge=1, description='Page number'),
     page_size: int = Query(10, ge=1, le=100, description='Page size'),
+    count_mode: CountMode = Query(
+        CountMode.EXACT, description='Strategy used to compute the total'
+    ),
+    pagination: PaginationMode = Query(
+        PaginationMode.OFFSET, description='Pagination strategy'
+    ),
+    cursor: str | None = Query(
+        None, description='Opaque cursor returned by a previous page'
+    ),
+    if_none_match: str | None = Header(None),
     use_case: ListUsersUseCase = Depends(get_list_users_use_case),
+    cursor_use_case: ListUsersByCursorUseCase = Depends(
+        get_list_users_by_cursor_use_case
+    ),
+    version_use_case: ListUsersVersionUseCase = Depends(
+        get_list_users_version_use_case
+    ),
+    list_cache: Optional[UserListCache] = Depends(get_user_list_cache),
 ):
-    data = await use_case.execute(
-        input_data=ListUsersInput(
-            page=page,
-            page_size=page_size,
+    if cursor is not None or pagination == PaginationMode.CURSOR:
+        return await _list_users_by_cursor(
+            page_size, cursor, cursor_use_case, response, if_none_match
         )
+
+    input_data = ListUsersInput(
+        page=page,
+        page_size=page_size,
+        count_mode=count_mode,
     )
 
-    users_list = [
-        UserResponse(
-            id=user.id,
-            name=user.name,
-            email=user.email,
-            created_at=user.created_at,
-        )
-        for user in data.users
-    ]
+    cache_key = None
+    if list_cache is not None:
+        cache_key = await list_cache.key(page, page_size, count_mode)
+        cached = list_cache.get(cache_key)
+        if cached is not None:
+            if etag_matches(if_none_match, cached.etag):
+                return not_modified(cached.etag, cached.last_modified)
+            return Response(
+                cached.body,
+                media_type=ORJSONModelResponse.media_type,
+                headers=validator_headers(cached.etag, cached.last_modified),
+            )
+
+    if if_none_match:
+        version = await version_use_case.execute(input_data=input_data)
+        etag = page_etag(version.versions, version.total)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, last_modified(version.versions))
+
+    data = await use_case.execute(input_data=input_data)
+
+    versions = [UserVersion.from_user(user) for user in data.users]
+    etag = page_etag(versions, data.total)
+    modified_at = last_modified(versions)
+
+    users_list = [UserResponse.from_user(user) for user in data.users]
 
     pagination = PaginatedResponse(
         page=page,
@@ -94,4 +308,53 @@ async def list_users(
         total_pages=data.total_pages,
     )
 
-    return pagination
+    if cache_key is None:
+        response.headers.update(validator_headers(etag, modified_at))
+        return pagination
+
+    # Serializada aqui para que o cache guarde os bytes prontos
+    rendered = ORJSONModelResponse(
+        pagination, headers=validator_headers(etag, modified_at)
+    )
+    list_cache.set(cache_key, CachedPage(rendered.body, etag, modified_at))
+    return rendered
+
+
+async def _list_users_by_cursor(
+    page_size: int,
+    cursor: str | None,
+    use_case: ListUsersByCursorUseCase,
+    response: Response,
+    if_none_match: str | None = None,
+) -> CursorPaginatedResponse[UserResponse] | Response:
+    input_data = ListUsersByCursorInput(page_size=page_size)
+    if cursor:
+        try:
+            input_data.cursor, input_data.backwards = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST, detail=str(e)
+            )
+
+    data = await use_case.execute(input_data=input_data)
+
+    next_cursor = encode_cursor(data.next_cursor) if data.next_cursor else None
+    prev_cursor = (
+        encode_cursor(data.prev_cursor, backwards=True)
+        if data.prev_cursor
+        else None
+    )
+
+    # Sem consulta mais barata aqui: o 304 evita a serialização e o envio
+    versions = [UserVersion.from_user(user) for user in data.users]
+    etag = page_etag(versions, next_cursor, prev_cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, last_modified(versions))
+    response.headers.update(validator_headers(etag, last_modified(versions)))
+
+    return CursorPaginatedResponse(
+        page_size=page_size,
+        items=[UserResponse.from_user(user) for user in data.users],
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
@@ -0,0 +1,43 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.metrics.prometheus import http_request_duration
+
+# Rota usada quando nenhuma casa com o path, para não criar uma série por URL
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class MetricsMiddleware:
+    """
+    Mede a duração das requisições HTTP, rotuladas pelo template da rota
+    (/v1/users/{user_id}/) e não pelo path concreto.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # O roteador grava a rota encontrada no próprio scope
+            route = scope.get('route')
+            http_request_duration.labels(
+                scope['method'],
+                getattr(route, 'path_format', UNMATCHED_ROUTE),
+                str(status),
+            ).observe(time.perf_counter() - start)
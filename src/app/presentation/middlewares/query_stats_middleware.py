@@ -0,0 +1,36 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.metrics.query_stats import track_queries
+
+
+class QueryStatsMiddleware:
+    """
+    Conta as queries e o tempo de banco de cada requisição. Com
+    `expose_headers` o resultado vai nos headers X-DB-Queries e X-DB-Time
+    (em ms). Queries feitas depois do início da resposta, como as de um
+    StreamingResponse, não entram nos headers.
+    """
+
+    def __init__(self, app: ASGIApp, expose_headers: bool = True):
+        self.app = app
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(scope) as stats:
+            if not self.expose_headers:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message: Message) -> None:
+                if message['type'] == 'http.response.start':
+                    headers = MutableHeaders(scope=message)
+                    headers.append('X-DB-Queries', str(stats.queries))
+                    headers.append('X-DB-Time', f'{stats.seconds * 1e3:.2f}')
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
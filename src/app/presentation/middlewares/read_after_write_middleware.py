@@ -0,0 +1,54 @@
+import math
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.config.read_after_write import (
+    COOKIE_NAME,
+    track_writes,
+)
+from app.infrastructure.config.settings import settings
+
+
+class ReadAfterWriteMiddleware:
+    """
+    Abre um WriteTracker por requisição com a última escrita do cliente,
+    lida do cookie `last_write`, e renova o cookie quando a requisição
+    escreve. Escritas feitas depois do início da resposta não renovam.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        cookie = HTTPConnection(scope).cookies.get(COOKIE_NAME)
+        with track_writes(_parse_timestamp(cookie)) as tracker:
+
+            async def send_wrapper(message: Message) -> None:
+                if message['type'] == 'http.response.start' and tracker.wrote:
+                    headers = MutableHeaders(scope=message)
+                    max_age = math.ceil(settings.DB_READ_AFTER_WRITE_WINDOW)
+                    headers.append(
+                        'Set-Cookie',
+                        f'{COOKIE_NAME}={tracker.last_write_at:.3f}; '
+                        f'Max-Age={max_age}; Path=/; HttpOnly; SameSite=lax',
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        timestamp = float(value)
+    except ValueError:
+        return None
+    return timestamp if math.isfinite(timestamp) else None
@@ -0,0 +1,71 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.tracing.span import Span
+from app.infrastructure.tracing.tracer import tracer
+
+
+def server_timing(spans: list[Span], total_ms: float) -> str:
+    """
+    Soma a duração dos spans de mesmo nome, na ordem em que terminaram:
+    `SqlModelUserRepository.find_by_email;dur=1.2, ..., total;dur=231.0`
+    """
+    durations: dict[str, float] = {}
+    counts: dict[str, int] = {}
+    for span in spans:
+        durations[span.name] = durations.get(span.name, 0.0) + span.duration_ms
+        counts[span.name] = counts.get(span.name, 0) + 1
+
+    metrics = [
+        f'{name};dur={duration:.2f}'
+        + (f';desc="{counts[name]}x"' if counts[name] > 1 else '')
+        for name, duration in durations.items()
+    ]
+    metrics.append(f'total;dur={total_ms:.2f}')
+    return ', '.join(metrics)
+
+
+class TracingMiddleware:
+    """
+    Abre o span raiz de cada requisição. Com `server_timing` a resposta traz
+    o header Server-Timing com os spans finalizados até o início da resposta.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        with tracer.start_span(
+            f'{method} {scope["path"]}',
+            root=True,
+            layer='http',
+            **{'http.method': method, 'http.target': scope['path']},
+        ) as span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message['type'] == 'http.response.start':
+                    _name_after_route(span, scope)
+                    span.attributes['http.status_code'] = message['status']
+                    if self.server_timing:
+                        total_ms = (time.time_ns() - span.start_ns) / 1e6
+                        MutableHeaders(scope=message).append(
+                            'Server-Timing',
+                            server_timing(span.trace.spans, total_ms),
+                        )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+def _name_after_route(span: Span, scope: Scope) -> None:
+    route = scope.get('route')
+    if route is not None:
+        span.name = f'{scope["method"]} {route.path_format}'
@@ -1,6 +1,9 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = 'Bearer'
+    refresh_token: Optional[str] = None
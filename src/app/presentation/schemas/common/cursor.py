@@ -0,0 +1,44 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.repositories.user_repository import UserCursor
+
+# [created_at, id, backwards]
+CURSOR_FIELDS = 3
+
+
+def encode_cursor(cursor: UserCursor, backwards: bool = False) -> str:
+    payload = json.dumps(
+        [cursor.created_at.isoformat(), str(cursor.id), int(backwards)],
+        separators=(',', ':'),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(value: str) -> tuple[UserCursor, bool]:
+    """
+    Decodifica um cursor opaco, levantando ValueError se ele for inválido
+    """
+    try:
+        padded = value + '=' * (-len(value) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        # O payload vem do cliente: confere a forma antes de usar os valores
+        if not (
+            isinstance(payload, list)
+            and len(payload) == CURSOR_FIELDS
+            and isinstance(payload[0], str)
+            and isinstance(payload[1], str)
+            and payload[2] in {0, 1}
+            and not isinstance(payload[2], float)
+        ):
+            raise ValueError('Formato de cursor inesperado')
+        created_at, user_id, backwards = payload
+        cursor = UserCursor(
+            created_at=datetime.fromisoformat(created_at), id=UUID(user_id)
+        )
+    except (ValueError, TypeError, AttributeError) as e:
+        raise ValueError('Cursor inválido') from e
+
+    return cursor, bool(backwards)
@@ -12,8 +12,14 @@ class PaginationParams(BaseModel):
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
-    total_pages: int
+    total_pages: int | None
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    items: list[T]
+    page_size: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
@@ -2,6 +2,7 @@ from pydantic import BaseModel, EmailStr, model_validator
 
 MIN_NAME_LENGTH = 2
 MIN_PASSWORD_LENGTH = 8
+MAX_BULK_USERS = 1000
 
 
 class UserCreateRequest(BaseModel):
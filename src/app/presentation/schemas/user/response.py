@@ -1,8 +1,11 @@
 from datetime import datetime
+from enum import StrEnum
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr
 
+from app.domain.entities.user import User, UserReadModel
+
 
 class UserResponse(BaseModel):
     id: UUID
@@ -10,6 +13,42 @@ class UserResponse(BaseModel):
     email: EmailStr
     created_at: datetime | None = None
 
+    @classmethod
+    def from_user(cls, user: User | UserReadModel) -> 'UserResponse':
+        """
+        Monta a resposta a partir de uma entidade já persistida, sem validar
+        os campos de novo
+        """
+        return cls.model_construct(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            created_at=user.created_at,
+        )
+
 
 class UserDetailResponse(UserResponse):
     updated_at: datetime | None = None
+
+
+class UserSearchResponse(BaseModel):
+    query: str
+    items: list[UserResponse]
+
+
+class BulkUserStatus(StrEnum):
+    CREATED = 'created'
+    CONFLICT = 'conflict'
+
+
+class BulkUserResult(BaseModel):
+    index: int
+    email: EmailStr
+    status: BulkUserStatus
+    user: UserResponse | None = None
+
+
+class BulkUserCreateResponse(BaseModel):
+    created: int
+    conflicts: int
+    items: list[BulkUserResult]
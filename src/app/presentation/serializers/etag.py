@@ -0,0 +1,88 @@
+"""
+ETags fracos e respostas 304 para os recursos de usuário.
+
+O ETag de um usuário vem do id e do updated_at. O de uma página vem dos
+pares (id, updated_at) de todos os itens e do que mais a resposta inclui
+(total, cursores), então muda quando um item é alterado, entra ou sai da
+página, ou quando o total muda.
+"""
+
+import hashlib
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import Response
+
+from app.domain.repositories.user_repository import UserVersion
+
+
+def _utc(value: datetime) -> datetime:
+    # Colunas sem fuso voltam do banco sem tzinfo, já em UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _weak_etag(*parts: object) -> str:
+    digest = hashlib.blake2b(digest_size=12)
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b'\0')
+    return f'W/"{digest.hexdigest()}"'
+
+
+def user_etag(version: UserVersion) -> str:
+    return _weak_etag(version.id, _utc(version.updated_at).isoformat())
+
+
+def page_etag(versions: Sequence[UserVersion], *extra: object) -> str:
+    return _weak_etag(
+        *extra,
+        len(versions),
+        *(
+            f'{version.id}@{_utc(version.updated_at).isoformat()}'
+            for version in versions
+        ),
+    )
+
+
+def last_modified(versions: Sequence[UserVersion]) -> Optional[datetime]:
+    if not versions:
+        return None
+    return max(_utc(version.updated_at) for version in versions)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Comparação fraca do If-None-Match (RFC 9110): ignora o prefixo W/
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag.removeprefix('W/')
+    return any(
+        candidate.strip().removeprefix('W/') == opaque
+        for candidate in if_none_match.split(',')
+    )
+
+
+def validator_headers(
+    etag: str, modified_at: Optional[datetime]
+) -> dict[str, str]:
+    headers = {'ETag': etag}
+    if modified_at is not None:
+        headers['Last-Modified'] = format_datetime(
+            _utc(modified_at), usegmt=True
+        )
+    return headers
+
+
+def not_modified(etag: str, modified_at: Optional[datetime]) -> Response:
+    return Response(
+        status_code=HTTPStatus.NOT_MODIFIED,
+        headers=validator_headers(etag, modified_at),
+    )
@@ -0,0 +1,57 @@
+import asyncio
+from http import HTTPStatus
+from typing import Any, Callable
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+
+class ORJSONModelResponse(ORJSONResponse):
+    """
+    Resposta JSON serializada com orjson. Modelos pydantic são convertidos
+    uma única vez, sem passar de novo pela validação do response_model.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: PLR6301
+        if isinstance(content, BaseModel):
+            content = content.model_dump()
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONModelRoute(APIRoute):
+    """
+    Rota em que o modelo retornado pelo controller já é a resposta final:
+    ele é entregue ao ORJSONModelResponse em vez de ser validado e
+    serializado outra vez pelo FastAPI. O response_model continua valendo
+    para a documentação, mas opções como response_model_exclude_* são
+    ignoradas. Headers definidos em um parâmetro Response são copiados para
+    a resposta.
+    """
+
+    def get_route_handler(self) -> Callable:
+        endpoint = self.dependant.call
+        is_coroutine = asyncio.iscoroutinefunction(endpoint)
+        status_code = self.status_code or HTTPStatus.OK
+        response_param = self.dependant.response_param_name
+
+        async def call(**values: Any) -> Any:
+            if is_coroutine:
+                content = await endpoint(**values)
+            else:
+                content = await run_in_threadpool(endpoint, **values)
+            if isinstance(content, BaseModel):
+                response = ORJSONModelResponse(
+                    content, status_code=status_code
+                )
+                if response_param is not None:
+                    response.headers.raw.extend(
+                        values[response_param].headers.raw
+                    )
+                return response
+            return content
+
+        self.dependant.call = call
+        return super().get_route_handler()
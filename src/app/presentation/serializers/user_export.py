@@ -0,0 +1,49 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+
+from app.domain.entities.user import UserReadModel
+from app.presentation.schemas.user.response import UserResponse
+
+CSV_HEADER = list(UserResponse.model_fields)
+LINES_PER_CHUNK = 500
+
+
+async def iter_ndjson(
+    users: AsyncIterator[UserReadModel],
+) -> AsyncIterator[bytes]:
+    lines: list[bytes] = []
+    async for user in users:
+        lines.append(
+            UserResponse.from_user(user).model_dump_json().encode() + b'\n'
+        )
+        if len(lines) >= LINES_PER_CHUNK:
+            yield b''.join(lines)
+            lines.clear()
+    if lines:
+        yield b''.join(lines)
+
+
+async def iter_csv(
+    users: AsyncIterator[UserReadModel],
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    # O cabeçalho sai antes da primeira consulta terminar
+    yield buffer.getvalue().encode()
+
+    rows = 0
+    buffer.seek(0)
+    buffer.truncate()
+    async for user in users:
+        data = UserResponse.from_user(user).model_dump(mode='json')
+        writer.writerow([data[field] for field in CSV_HEADER])
+        rows += 1
+        if rows >= LINES_PER_CHUNK:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if rows:
+        yield buffer.getvalue().encode()
@@ -1,9 +1,20 @@
 from dataclasses import dataclass
 from typing import Optional
+from uuid import uuid4
 
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
 from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.cache.user_list_cache import UserListCache
 from app.infrastructure.security.jwt import create_access_token
-from app.infrastructure.security.password import verify_password
+from app.infrastructure.security.password import password_hasher
+from app.infrastructure.security.refresh_token import (
+    generate_refresh_token,
+    hash_refresh_token,
+    refresh_token_expiration,
+)
 from app.use_cases.interfaces.use_case import UseCase
 
 
@@ -16,12 +27,20 @@ class LoginUserInput:
 @dataclass
 class LoginUserOutput:
     access_token: Optional[str] = None
+    refresh_token: Optional[str] = None
     success: bool = False
 
 
 class LoginUserUseCase(UseCase[LoginUserInput, LoginUserOutput]):
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        refresh_token_repository: Optional[RefreshTokenRepository] = None,
+        list_cache: Optional[UserListCache] = None,
+    ):
         self.user_repository = user_repository
+        self.refresh_token_repository = refresh_token_repository
+        self.list_cache = list_cache
 
     async def execute(self, input_data: LoginUserInput) -> LoginUserOutput:
         user = await self.user_repository.find_by_email(input_data.email)
@@ -29,8 +48,37 @@ class LoginUserUseCase(UseCase[LoginUserInput, LoginUserOutput]):
         if not user:
             return LoginUserOutput(success=False)
 
-        if not verify_password(input_data.password, user.hashed_password):
+        valid, new_hash = await password_hasher.verify_and_update(
+            input_data.password, user.password
+        )
+        if not valid:
             return LoginUserOutput(success=False)
 
+        # Hash gerado com outros parâmetros do argon2: regrava com os atuais,
+        # sem exigir que o usuário troque a senha
+        if new_hash is not None:
+            await self.user_repository.update_password(user.id, new_hash)
+            # updated_at mudou, e com ele o ETag da página do usuário
+            if self.list_cache is not None:
+                await self.list_cache.on_user_updated(user)
+
         access_token = create_access_token(subject=str(user.id))
-        return LoginUserOutput(access_token=access_token, success=True)
+
+        refresh_token = None
+        if self.refresh_token_repository is not None:
+            # Cada login começa uma nova família de refresh tokens
+            refresh_token = generate_refresh_token()
+            await self.refresh_token_repository.create(
+                RefreshToken(
+                    user_id=user.id,
+                    family_id=uuid4(),
+                    token_hash=hash_refresh_token(refresh_token),
+                    expires_at=refresh_token_expiration(),
+                )
+            )
+
+        return LoginUserOutput(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            success=True,
+        )
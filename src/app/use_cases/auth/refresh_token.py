@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+from app.infrastructure.security.jwt import create_access_token
+from app.infrastructure.security.refresh_token import (
+    generate_refresh_token,
+    hash_refresh_token,
+    refresh_token_expiration,
+)
+from app.use_cases.interfaces.use_case import UseCase
+
+
+@dataclass
+class RefreshTokenInput:
+    refresh_token: str
+
+
+@dataclass
+class RefreshTokenOutput:
+    access_token: Optional[str] = None
+    refresh_token: Optional[str] = None
+    success: bool = False
+
+
+class RefreshTokenUseCase(UseCase[RefreshTokenInput, RefreshTokenOutput]):
+    def __init__(self, refresh_token_repository: RefreshTokenRepository):
+        self.refresh_token_repository = refresh_token_repository
+
+    async def execute(
+        self, input_data: RefreshTokenInput
+    ) -> RefreshTokenOutput:
+        token_hash = hash_refresh_token(input_data.refresh_token)
+        new_refresh_token = generate_refresh_token()
+
+        rotated = await self.refresh_token_repository.rotate(
+            token_hash,
+            hash_refresh_token(new_refresh_token),
+            refresh_token_expiration(),
+        )
+        if rotated is None:
+            # Token já usado reaparecendo: provavelmente foi copiado, então a
+            # família inteira deixa de valer
+            token = await self.refresh_token_repository.find_by_hash(
+                token_hash
+            )
+            if token is not None and token.revoked_at is not None:
+                await self.refresh_token_repository.revoke_family(
+                    token.family_id
+                )
+            return RefreshTokenOutput(success=False)
+
+        access_token = create_access_token(subject=str(rotated.user_id))
+        return RefreshTokenOutput(
+            access_token=access_token,
+            refresh_token=new_refresh_token,
+            success=True,
+        )
@@ -1,8 +1,17 @@
 from dataclasses import dataclass
 from typing import Optional
+from uuid import UUID
 
-from app.domain.entities.user import User
+from app.domain.entities.user import UserReadModel
 from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.cache.token_cache import (
+    VerifiedTokenCache,
+    verified_token_cache,
+)
+from app.infrastructure.cache.user_cache import (
+    AuthenticatedUserCache,
+    authenticated_user_cache,
+)
 from app.infrastructure.security.jwt import TokenPayload, decode_access_token
 from app.use_cases.interfaces.use_case import UseCase
 
@@ -14,26 +23,40 @@ class VerifyTokenInput:
 
 @dataclass
 class VerifyTokenOutput:
-    user: Optional[User] = None
+    user: Optional[UserReadModel] = None
     is_valid: bool = False
 
 
 class VerifyTokenUseCase(UseCase[VerifyTokenInput, VerifyTokenOutput]):
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        user_cache: AuthenticatedUserCache = authenticated_user_cache,
+        token_cache: VerifiedTokenCache = verified_token_cache,
+    ):
         self.user_repository = user_repository
+        self.user_cache = user_cache
+        self.token_cache = token_cache
 
     async def execute(self, input_data: VerifyTokenInput) -> VerifyTokenOutput:
         try:
-            payload: TokenPayload | ValueError = decode_access_token(
+            payload: Optional[TokenPayload] = self.token_cache.get(
                 input_data.token
             )
-            user_id = payload.sub
-            if not user_id:
+            if payload is None:
+                payload = decode_access_token(input_data.token)
+                self.token_cache.set(input_data.token, payload)
+
+            if not payload.sub:
                 return VerifyTokenOutput(is_valid=False)
+            user_id = UUID(payload.sub)
 
-            user = await self.user_repository.find_by_id(user_id)
+            user = self.user_cache.get(user_id)
             if not user:
-                return VerifyTokenOutput(is_valid=False)
+                user = await self.user_repository.find_by_id(user_id)
+                if not user:
+                    return VerifyTokenOutput(is_valid=False)
+                self.user_cache.set(user)
 
             return VerifyTokenOutput(user=user, is_valid=True)
         except ValueError:
@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+from app.infrastructure.tracing.tracer import traced
+
 Input = TypeVar('Input')
 Output = TypeVar('Output')
 
 
 class UseCase(Generic[Input, Output], ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Cada implementação de execute ganha um span `Classe.execute`
+        if 'execute' in vars(cls):
+            cls.execute = traced(f'{cls.__name__}.execute', layer='use_case')(
+                cls.execute
+            )
+
     @abstractmethod
     async def execute(self, input_data: Input) -> Output:
         pass  # pragma: no cover
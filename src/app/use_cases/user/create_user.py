@@ -1,11 +1,14 @@
 from dataclasses import dataclass
 from http import HTTPStatus
+from typing import Optional
 
 from fastapi import HTTPException
 
 from app.domain.entities.user import User
 from app.domain.repositories.user_repository import UserRepository
-from app.infrastructure.security.password import get_password_hash
+from app.infrastructure.cache.user_cache import authenticated_user_cache
+from app.infrastructure.cache.user_list_cache import UserListCache
+from app.infrastructure.security.password import password_hasher
 from app.use_cases.interfaces.use_case import UseCase
 
 
@@ -22,25 +25,30 @@ class CreateUserOutput:
 
 
 class CreateUserUseCase(UseCase[CreateUserInput, CreateUserOutput]):
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        list_cache: Optional[UserListCache] = None,
+    ):
         self.user_repository = user_repository
+        self.list_cache = list_cache
 
     async def execute(self, input_data: CreateUserInput) -> CreateUserOutput:
-        existing_user = await self.user_repository.find_by_email(
-            input_data.email
-        )
-        if existing_user:
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND, detail='User already exists'
-            )
-
-        hashed_password = get_password_hash(input_data.password)
+        hashed_password = await password_hasher.hash(input_data.password)
         user = User(
             name=input_data.name,
             email=input_data.email,
             password=hashed_password,
         )
 
+        # O conflito de email vem do próprio INSERT, sem consulta prévia
         created_user = await self.user_repository.create(user)
+        if created_user is None:
+            raise HTTPException(
+                status_code=HTTPStatus.CONFLICT, detail='User already exists'
+            )
+        authenticated_user_cache.on_user_created(created_user)
+        if self.list_cache is not None:
+            await self.list_cache.on_user_created(created_user)
 
         return CreateUserOutput(user=created_user)
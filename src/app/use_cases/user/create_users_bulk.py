@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.cache.user_cache import authenticated_user_cache
+from app.infrastructure.cache.user_list_cache import UserListCache
+from app.infrastructure.security.password import password_hasher
+from app.use_cases.interfaces.use_case import UseCase
+from app.use_cases.user.create_user import CreateUserInput
+
+
+@dataclass
+class CreateUsersBulkInput:
+    users: list[CreateUserInput]
+
+
+@dataclass
+class CreateUsersBulkResult:
+    email: str
+    user: Optional[User] = None
+
+    @property
+    def created(self) -> bool:
+        return self.user is not None
+
+
+@dataclass
+class CreateUsersBulkOutput:
+    results: list[CreateUsersBulkResult]
+
+
+class CreateUsersBulkUseCase(
+    UseCase[CreateUsersBulkInput, CreateUsersBulkOutput]
+):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        list_cache: Optional[UserListCache] = None,
+    ):
+        self.user_repository = user_repository
+        self.list_cache = list_cache
+
+    async def execute(
+        self, input_data: CreateUsersBulkInput
+    ) -> CreateUsersBulkOutput:
+        emails = list(dict.fromkeys(item.email for item in input_data.users))
+        existing = await self.user_repository.find_by_emails(emails)
+
+        # Emails repetidos no próprio lote também contam como conflito
+        taken = {user.email for user in existing}
+        pending: list[CreateUserInput] = []
+        for item in input_data.users:
+            if item.email not in taken:
+                taken.add(item.email)
+                pending.append(item)
+
+        hashed_passwords = await password_hasher.hash_many([
+            item.password for item in pending
+        ])
+        created = await self.user_repository.create_many([
+            User(name=item.name, email=item.email, password=hashed_password)
+            for item, hashed_password in zip(pending, hashed_passwords)
+        ])
+
+        created_by_email = {user.email: user for user in created}
+        results = []
+        for item in input_data.users:
+            # pop: só a primeira ocorrência de um email é a criada
+            user = created_by_email.pop(item.email, None)
+            if user is not None:
+                authenticated_user_cache.on_user_created(user)
+            results.append(CreateUsersBulkResult(email=item.email, user=user))
+
+        # Uma versão nova basta para o lote inteiro
+        if created and self.list_cache is not None:
+            await self.list_cache.invalidate()
+
+        return CreateUsersBulkOutput(results=results)
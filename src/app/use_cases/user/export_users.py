@@ -0,0 +1,26 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from app.domain.entities.user import UserReadModel
+from app.domain.repositories.user_repository import UserRepository
+from app.use_cases.interfaces.use_case import UseCase
+
+
+@dataclass
+class ExportUsersInput:
+    batch_size: int = 1000
+
+
+@dataclass
+class ExportUsersOutput:
+    users: AsyncIterator[UserReadModel]
+
+
+class ExportUsersUseCase(UseCase[ExportUsersInput, ExportUsersOutput]):
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    async def execute(self, input_data: ExportUsersInput) -> ExportUsersOutput:
+        return ExportUsersOutput(
+            users=self.user_repository.stream(input_data.batch_size)
+        )
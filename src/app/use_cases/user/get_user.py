@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 
-from app.domain.entities.user import User
+from app.domain.entities.user import UserReadModel
 from app.domain.repositories.user_repository import UserRepository
 from app.use_cases.interfaces.use_case import UseCase
 
@@ -14,7 +14,7 @@ class GetUserInput:
 
 @dataclass
 class GetUserOutput:
-    user: Optional[User]
+    user: Optional[UserReadModel]
 
 
 class GetUserUseCase(UseCase[GetUserInput, GetUserOutput]):
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from app.domain.repositories.user_repository import (
+    UserRepository,
+    UserVersion,
+)
+from app.use_cases.interfaces.use_case import UseCase
+
+
+@dataclass
+class GetUserVersionInput:
+    user_id: UUID
+
+
+@dataclass
+class GetUserVersionOutput:
+    version: Optional[UserVersion]
+
+
+class GetUserVersionUseCase(
+    UseCase[GetUserVersionInput, GetUserVersionOutput]
+):
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    async def execute(
+        self, input_data: GetUserVersionInput
+    ) -> GetUserVersionOutput:
+        version = await self.user_repository.find_version(input_data.user_id)
+
+        return GetUserVersionOutput(version=version)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from typing import Optional
 
-from app.domain.entities.user import User
+from app.constants import CountMode
+from app.domain.entities.user import UserReadModel
 from app.domain.repositories.user_repository import UserRepository
 from app.use_cases.interfaces.use_case import UseCase
 
@@ -9,13 +11,23 @@ from app.use_cases.interfaces.use_case import UseCase
 class ListUsersInput:
     page: int
     page_size: int
+    count_mode: CountMode = CountMode.EXACT
 
 
 @dataclass
 class ListUsersOutput:
-    users: list[User]
-    total: int
-    total_pages: int
+    users: list[UserReadModel]
+    total: Optional[int]
+    total_pages: Optional[int]
+
+
+def page_total(total: int, page: int, page_size: int, rows: int) -> int:
+    """
+    Uma estimativa nunca deve ser menor que as linhas já vistas
+    """
+    if rows:
+        return max(total, (page - 1) * page_size + rows)
+    return total
 
 
 class ListUsersUseCase(UseCase[ListUsersInput, ListUsersOutput]):
@@ -26,7 +38,16 @@ class ListUsersUseCase(UseCase[ListUsersInput, ListUsersOutput]):
         users = await self.user_repository.index(
             input_data.page, input_data.page_size
         )
-        total = len(users)
+
+        if input_data.count_mode == CountMode.NONE:
+            return ListUsersOutput(users=users, total=None, total_pages=None)
+
+        total = await self.user_repository.count(
+            estimated=input_data.count_mode == CountMode.ESTIMATED
+        )
+        total = page_total(
+            total, input_data.page, input_data.page_size, len(users)
+        )
 
         total_pages = total // input_data.page_size
         if total % input_data.page_size != 0:
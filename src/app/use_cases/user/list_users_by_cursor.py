@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.entities.user import UserReadModel
+from app.domain.repositories.user_repository import UserCursor, UserRepository
+from app.use_cases.interfaces.use_case import UseCase
+
+
+@dataclass
+class ListUsersByCursorInput:
+    page_size: int
+    cursor: Optional[UserCursor] = None
+    backwards: bool = False
+
+
+@dataclass
+class ListUsersByCursorOutput:
+    users: list[UserReadModel]
+    next_cursor: Optional[UserCursor] = None
+    prev_cursor: Optional[UserCursor] = None
+
+
+class ListUsersByCursorUseCase(
+    UseCase[ListUsersByCursorInput, ListUsersByCursorOutput]
+):
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    async def execute(
+        self, input_data: ListUsersByCursorInput
+    ) -> ListUsersByCursorOutput:
+        # Busca um registro a mais para saber se existe outra página
+        users = await self.user_repository.index_by_cursor(
+            input_data.page_size + 1,
+            cursor=input_data.cursor,
+            backwards=input_data.backwards,
+        )
+        has_more = len(users) > input_data.page_size
+
+        if not users:
+            # Voltando além do primeiro registro: a página fica vazia, mas o
+            # cliente ainda pode seguir adiante a partir do mesmo ponto
+            if input_data.backwards:
+                return ListUsersByCursorOutput(
+                    users=[], next_cursor=input_data.cursor
+                )
+            return ListUsersByCursorOutput(users=[])
+
+        if input_data.backwards:
+            users = users[-input_data.page_size :]
+            has_next = True
+            has_prev = has_more
+        else:
+            users = users[: input_data.page_size]
+            has_next = has_more
+            has_prev = input_data.cursor is not None
+
+        return ListUsersByCursorOutput(
+            users=users,
+            next_cursor=UserCursor.from_user(users[-1]) if has_next else None,
+            prev_cursor=UserCursor.from_user(users[0]) if has_prev else None,
+        )
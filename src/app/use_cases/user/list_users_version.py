@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.constants import CountMode
+from app.domain.repositories.user_repository import (
+    UserRepository,
+    UserVersion,
+)
+from app.use_cases.interfaces.use_case import UseCase
+from app.use_cases.user.list_users import ListUsersInput, page_total
+
+
+@dataclass
+class ListUsersVersionOutput:
+    versions: list[UserVersion]
+    total: Optional[int]
+
+
+class ListUsersVersionUseCase(UseCase[ListUsersInput, ListUsersVersionOutput]):
+    """
+    Mesma página de ListUsersUseCase, mas só com id e updated_at: suficiente
+    para saber se a página mudou
+    """
+
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    async def execute(
+        self, input_data: ListUsersInput
+    ) -> ListUsersVersionOutput:
+        versions = await self.user_repository.index_versions(
+            input_data.page, input_data.page_size
+        )
+
+        if input_data.count_mode == CountMode.NONE:
+            return ListUsersVersionOutput(versions=versions, total=None)
+
+        total = await self.user_repository.count(
+            estimated=input_data.count_mode == CountMode.ESTIMATED
+        )
+        return ListUsersVersionOutput(
+            versions=versions,
+            total=page_total(
+                total, input_data.page, input_data.page_size, len(versions)
+            ),
+        )
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+from app.domain.entities.user import UserReadModel
+from app.domain.repositories.user_repository import UserRepository
+from app.use_cases.interfaces.use_case import UseCase
+
+
+@dataclass
+class SearchUsersInput:
+    query: str
+    limit: int = 20
+
+
+@dataclass
+class SearchUsersOutput:
+    users: list[UserReadModel]
+
+
+class SearchUsersUseCase(UseCase[SearchUsersInput, SearchUsersOutput]):
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    async def execute(self, input_data: SearchUsersInput) -> SearchUsersOutput:
+        # Só espaços viraria um LIKE '%' sobre a tabela inteira
+        if not input_data.query.strip():
+            return SearchUsersOutput(users=[])
+
+        users = await self.user_repository.search(
+            input_data.query, input_data.limit
+        )
+        return SearchUsersOutput(users=users)
@@ -7,7 +7,7 @@ from sqlalchemy.pool import NullPool
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.domain import entities
-from app.infrastructure.config.database import get_session
+from app.infrastructure.config.database import get_session, get_sessionmaker
 from app.infrastructure.config.settings import settings
 from app.main import app
 
@@ -52,7 +52,14 @@ async def client(db_session) -> AsyncGenerator[TestClient, None]:
     async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
+    # Sessões abertas fora da requisição (a busca por id em lote) usam a
+    # mesma conexão, dentro da transação do teste
+    sessionmaker = async_sessionmaker(
+        bind=db_session.bind, class_=AsyncSession, expire_on_commit=False
+    )
+
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_sessionmaker] = lambda: sessionmaker
 
     with TestClient(app) as test_client:
         yield test_client
@@ -0,0 +1,22 @@
+import pytest
+
+from app.main import app
+from benchmarks import endpoints  # noqa: F401
+from benchmarks.runner import Benchmark, measure, select
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_endpoints_suite_runs_once():
+    benchmarks = select(['endpoints'])
+    assert benchmarks
+
+    try:
+        for bench in benchmarks:
+            # Uma execução de cada: falha se alguma requisição não for 2xx
+            result = await measure(
+                Benchmark(bench.name, bench.setup, number=1, repeat=1)
+            )
+            assert result.number == 1
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,49 @@
+import argparse
+
+import pytest
+
+from benchmarks.load import RouteStats, parse_mix
+
+
+@pytest.mark.order(1)
+def test_route_stats_summary():
+    elapsed = 2.0
+    stats = RouteStats(latencies=[i / 1000 for i in range(1, 101)], errors=5)
+    stats.statuses[200] = 95
+    stats.statuses[500] = 5
+
+    summary = stats.summary(elapsed)
+
+    expected_requests, expected_p99, expected_max = 100, 100.0, 100.0
+    assert summary['requests'] == expected_requests
+    assert summary['rps'] == expected_requests / elapsed
+    assert summary['error_rate'] == stats.errors / expected_requests
+    assert summary['p50_ms'] == pytest.approx(51.0)
+    assert summary['p99_ms'] == pytest.approx(expected_p99)
+    assert summary['max_ms'] == pytest.approx(expected_max)
+    assert summary['statuses'] == {200: 95, 500: 5}
+
+
+@pytest.mark.order(2)
+def test_route_stats_histogram_buckets():
+    stats = RouteStats(latencies=[0.0005, 0.003, 0.003, 0.25, 9.0])
+
+    histogram = stats.histogram()
+
+    assert histogram['<=1ms'] == 1
+    assert histogram['<=5ms'] == len([0.003, 0.003])
+    assert histogram['<=500ms'] == 1
+    assert histogram['>max'] == 1
+    assert sum(histogram.values()) == stats.requests
+
+
+@pytest.mark.order(3)
+def test_parse_mix():
+    weight = 10
+    assert parse_mix(f'get_user={weight},login') == {
+        'get_user': weight,
+        'login': 1,
+    }
+
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_mix('delete_user=1')
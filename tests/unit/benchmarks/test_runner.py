@@ -0,0 +1,71 @@
+import pytest
+
+from benchmarks.runner import (
+    BASELINES_DIR,
+    Benchmark,
+    BenchmarkResult,
+    compare,
+    load,
+    measure,
+    resolve_path,
+    save,
+)
+
+
+def _result(median_us: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        number=1, repeat=1, median_us=median_us, min_us=median_us, max_us=1
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_measure_supports_sync_and_async_targets():
+    calls = []
+
+    async def async_setup():
+        async def target():
+            calls.append('async')
+
+        return target
+
+    number, repeat = 3, 2
+
+    sync_result = await measure(
+        Benchmark(
+            'micro.sync', lambda: lambda: calls.append('sync'), number, repeat
+        )
+    )
+    async_result = await measure(
+        Benchmark('micro.async', async_setup, number, repeat)
+    )
+
+    # 1 chamada de aquecimento + number * repeat
+    assert calls.count('sync') == calls.count('async') == 1 + number * repeat
+    assert sync_result.number == async_result.number == number
+    assert sync_result.min_us <= sync_result.median_us <= sync_result.max_us
+
+
+@pytest.mark.order(2)
+def test_compare_flags_regressions_above_threshold(tmp_path):
+    path = tmp_path / 'baseline.json'
+    save({'micro.a': _result(100), 'micro.b': _result(100)}, path)
+
+    comparisons = compare(
+        load(path),
+        {
+            'micro.a': _result(109),
+            'micro.b': _result(111),
+            'micro.c': _result(1),
+        },
+    )
+
+    assert [item.name for item in comparisons] == ['micro.a', 'micro.b']
+    assert not comparisons[0].is_regression(0.10)
+    assert comparisons[1].is_regression(0.10)
+
+
+@pytest.mark.order(3)
+def test_resolve_path_accepts_names_and_paths():
+    assert resolve_path('main') == BASELINES_DIR / 'main.json'
+    assert str(resolve_path('/tmp/run.json')) == '/tmp/run.json'
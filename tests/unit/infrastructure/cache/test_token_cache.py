@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+import pytest
+from freezegun import freeze_time
+
+from app.infrastructure.cache.token_cache import VerifiedTokenCache
+from app.infrastructure.security.jwt import (
+    create_access_token,
+    decode_access_token,
+)
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+@pytest.mark.order(1)
+def test_verified_token_cache_get_and_set():
+    cache = VerifiedTokenCache(max_size=10, ttl=3600)
+    token = create_access_token(str(user_mock.id))
+    payload = decode_access_token(token)
+
+    assert cache.get(token) is None
+
+    cache.set(token, payload)
+
+    assert cache.get(token) == payload
+    assert cache.get(token + 'x') is None
+
+
+@pytest.mark.order(2)
+def test_verified_token_cache_expires_with_token():
+    cache = VerifiedTokenCache(max_size=10, ttl=3600)
+
+    with freeze_time() as frozen:
+        token = create_access_token(
+            str(user_mock.id), expires_delta=timedelta(seconds=30)
+        )
+        cache.set(token, decode_access_token(token))
+
+        frozen.tick(timedelta(seconds=29))
+        assert cache.get(token) is not None
+
+        frozen.tick(timedelta(seconds=2))
+        assert cache.get(token) is None
@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+import pytest
+from freezegun import freeze_time
+
+from app.infrastructure.cache.ttl_cache import TTLCache
+
+
+@pytest.mark.order(1)
+def test_ttl_cache_get_and_set():
+    cache = TTLCache(max_size=2, ttl=10)
+
+    assert cache.get('a') is None
+
+    cache.set('a', 1)
+
+    assert cache.get('a') == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_ratio == 0.5  # noqa: PLR2004
+
+
+@pytest.mark.order(2)
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(max_size=2, ttl=10)
+
+    with freeze_time() as frozen:
+        cache.set('a', 1)
+        cache.set('b', 2, ttl=60)
+
+        frozen.tick(timedelta(seconds=11))
+
+        assert cache.get('a') is None
+        assert cache.get('b') == 2  # noqa: PLR2004
+        assert len(cache) == 1
+
+
+@pytest.mark.order(3)
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=10)
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3  # noqa: PLR2004
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.order(4)
+def test_ttl_cache_delete_and_clear():
+    cache = TTLCache(max_size=2, ttl=10)
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.delete('a')
+
+    assert cache.get('a') is None
+
+    cache.clear()
+
+    assert len(cache) == 0
@@ -0,0 +1,173 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from freezegun import freeze_time
+from prometheus_client import REGISTRY
+
+from app.infrastructure.cache.user_list_cache import (
+    CachedPage,
+    PostgresVersionStore,
+    UserListCache,
+)
+from tests.conftest import test_engine
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+page = CachedPage(body=b'{}', etag='W/"1"', last_modified=None)
+
+
+def _lookups(result: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            'cache_lookups_total', {'cache': 'user_list', 'result': result}
+        )
+        or 0.0
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_user_list_cache_get_and_set():
+    cache = UserListCache(max_size=10, ttl=60)
+    hits, misses = _lookups('hit'), _lookups('miss')
+    key = await cache.key(1, 10)
+
+    assert cache.get(key) is None
+
+    cache.set(key, page)
+
+    assert cache.get(await cache.key(1, 10)) == page
+    assert cache.get(await cache.key(2, 10)) is None
+    assert cache.stats.hit_ratio == pytest.approx(1 / 3)
+    assert _lookups('hit') == hits + 1
+    assert _lookups('miss') == misses + 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_user_list_cache_writes_change_version():
+    cache = UserListCache(max_size=10, ttl=60)
+    key = await cache.key(1, 10)
+    cache.set(key, page)
+
+    await cache.on_user_created(user_mock)
+    assert cache.get(await cache.key(1, 10)) is None
+
+    # Uma chave obtida antes da escrita continua na versão antiga
+    cache.set(key, page)
+    assert cache.get(await cache.key(1, 10)) is None
+
+    for bump in (cache.on_user_updated, cache.on_user_deleted):
+        current = await cache.key(1, 10)
+        cache.set(current, page)
+        await bump(uuid4())
+        assert cache.get(await cache.key(1, 10)) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_user_list_cache_bounds():
+    cache = UserListCache(max_size=1, ttl=5)
+
+    with freeze_time() as frozen:
+        cache.set(await cache.key(1), page)
+        cache.set(await cache.key(2), page)
+
+        assert cache.get(await cache.key(1)) is None
+        assert cache.get(await cache.key(2)) == page
+
+        frozen.tick(timedelta(seconds=6))
+        assert cache.get(await cache.key(2)) is None
+
+    assert UserListCache(max_size=0, ttl=5).enabled is False
+    assert UserListCache(max_size=10, ttl=0).enabled is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_postgres_version_is_shared_between_workers(create_tables):
+    name = f'users-{uuid4()}'
+    # Dois caches com stores próprios, como dois workers
+    first = UserListCache(
+        max_size=10, ttl=60, versions=PostgresVersionStore(test_engine, name)
+    )
+    second = UserListCache(
+        max_size=10, ttl=60, versions=PostgresVersionStore(test_engine, name)
+    )
+
+    assert await first.versions.current() == 0
+    key = await second.key(1, 10)
+    second.set(key, page)
+
+    await first.on_user_created(user_mock)
+
+    assert await first.versions.current() == 1
+    assert second.get(await second.key(1, 10)) is None
+    await first.invalidate()
+    assert await second.versions.current() == 2  # noqa: PLR2004
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_postgres_version_is_kept_per_worker_for_ttl(create_tables):
+    name = f'users-{uuid4()}'
+    clock = Clock()
+    ttl = 1
+    first, second = (
+        PostgresVersionStore(test_engine, name, ttl=ttl, clock=clock),
+        PostgresVersionStore(test_engine, name, ttl=ttl, clock=clock),
+    )
+    queries = []
+    second.engine = SimpleNamespace(
+        connect=lambda: queries.append(1) or test_engine.connect()
+    )
+
+    assert await second.current() == 0
+    await first.bump()
+
+    # Quem escreveu vê a versão nova na hora; o outro worker só depois do TTL
+    assert await first.current() == 1
+    assert await second.current() == 0
+    assert len(queries) == 1
+
+    clock.now += ttl
+    assert await second.current() == 1
+    assert len(queries) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(6)
+async def test_user_list_cache_skips_pages_read_after_a_write(create_tables):
+    window = 5
+    clock = Clock()
+    versions = PostgresVersionStore(
+        test_engine,
+        f'users-{uuid4()}',
+        read_after_write_window=window,
+        clock=clock,
+    )
+    cache = UserListCache(max_size=10, ttl=60, versions=versions)
+
+    cache.set(await cache.key(1, 10), page)
+    assert cache.get(await cache.key(1, 10)) == page
+
+    await cache.on_user_created(user_mock)
+
+    # A página pode ter vindo de uma réplica que ainda não tem a escrita
+    key = await cache.key(1, 10)
+    cache.set(key, page)
+    assert cache.get(key) is None
+
+    clock.now += window
+    cache.set(key, page)
+    assert cache.get(key) == page
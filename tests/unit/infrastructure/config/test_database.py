@@ -0,0 +1,78 @@
+from contextlib import nullcontext
+
+import pytest
+
+from app.infrastructure.config import database
+from app.infrastructure.config.settings import settings
+
+
+@pytest.mark.order(1)
+def test_engine_pool_uses_settings():
+    pool = database.engine.pool
+
+    assert pool.size() == settings.DB_POOL_SIZE
+    assert pool._max_overflow == settings.DB_MAX_OVERFLOW
+    assert pool._timeout == settings.DB_POOL_TIMEOUT
+    assert pool._recycle == settings.DB_POOL_RECYCLE
+    assert pool._pre_ping == settings.DB_POOL_PRE_PING
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_get_session_reuses_sessionmaker(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('sessionmaker must be built once per process')
+
+    monkeypatch.setattr(database, 'async_sessionmaker', fail)
+
+    async for session in database.get_session():
+        assert isinstance(session, database.AsyncSession)
+        assert session.bind is database.engine
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_get_read_session_without_replicas_uses_primary(monkeypatch):
+    monkeypatch.setattr(database, 'replica_sessions', [])
+    primary = object()
+
+    assert database.get_read_sessionmaker(database.async_session) is (
+        database.async_session
+    )
+    async for session in database.get_read_session(primary, object()):
+        assert session is primary
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_get_read_sessionmaker_round_robins_replicas(monkeypatch):
+    replicas = [
+        lambda: nullcontext('replica-a'),
+        lambda: nullcontext('replica-b'),
+    ]
+    monkeypatch.setattr(database, 'replica_sessions', replicas)
+
+    used = [
+        session
+        for _ in range(4)
+        async for session in database.get_read_session(
+            object(), database.get_read_sessionmaker(database.async_session)
+        )
+    ]
+
+    assert used[0] != used[1]
+    assert used[:2] == used[2:]
+
+
+@pytest.mark.order(5)
+def test_replica_urls_are_split_by_comma():
+    parsed = settings.model_validate({
+        'DATABASE_URL': settings.DATABASE_URL,
+        'JWT_SECRET': settings.JWT_SECRET,
+        'DATABASE_REPLICA_URLS': 'postgresql://a/db, postgresql://b/db,',
+    })
+
+    assert parsed.DATABASE_REPLICA_URLS == [
+        'postgresql://a/db',
+        'postgresql://b/db',
+    ]
@@ -0,0 +1,80 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.config import database
+from app.infrastructure.metrics.database import (
+    instrument_engine,
+    instrumented_pool_class,
+    statement_type,
+)
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.order(1)
+def test_statement_type():
+    assert statement_type('  select 1') == 'SELECT'
+    assert statement_type('INSERT INTO tb_users VALUES (1)') == 'INSERT'
+    assert statement_type('SHOW standard_conforming_strings') == 'OTHER'
+    assert statement_type('') == 'OTHER'
+
+
+@pytest.mark.order(2)
+def test_engine_uses_instrumented_pool():
+    assert type(database.engine.pool).__name__ == 'InstrumentedPool'
+
+
+@pytest.mark.order(3)
+def test_instrument_engine_tracks_pool_and_queries():
+    pool_size = 1
+    engine = create_async_engine(
+        database.settings.DATABASE_URL,
+        pool_size=pool_size,
+        poolclass=instrumented_pool_class('test_db'),
+    )
+    instrument_engine(engine, 'test_db', pool_size)
+    pool_dispatch = engine.sync_engine.pool.dispatch
+    engine_dispatch = engine.sync_engine.dispatch
+    queries_before = _sample(
+        'db_query_duration_seconds_count',
+        database='test_db',
+        statement='SELECT',
+    )
+
+    pool_dispatch.checkout(None, None, None)
+    pool_dispatch.checkout(None, None, None)
+    checked_out = 2
+    assert (
+        _sample('db_pool_checked_out_connections', database='test_db')
+        == checked_out
+    )
+    assert (
+        _sample('db_pool_overflow_connections', database='test_db')
+        == checked_out - pool_size
+    )
+
+    pool_dispatch.checkin(None, None)
+    assert _sample('db_pool_checked_out_connections', database='test_db') == 1
+    assert _sample('db_pool_overflow_connections', database='test_db') == 0
+
+    class Context:
+        pass
+
+    context = Context()
+    engine_dispatch.before_cursor_execute(
+        None, None, 'SELECT 1', {}, context, False
+    )
+    engine_dispatch.after_cursor_execute(
+        None, None, 'SELECT 1', {}, context, False
+    )
+    assert (
+        _sample(
+            'db_query_duration_seconds_count',
+            database='test_db',
+            statement='SELECT',
+        )
+        == queries_before + 1
+    )
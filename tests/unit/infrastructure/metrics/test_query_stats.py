@@ -0,0 +1,93 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.metrics import query_stats
+from app.infrastructure.metrics.query_stats import (
+    assert_max_queries,
+    parameters_shape,
+    record_query,
+    track_queries,
+)
+
+
+@pytest.mark.order(1)
+def test_parameters_shape_hides_values():
+    assert (
+        parameters_shape({'email': 'maria@example.com', 'limit': 1})
+        == '{email: str, limit: int}'
+    )
+    assert parameters_shape(('a', 1)) == '(str, int)'
+    assert parameters_shape([{'id': 1}, {'id': 2}]) == '2 x {id: int}'
+    assert parameters_shape(None) == 'NoneType'
+
+    many = {f'name__{i}': 'x' for i in range(12)}
+    assert parameters_shape(many).endswith(', +2}')
+
+
+@pytest.mark.order(2)
+def test_record_query_counts_nested_trackers():
+    seconds = 0.01
+    with track_queries() as outer:
+        record_query('SELECT 1', {}, seconds)
+        with track_queries() as inner:
+            record_query('SELECT 2', {}, seconds)
+
+    expected_outer = 2
+    assert inner.queries == 1
+    assert outer.queries == expected_outer
+    assert outer.seconds == pytest.approx(seconds * expected_outer)
+    assert outer.statements == ['SELECT 1', 'SELECT 2']
+
+
+@pytest.mark.order(3)
+def test_record_query_outside_request_is_ignored():
+    record_query('SELECT 1', {}, 0.0)
+
+
+@pytest.mark.order(4)
+def test_slow_query_is_logged_with_route(monkeypatch, caplog):
+    threshold = 0.1
+    monkeypatch.setattr(
+        query_stats.settings, 'DB_SLOW_QUERY_THRESHOLD', threshold
+    )
+    scope = {
+        'path': '/v1/users/1/',
+        'route': SimpleNamespace(path_format='/v1/users/{user_id}/'),
+    }
+
+    with (
+        caplog.at_level(logging.WARNING, logger=query_stats.__name__),
+        track_queries(scope),
+    ):
+        record_query('SELECT 1', {}, threshold / 2)
+        record_query(
+            'SELECT *\n  FROM tb_users WHERE email = %(email)s',
+            {'email': 'maria@example.com'},
+            threshold,
+        )
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert '/v1/users/{user_id}/' in message
+    assert 'SELECT * FROM tb_users WHERE email' in message
+    assert '{email: str}' in message
+    assert 'maria@example.com' not in message
+
+
+@pytest.mark.order(5)
+def test_assert_max_queries():
+    budget = 2
+    with assert_max_queries(budget) as stats:
+        record_query('SELECT 1', {}, 0.0)
+        record_query('SELECT 2', {}, 0.0)
+    assert stats.queries == budget
+
+    def over_budget():
+        with assert_max_queries(budget):
+            for _ in range(budget + 1):
+                record_query('SELECT 1', {}, 0.0)
+
+    with pytest.raises(AssertionError, match='3 queries executadas'):
+        over_budget()
@@ -0,0 +1,200 @@
+import asyncio
+import contextvars
+from contextlib import nullcontext
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.user import User
+from app.infrastructure.repositories.coalescing_user_repository import (
+    CoalescingUserRepository,
+    UserByIdLoader,
+    user_by_id_loader_for,
+)
+from app.infrastructure.repositories.sqlmodel_user_repository import (
+    SqlModelUserRepository,
+)
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+def _user() -> User:
+    return User(
+        id=uuid4(),
+        name=user_mock.name,
+        email=user_mock.email,
+        password=user_mock.password,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_concurrent_lookups_for_same_id_share_one_query():
+    user = _user()
+    fetch = AsyncMock(return_value=[user])
+    loader = UserByIdLoader(fetch)
+
+    lookups = 5
+
+    results = await asyncio.gather(
+        *(loader.load(user.id) for _ in range(lookups))
+    )
+
+    assert results == [user] * lookups
+    fetch.assert_awaited_once_with([user.id])
+    assert loader.stats.lookups == lookups
+    assert loader.stats.queries == 1
+    assert loader.stats.coalesced == lookups - 1
+    assert loader.stats.queries_saved == lookups - 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_lookups_in_same_tick_are_batched():
+    first, second = _user(), _user()
+    missing_id = uuid4()
+    fetch = AsyncMock(return_value=[first, second])
+    loader = UserByIdLoader(fetch)
+
+    results = await asyncio.gather(
+        loader.load(first.id),
+        loader.load(second.id),
+        loader.load(missing_id),
+    )
+
+    user_ids = [first.id, second.id, missing_id]
+    assert results == [first, second, None]
+    fetch.assert_awaited_once_with(user_ids)
+    assert loader.stats.batched == len(user_ids) - 1
+
+    fetch.reset_mock()
+    await loader.load(first.id)
+    fetch.assert_awaited_once_with([first.id])
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_lookup_joins_query_already_in_flight():
+    user = _user()
+    release = asyncio.Event()
+
+    async def fetch(user_ids):
+        await release.wait()
+        return [user]
+
+    loader = UserByIdLoader(fetch)
+    first = asyncio.ensure_future(loader.load(user.id))
+    await asyncio.sleep(0.01)
+    second = asyncio.ensure_future(loader.load(user.id))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first is user
+    assert await second is user
+    assert loader.stats.queries == 1
+    assert loader.stats.coalesced == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_query_error_reaches_every_waiter():
+    user_id = uuid4()
+    loader = UserByIdLoader(AsyncMock(side_effect=RuntimeError('db down')))
+
+    results = await asyncio.gather(
+        loader.load(user_id), loader.load(user_id), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert loader._in_flight == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_repository_reads_directly_after_a_write():
+    user = _user()
+    inner = AsyncMock()
+    inner.create.return_value = user
+    inner.find_by_id.return_value = user
+    loader = UserByIdLoader(AsyncMock(return_value=[user]))
+    repository = CoalescingUserRepository(inner, loader)
+
+    assert await repository.find_by_id(user.id) is user
+    inner.find_by_id.assert_not_called()
+
+    await repository.create(user)
+    assert await repository.find_by_id(user.id) is user
+    inner.find_by_id.assert_awaited_once_with(user.id)
+    assert loader.stats.lookups == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(6)
+async def test_repository_delegates_other_methods():
+    inner = AsyncMock()
+    repository = CoalescingUserRepository(inner, UserByIdLoader(AsyncMock()))
+
+    await repository.find_by_email(user_mock.email)
+    await repository.index(1, 10)
+    await repository.count(estimated=True)
+    await repository.index_versions(1, 10)
+    await repository.find_version(user_mock.id)
+    await repository.search('ana', 5)
+
+    inner.find_by_email.assert_awaited_once_with(user_mock.email)
+    inner.index.assert_awaited_once_with(1, 10)
+    inner.count.assert_awaited_once_with(True)
+    inner.index_versions.assert_awaited_once_with(1, 10)
+    inner.find_version.assert_awaited_once_with(user_mock.id)
+    inner.search.assert_awaited_once_with('ana', 5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(7)
+async def test_update_password_counts_as_write():
+    user = _user()
+    inner = AsyncMock()
+    inner.find_by_id.return_value = user
+    repository = CoalescingUserRepository(inner, UserByIdLoader(AsyncMock()))
+
+    await repository.update_password(user.id, 'novo-hash')
+    await repository.find_by_id(user.id)
+
+    inner.update_password.assert_awaited_once_with(user.id, 'novo-hash')
+    inner.find_by_id.assert_awaited_once_with(user.id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(8)
+async def test_batch_runs_outside_the_callers_context():
+    request_id = contextvars.ContextVar('request_id', default=None)
+    seen = []
+
+    async def fetch(user_ids):
+        seen.append(request_id.get())
+        return []
+
+    loader = UserByIdLoader(fetch)
+    request_id.set('first-request')
+
+    assert await loader.load(uuid4()) is None
+    assert seen == [None]
+    assert request_id.get() == 'first-request'
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(9)
+async def test_loader_for_uses_the_given_sessionmaker(db_session):
+    def sessionmaker():
+        return nullcontext(db_session)
+
+    created = await SqlModelUserRepository(db_session).create(_user())
+    loader = user_by_id_loader_for(sessionmaker)
+
+    assert user_by_id_loader_for(sessionmaker) is loader
+    found = await loader.load(created.id)
+
+    assert found is not None
+    assert found.id == created.id
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.domain.entities.refresh_token import RefreshToken
+from app.infrastructure.repositories.in_memory_refresh_token_repository import (  # noqa: E501
+    InMemoryRefreshTokenRepository,
+)
+
+
+def _in(days: int) -> datetime:
+    return datetime.now(ZoneInfo('UTC')) + timedelta(days=days)
+
+
+async def _issue(repository, days=30) -> RefreshToken:
+    return await repository.create(
+        RefreshToken(
+            user_id=uuid4(),
+            family_id=uuid4(),
+            token_hash='a' * 64,
+            expires_at=_in(days),
+        )
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_rotate_refresh_token():
+    repository = InMemoryRefreshTokenRepository()
+    token = await _issue(repository)
+
+    rotated = await repository.rotate(token.token_hash, 'b' * 64, _in(30))
+
+    assert rotated is not None
+    assert rotated.id is not None
+    assert rotated.user_id == token.user_id
+    assert rotated.family_id == token.family_id
+    assert token.revoked_at is not None
+    assert await repository.rotate(token.token_hash, 'c' * 64, _in(30)) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_rotate_expired_or_unknown_refresh_token():
+    repository = InMemoryRefreshTokenRepository()
+    token = await _issue(repository, days=-1)
+
+    assert await repository.rotate(token.token_hash, 'b' * 64, _in(30)) is None
+    assert await repository.rotate('x' * 64, 'c' * 64, _in(30)) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_revoke_family():
+    repository = InMemoryRefreshTokenRepository()
+    token = await _issue(repository)
+    rotated = await repository.rotate(token.token_hash, 'b' * 64, _in(30))
+
+    await repository.revoke_family(token.family_id)
+
+    assert rotated.revoked_at is not None
+    found = await repository.find_by_hash('b' * 64)
+    assert found is rotated
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_rotate_keeps_only_active_tokens():
+    repository = InMemoryRefreshTokenRepository()
+    token = await _issue(repository)
+
+    await repository.rotate(token.token_hash, 'b' * 64, _in(30))
+
+    assert list(repository._by_hash) == ['b' * 64]
+    # O token usado continua encontrável até expirar, para detectar reuso
+    found = await repository.find_by_hash(token.token_hash)
+    assert found is token
+    assert found.revoked_at is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_create_prunes_expired_and_oldest_tokens():
+    repository = InMemoryRefreshTokenRepository(max_tokens=2)
+    expired = await _issue(repository, days=-1)
+
+    for i in range(3):
+        await repository.create(
+            RefreshToken(
+                user_id=uuid4(),
+                family_id=uuid4(),
+                token_hash=str(i) * 64,
+                expires_at=_in(30),
+            )
+        )
+
+    assert await repository.find_by_hash(expired.token_hash) is None
+    assert list(repository._by_hash) == ['1' * 64, '2' * 64]
@@ -0,0 +1,234 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.user import User, UserReadModel
+from app.domain.repositories.user_repository import UserCursor, UserVersion
+from app.infrastructure.repositories.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+from tests.mocks.user import User as UserMock
+
+user_mock = UserMock()
+
+
+async def _seed(repository: InMemoryUserRepository, total: int) -> list[User]:
+    start = datetime(2024, 1, 1)
+    # Inseridos fora de ordem: o índice deve ordenar por (created_at, id)
+    users = [
+        User(
+            email=f'user{i}.{user_mock.email}',
+            password=user_mock.password,
+            name=f'{user_mock.name} {i}',
+            created_at=start + timedelta(minutes=i),
+        )
+        for i in reversed(range(total))
+    ]
+    await repository.create_many(users)
+    return sorted(users, key=lambda user: user.created_at)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_create_and_find():
+    repository = InMemoryUserRepository()
+    created = await repository.create(
+        User(
+            email=user_mock.email,
+            password=user_mock.password,
+            name=user_mock.name,
+        )
+    )
+
+    assert created.id is not None
+    assert await repository.find_by_email(user_mock.email) is created
+    assert await repository.find_by_email(user_mock.email.upper()) is None
+    assert await repository.find_by_id(created.id) == UserReadModel(
+        id=created.id,
+        name=created.name,
+        email=created.email,
+        created_at=created.created_at,
+        updated_at=created.updated_at,
+    )
+    assert await repository.find_by_id(uuid4()) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_email_is_unique_with_exact_case():
+    # Mesma regra do unique(email) do Postgres: a caixa diferencia emails
+    repository = InMemoryUserRepository()
+    await repository.create(
+        User(email=user_mock.email, password='hash', name=user_mock.name)
+    )
+
+    duplicated = await repository.create(
+        User(email=user_mock.email, password='hash', name='Outro')
+    )
+    created = await repository.create_many([
+        User(email=user_mock.email, password='hash', name='Outro'),
+        User(email=f'new.{user_mock.email}', password='hash', name='Novo'),
+        User(email=f'new.{user_mock.email}', password='hash', name='Novo'),
+        User(email=user_mock.email.upper(), password='hash', name='Caixa'),
+    ])
+
+    assert duplicated is None
+    assert [user.email for user in created] == [
+        f'new.{user_mock.email}',
+        user_mock.email.upper(),
+    ]
+    assert len(repository) == len(created) + 1
+    assert (await repository.find_by_email(user_mock.email)).name == (
+        user_mock.name
+    )
+    assert (
+        len(
+            await repository.find_by_emails([
+                user_mock.email,
+                user_mock.email.upper(),
+                f'missing.{user_mock.email}',
+            ])
+        )
+        == 2  # noqa: PLR2004
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_index_and_count_follow_created_at_order():
+    repository = InMemoryUserRepository()
+    users = await _seed(repository, 5)
+
+    first_page = await repository.index(page=1, page_size=2)
+    last_page = await repository.index(page=3, page_size=2)
+
+    assert [user.id for user in first_page] == [users[0].id, users[1].id]
+    assert [user.id for user in last_page] == [users[4].id]
+    assert await repository.count() == len(users)
+    assert await repository.count(estimated=True) == len(users)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_index_by_cursor():
+    repository = InMemoryUserRepository()
+    users = await _seed(repository, 5)
+
+    first_page = await repository.index_by_cursor(limit=2)
+    assert [user.id for user in first_page] == [users[0].id, users[1].id]
+
+    second_page = await repository.index_by_cursor(
+        limit=2, cursor=UserCursor.from_user(first_page[-1])
+    )
+    assert [user.id for user in second_page] == [users[2].id, users[3].id]
+
+    previous_page = await repository.index_by_cursor(
+        limit=2, cursor=UserCursor.from_user(second_page[0]), backwards=True
+    )
+    assert [user.id for user in previous_page] == [users[0].id, users[1].id]
+
+    last_page = await repository.index_by_cursor(limit=2, backwards=True)
+    assert [user.id for user in last_page] == [users[3].id, users[4].id]
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_find_by_ids_and_stream():
+    repository = InMemoryUserRepository()
+    users = await _seed(repository, 3)
+
+    found = await repository.find_by_ids([users[2].id, uuid4(), users[2].id])
+    streamed = [user async for user in repository.stream()]
+
+    assert [user.id for user in found] == [users[2].id]
+    assert [user.id for user in streamed] == [user.id for user in users]
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(6)
+async def test_update_password():
+    repository = InMemoryUserRepository()
+    created = await repository.create(
+        User(
+            email=user_mock.email,
+            password=user_mock.password,
+            name=user_mock.name,
+        )
+    )
+    updated_at = created.updated_at
+
+    await repository.update_password(created.id, 'novo-hash')
+    await repository.update_password(uuid4(), 'ignorado')
+
+    found = await repository.find_by_email(user_mock.email)
+    assert found.password == 'novo-hash'
+    assert found.updated_at >= updated_at
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(7)
+async def test_versions_follow_index():
+    repository = InMemoryUserRepository()
+    users = await _seed(repository, 5)
+
+    versions = await repository.index_versions(page=2, page_size=2)
+    page = await repository.index(page=2, page_size=2)
+
+    assert versions == [UserVersion.from_user(user) for user in page]
+    assert await repository.find_version(users[0].id) == UserVersion(
+        id=users[0].id, updated_at=users[0].updated_at
+    )
+    assert await repository.find_version(uuid4()) is None
+
+
+async def _seed_search(repository) -> None:
+    await repository.create_many([
+        User(email='ana.souza@example.com', password='x', name='Ana Souza'),
+        User(email='bruno@example.com', password='x', name='Bruno Ana'),
+        User(email='mariana@example.com', password='x', name='Mariana Lima'),
+        User(email='ana@example.com', password='x', name='Ana'),
+        User(email='carlos@ana.com', password='x', name='Carlos Lima'),
+        User(email='100%@example.com', password='x', name='Cem Por Cento'),
+    ])
+
+
+def _emails(users) -> list[str]:
+    return [user.email for user in users]
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(8)
+async def test_search():
+    repository = InMemoryUserRepository()
+    await _seed_search(repository)
+
+    # Email igual, email com prefixo, nome com prefixo, palavra do nome e,
+    # por último, o termo no meio do texto
+    assert _emails(await repository.search('ANA', limit=10)) == [
+        'ana@example.com',
+        'ana.souza@example.com',
+        'bruno@example.com',
+        'carlos@ana.com',
+        'mariana@example.com',
+    ]
+    assert _emails(await repository.search('ana', limit=2)) == [
+        'ana@example.com',
+        'ana.souza@example.com',
+    ]
+
+    # Menos de 3 caracteres: só prefixo
+    assert _emails(await repository.search('an', limit=10)) == [
+        'ana@example.com',
+        'ana.souza@example.com',
+    ]
+    assert _emails(await repository.search('lima', limit=10)) == [
+        'carlos@ana.com',
+        'mariana@example.com',
+    ]
+
+    # Curingas do LIKE são buscados literalmente
+    assert _emails(await repository.search('0%@', limit=10)) == [
+        '100%@example.com'
+    ]
+    assert await repository.search('a_a', limit=10) == []
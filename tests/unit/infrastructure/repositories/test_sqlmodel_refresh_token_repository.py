@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.domain.entities.refresh_token import RefreshToken
+from app.domain.entities.user import User
+from app.infrastructure.repositories.sqlmodel_refresh_token_repository import (  # noqa: E501
+    SqlModelRefreshTokenRepository,
+)
+from app.infrastructure.repositories.sqlmodel_user_repository import (
+    SqlModelUserRepository,
+)
+from tests.mocks.user import User as UserMock
+
+
+def _in(days: int) -> datetime:
+    return datetime.now(ZoneInfo('UTC')) + timedelta(days=days)
+
+
+async def _issue(db_session, token_hash='a' * 64, days=30) -> RefreshToken:
+    user_mock = UserMock()
+    await SqlModelUserRepository(db_session).create(
+        User(
+            id=user_mock.id,
+            name=user_mock.name,
+            email=user_mock.email,
+            password=user_mock.password,
+        )
+    )
+    return await SqlModelRefreshTokenRepository(db_session).create(
+        RefreshToken(
+            user_id=user_mock.id,
+            family_id=uuid4(),
+            token_hash=token_hash,
+            expires_at=_in(days),
+        )
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_create_refresh_token(db_session):
+    token = await _issue(db_session)
+
+    assert token.id is not None
+    assert token.revoked_at is None
+
+    repository = SqlModelRefreshTokenRepository(db_session)
+    found = await repository.find_by_hash(token.token_hash)
+
+    assert found is not None
+    assert found.family_id == token.family_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_rotate_refresh_token(db_session):
+    token = await _issue(db_session)
+    repository = SqlModelRefreshTokenRepository(db_session)
+
+    rotated = await repository.rotate(token.token_hash, 'b' * 64, _in(30))
+
+    assert rotated is not None
+    assert rotated.token_hash == 'b' * 64
+    assert rotated.user_id == token.user_id
+    assert rotated.family_id == token.family_id
+    assert rotated.revoked_at is None
+
+    old = await repository.find_by_hash(token.token_hash)
+    assert old.revoked_at is not None
+
+    # O token antigo não pode ser usado de novo
+    assert await repository.rotate(token.token_hash, 'c' * 64, _in(30)) is None
+    assert await repository.find_by_hash('c' * 64) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_rotate_expired_or_unknown_refresh_token(db_session):
+    token = await _issue(db_session, days=-1)
+    repository = SqlModelRefreshTokenRepository(db_session)
+
+    assert await repository.rotate(token.token_hash, 'b' * 64, _in(30)) is None
+    assert await repository.rotate('x' * 64, 'c' * 64, _in(30)) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_revoke_family(db_session):
+    token = await _issue(db_session)
+    repository = SqlModelRefreshTokenRepository(db_session)
+    rotated = await repository.rotate(token.token_hash, 'b' * 64, _in(30))
+
+    await repository.revoke_family(token.family_id)
+
+    found = await repository.find_by_hash(rotated.token_hash)
+    assert found.revoked_at is not None
+    assert (
+        await repository.rotate(rotated.token_hash, 'c' * 64, _in(30)) is None
+    )
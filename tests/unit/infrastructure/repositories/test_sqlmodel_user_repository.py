@@ -1,6 +1,13 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
 import pytest
 
-from app.domain.entities.user import User
+from app.domain.entities.user import User, UserReadModel
+from app.domain.repositories.user_repository import UserCursor, UserVersion
+from app.infrastructure.config.read_after_write import track_writes
+from app.infrastructure.config.settings import settings
 from app.infrastructure.repositories.sqlmodel_user_repository import (
     SqlModelUserRepository,
 )
@@ -78,3 +85,346 @@ async def test_list_users(db_session):
     users = await repository.index(page=2, page_size=10)
 
     assert len(users) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_count_users(db_session):
+    repository = SqlModelUserRepository(db_session)
+
+    assert await repository.count() == 0
+
+    await repository.create(
+        User(
+            email=user_mock.email,
+            password=user_mock.password,
+            name=user_mock.name,
+            id=user_mock.id,
+        )
+    )
+
+    assert await repository.count() == 1
+    assert await repository.count(estimated=True) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_index_by_cursor(db_session):
+    repository = SqlModelUserRepository(db_session)
+    start = datetime(2025, 1, 1)
+    users = [
+        await repository.create(
+            User(
+                id=uuid4(),
+                email=f'{i}.{user_mock.email}',
+                password=user_mock.password,
+                name=user_mock.name,
+                created_at=start + timedelta(minutes=i),
+            )
+        )
+        for i in range(5)
+    ]
+
+    first_page = await repository.index_by_cursor(limit=2)
+    assert [user.id for user in first_page] == [users[0].id, users[1].id]
+
+    second_page = await repository.index_by_cursor(
+        limit=2, cursor=UserCursor.from_user(first_page[-1])
+    )
+    assert [user.id for user in second_page] == [users[2].id, users[3].id]
+
+    previous_page = await repository.index_by_cursor(
+        limit=2, cursor=UserCursor.from_user(second_page[0]), backwards=True
+    )
+    assert [user.id for user in previous_page] == [users[0].id, users[1].id]
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(6)
+async def test_create_many_skips_existing_emails(db_session):
+    repository = SqlModelUserRepository(db_session)
+    existing = await repository.create(
+        User(
+            email=user_mock.email,
+            password=user_mock.password,
+            name=user_mock.name,
+        )
+    )
+
+    created = await repository.create_many([
+        User(email=user_mock.email, password='hash', name=user_mock.name),
+        User(email=f'new.{user_mock.email}', password='hash', name='Novo'),
+    ])
+
+    assert len(created) == 1
+    assert created[0].id is not None
+    assert created[0].email == f'new.{user_mock.email}'
+
+    found = await repository.find_by_emails([
+        user_mock.email,
+        f'new.{user_mock.email}',
+        f'missing.{user_mock.email}',
+    ])
+
+    assert {user.id for user in found} == {existing.id, created[0].id}
+    assert await repository.create_many([]) == []
+    assert await repository.find_by_emails([]) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(7)
+async def test_stream_yields_all_users_in_order(db_session):
+    repository = SqlModelUserRepository(db_session)
+    start = datetime(2024, 1, 1)
+    users = [
+        await repository.create(
+            User(
+                email=f'stream{i}.{user_mock.email}',
+                password=user_mock.password,
+                name=f'{user_mock.name} {i}',
+                created_at=start + timedelta(minutes=i),
+            )
+        )
+        for i in range(5)
+    ]
+
+    streamed = [user async for user in repository.stream(batch_size=2)]
+
+    assert [user.id for user in streamed] == [user.id for user in users]
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(8)
+async def test_create_returns_none_on_email_conflict(db_session):
+    repository = SqlModelUserRepository(db_session)
+    created = await repository.create(
+        User(
+            email=user_mock.email,
+            password=user_mock.password,
+            name=user_mock.name,
+        )
+    )
+
+    duplicated = await repository.create(
+        User(email=user_mock.email, password='hash', name='Outro')
+    )
+
+    assert created is not None
+    assert created.id is not None
+    assert created.created_at is not None
+    assert duplicated is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(9)
+async def test_reads_use_read_session_until_a_write(db_session, monkeypatch):
+    result = MagicMock()
+    result.mappings.return_value.one_or_none.return_value = None
+    read_session = AsyncMock()
+    read_session.exec.return_value = result
+
+    with track_writes() as writer:
+        repository = SqlModelUserRepository(db_session, read_session)
+        await repository.find_by_id(user_mock.id)
+        read_session.exec.assert_awaited_once()
+
+        created = await repository.create(
+            User(
+                email=user_mock.email,
+                password=user_mock.password,
+                name=user_mock.name,
+            )
+        )
+        found = await repository.find_by_id(created.id)
+
+        assert found is not None
+        assert found.id == created.id
+        assert writer.wrote
+        read_session.exec.assert_awaited_once()
+
+    # A requisição seguinte do mesmo cliente traz o instante da escrita e
+    # também lê do primário, até a janela de DB_READ_AFTER_WRITE_WINDOW
+    with track_writes(writer.last_write_at):
+        next_request = SqlModelUserRepository(db_session, read_session)
+        assert await next_request.find_by_id(created.id) is not None
+        read_session.exec.assert_awaited_once()
+
+        monkeypatch.setattr(settings, 'DB_READ_AFTER_WRITE_WINDOW', 0)
+        await next_request.find_by_id(created.id)
+        assert read_session.exec.await_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(9)
+async def test_other_clients_keep_reading_from_replica(db_session):
+    read_session = AsyncMock()
+
+    with track_writes() as writer:
+        await SqlModelUserRepository(db_session, read_session).create(
+            User(
+                email=f'outro.{user_mock.email}',
+                password=user_mock.password,
+                name=user_mock.name,
+            )
+        )
+
+    # Outro cliente, sem o cookie da escrita, no mesmo worker
+    with track_writes():
+        repository = SqlModelUserRepository(db_session, read_session)
+        assert repository.read_session is read_session
+
+    with track_writes(writer.last_write_at):
+        repository = SqlModelUserRepository(db_session, read_session)
+        assert repository.read_session is db_session
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(9)
+async def test_find_by_email_always_uses_primary(db_session):
+    read_session = AsyncMock()
+    repository = SqlModelUserRepository(db_session, read_session)
+
+    await repository.find_by_email(user_mock.email)
+    await repository.find_by_emails([user_mock.email])
+
+    read_session.exec.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(10)
+async def test_find_by_ids(db_session):
+    repository = SqlModelUserRepository(db_session)
+    users = [
+        await repository.create(
+            User(
+                email=f'ids{i}.{user_mock.email}',
+                password=user_mock.password,
+                name=user_mock.name,
+            )
+        )
+        for i in range(3)
+    ]
+
+    found = await repository.find_by_ids([users[0].id, users[2].id, uuid4()])
+
+    assert {user.id for user in found} == {users[0].id, users[2].id}
+    assert await repository.find_by_ids([]) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(11)
+async def test_reads_return_read_models_without_password(db_session):
+    repository = SqlModelUserRepository(db_session)
+    created = await repository.create(
+        User(
+            email=user_mock.email,
+            password=user_mock.password,
+            name=user_mock.name,
+        )
+    )
+
+    found = await repository.find_by_id(created.id)
+    page = await repository.index(page=1, page_size=10)
+
+    assert isinstance(found, UserReadModel)
+    assert found == UserReadModel(
+        id=created.id,
+        name=created.name,
+        email=created.email,
+        created_at=created.created_at,
+        updated_at=created.updated_at,
+    )
+    assert not hasattr(found, 'password')
+    assert all(isinstance(user, UserReadModel) for user in page)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(12)
+async def test_update_password(db_session):
+    repository = SqlModelUserRepository(db_session)
+    created = await repository.create(
+        User(
+            email=user_mock.email,
+            password=user_mock.password,
+            name=user_mock.name,
+        )
+    )
+
+    await repository.update_password(created.id, 'novo-hash')
+    found = await repository.find_by_email(created.email)
+
+    assert found.password == 'novo-hash'
+    assert found.updated_at >= created.updated_at
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(13)
+async def test_versions_follow_index(db_session):
+    repository = SqlModelUserRepository(db_session)
+    await repository.create_many([
+        User(
+            email=f'user{i}.{user_mock.email}',
+            password=user_mock.password,
+            name=user_mock.name,
+        )
+        for i in range(3)
+    ])
+
+    versions = await repository.index_versions(page=1, page_size=2)
+    page = await repository.index(page=1, page_size=2)
+
+    assert versions == [UserVersion.from_user(user) for user in page]
+    assert await repository.find_version(page[0].id) == versions[0]
+    assert await repository.find_version(uuid4()) is None
+
+
+async def _seed_search(repository) -> None:
+    await repository.create_many([
+        User(email='ana.souza@example.com', password='x', name='Ana Souza'),
+        User(email='bruno@example.com', password='x', name='Bruno Ana'),
+        User(email='mariana@example.com', password='x', name='Mariana Lima'),
+        User(email='ana@example.com', password='x', name='Ana'),
+        User(email='carlos@ana.com', password='x', name='Carlos Lima'),
+        User(email='100%@example.com', password='x', name='Cem Por Cento'),
+    ])
+
+
+def _emails(users) -> list[str]:
+    return [user.email for user in users]
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(14)
+async def test_search(db_session):
+    repository = SqlModelUserRepository(db_session)
+    await _seed_search(repository)
+
+    # Email igual, email com prefixo, nome com prefixo, palavra do nome e,
+    # por último, o termo no meio do texto
+    assert _emails(await repository.search('ANA', limit=10)) == [
+        'ana@example.com',
+        'ana.souza@example.com',
+        'bruno@example.com',
+        'carlos@ana.com',
+        'mariana@example.com',
+    ]
+    assert _emails(await repository.search('ana', limit=2)) == [
+        'ana@example.com',
+        'ana.souza@example.com',
+    ]
+
+    # Menos de 3 caracteres: só prefixo
+    assert _emails(await repository.search('an', limit=10)) == [
+        'ana@example.com',
+        'ana.souza@example.com',
+    ]
+    assert _emails(await repository.search('lima', limit=10)) == [
+        'carlos@ana.com',
+        'mariana@example.com',
+    ]
+
+    # Curingas do LIKE são buscados literalmente
+    assert _emails(await repository.search('0%@', limit=10)) == [
+        '100%@example.com'
+    ]
+    assert await repository.search('a_a', limit=10) == []
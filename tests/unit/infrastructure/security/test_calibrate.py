@@ -0,0 +1,47 @@
+import pytest
+
+from app.infrastructure.security import calibrate
+
+
+def _fake_measure(ms_per_unit: float):
+    # Latência proporcional a time_cost * memory_cost, como no argon2
+    def measure(time_cost, memory_cost, parallelism, samples=3):
+        return time_cost * memory_cost / 1024 * ms_per_unit
+
+    return measure
+
+
+@pytest.mark.order(1)
+def test_calibrate_picks_highest_time_cost_within_target(monkeypatch):
+    monkeypatch.setattr(calibrate, 'measure', _fake_measure(1.0))
+    memory_cost, target_ms = 65_536, 250
+
+    suggested = calibrate.calibrate(target_ms, memory_cost, parallelism=4)
+
+    expected_time_cost = 3
+    assert suggested.time_cost == expected_time_cost
+    assert suggested.memory_cost == memory_cost
+    assert suggested.latency_ms <= target_ms
+
+
+@pytest.mark.order(2)
+def test_calibrate_reduces_memory_when_too_slow(monkeypatch):
+    monkeypatch.setattr(calibrate, 'measure', _fake_measure(10.0))
+    target_ms = 250
+
+    suggested = calibrate.calibrate(target_ms, 65_536, parallelism=1)
+
+    assert suggested.time_cost == 1
+    assert suggested.memory_cost >= calibrate.MIN_MEMORY_COST
+    assert suggested.memory_cost < 65_536  # noqa: PLR2004
+
+
+@pytest.mark.order(3)
+def test_calibrate_main_prints_settings(monkeypatch, capsys):
+    monkeypatch.setattr(calibrate, 'measure', _fake_measure(1.0))
+
+    assert calibrate.main(['--target-ms', '250']) == 0
+
+    output = capsys.readouterr().out
+    assert 'ARGON2_TIME_COST=3' in output
+    assert 'ARGON2_MEMORY_COST=65536' in output
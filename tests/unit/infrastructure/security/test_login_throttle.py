@@ -0,0 +1,189 @@
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.infrastructure.security.login_throttle import (
+    InMemoryThrottleStore,
+    LoginThrottle,
+    PostgresThrottleStore,
+)
+from tests.conftest import test_engine
+from tests.mocks.user import User as MockUser
+
+WINDOW = 60
+EMAIL_LIMIT = 3
+IP_LIMIT = 5
+
+
+class Clock:
+    def __init__(self, now: float = WINDOW * 1000):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _throttle(clock: Clock, store=None) -> LoginThrottle:
+    return LoginThrottle(
+        store or InMemoryThrottleStore(),
+        email_limit=EMAIL_LIMIT,
+        ip_limit=IP_LIMIT,
+        window_seconds=WINDOW,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_in_memory_store_rolls_windows():
+    store = InMemoryThrottleStore()
+    hits_in_window = 2
+
+    assert await store.hit('key', 10) == (1, 0)
+    assert await store.hit('key', 10) == (hits_in_window, 0)
+    assert await store.hit('key', 11) == (1, hits_in_window)
+    # Uma janela sem tentativas zera a anterior
+    assert await store.hit('key', 13) == (1, 0)
+
+    # Só desconta da própria janela, e nunca abaixo de zero
+    await store.release('key', 12)
+    await store.release('key', 13)
+    await store.release('key', 13)
+    assert await store.hit('key', 13) == (1, 0)
+
+    await store.reset('key')
+    assert await store.hit('key', 13) == (1, 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_in_memory_store_evicts_stale_and_oldest_keys():
+    store = InMemoryThrottleStore(max_keys=2)
+
+    await store.hit('stale', 1)
+    await store.hit('a', 10)
+    await store.hit('b', 10)
+    await store.hit('c', 10)
+
+    assert list(store._windows) == ['b', 'c']
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_throttle_limits_email_case_insensitively():
+    throttle = _throttle(Clock())
+    email = MockUser.email
+
+    for _ in range(EMAIL_LIMIT):
+        await throttle.check(email, '10.0.0.1')
+
+    with pytest.raises(HTTPException) as exc_info:
+        await throttle.check(email.upper(), '10.0.0.2')
+
+    assert exc_info.value.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert int(exc_info.value.headers['Retry-After']) >= 1
+    assert throttle.rejected == 1
+
+    await throttle.check(f'outro.{email}', '10.0.0.1')
+    await throttle.record_success(email, '10.0.0.1')
+    await throttle.check(email, '10.0.0.3')
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_throttle_limits_ip_across_emails():
+    throttle = _throttle(Clock())
+
+    for i in range(IP_LIMIT):
+        await throttle.check(f'user{i}@example.com', '10.0.0.1')
+
+    with pytest.raises(HTTPException):
+        await throttle.check('novo@example.com', '10.0.0.1')
+
+    await throttle.check('novo@example.com', '10.0.0.2')
+    await throttle.check('sem-ip@example.com', None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_throttle_window_slides():
+    clock = Clock()
+    throttle = _throttle(clock)
+    email = MockUser.email
+
+    for _ in range(EMAIL_LIMIT):
+        await throttle.check(email, None)
+
+    # Início da janela seguinte: a anterior ainda pesa quase inteira
+    clock.now += WINDOW
+    with pytest.raises(HTTPException) as exc_info:
+        await throttle.check(email, None)
+    retry_after = int(exc_info.value.headers['Retry-After'])
+    assert 0 < retry_after <= WINDOW
+
+    clock.now += retry_after
+    await throttle.check(email, None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(6)
+async def test_postgres_store_shares_counters(create_tables):
+    key = f'email:{uuid4()}@example.com'
+    first, second = (
+        PostgresThrottleStore(test_engine, cleanup_every=2),
+        PostgresThrottleStore(test_engine),
+    )
+    hits_in_window = 2
+
+    assert await first.hit(key, 10) == (1, 0)
+    assert await second.hit(key, 10) == (hits_in_window, 0)
+    assert await second.hit(key, 11) == (1, hits_in_window)
+    # cleanup_every=2: a segunda chamada apaga janelas antigas
+    assert await first.hit(key, 12) == (1, 1)
+    assert await first.hit(key, 13) == (1, 1)
+
+    await first.release(key, 13)
+    await first.release(key, 13)
+    assert await second.hit(key, 13) == (1, 1)
+
+    await first.reset(key)
+    assert await second.hit(key, 13) == (1, 0)
+    await second.reset(key)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(7)
+async def test_postgres_store_accepts_long_emails(create_tables):
+    throttle = _throttle(Clock(), PostgresThrottleStore(test_engine))
+    email = f'{"a" * 1000}{uuid4()}@example.com'
+
+    for _ in range(EMAIL_LIMIT):
+        await throttle.check(email, None)
+    # Mesmo bucket com outra caixa e espaços em volta
+    with pytest.raises(HTTPException) as exc_info:
+        await throttle.check(f' {email.upper()} ', None)
+
+    assert exc_info.value.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    await throttle.record_success(email, None)
+    await throttle.check(email, None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(8)
+async def test_successful_logins_do_not_count_for_ip():
+    throttle = _throttle(Clock())
+    ip = '10.0.0.1'
+
+    # Vários clientes atrás do mesmo proxy logando com sucesso
+    for i in range(IP_LIMIT * 3):
+        email = f'user{i}@example.com'
+        await throttle.check(email, ip)
+        await throttle.record_success(email, ip)
+
+    # As falhas continuam contando
+    for i in range(IP_LIMIT):
+        await throttle.check(f'errado{i}@example.com', ip)
+    with pytest.raises(HTTPException):
+        await throttle.check('novo@example.com', ip)
@@ -1,5 +1,14 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from fastapi import HTTPException
+from pwdlib.hashers.argon2 import Argon2Hasher
+
 from app.infrastructure.security.password import (
+    PasswordHasher,
     get_password_hash,
+    verify_and_update_password,
     verify_password,
 )
 from tests.mocks.user import User as MockUser
@@ -14,3 +23,127 @@ def test_password_hash():
     assert verify_password(MockUser.password, password_hash)
 
     assert not verify_password(MockUser.password + '1', password_hash)
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_hash_and_verify():
+    hasher = PasswordHasher(max_workers=1, max_pending=2)
+
+    password_hash = await hasher.hash(MockUser.password)
+
+    assert await hasher.verify(MockUser.password, password_hash)
+    assert not await hasher.verify(MockUser.password + '1', password_hash)
+    assert hasher.stats['hash'].count == 1
+    assert hasher.stats['verify'].count == 2  # noqa: PLR2004
+    assert hasher.stats['verify'].max_seconds > 0
+    assert hasher.pending == 0
+
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_rejects_when_saturated():
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+
+    task = asyncio.create_task(hasher.hash(MockUser.password))
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher.hash(MockUser.password)
+
+    assert exc_info.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert hasher.rejected == 1
+
+    assert await task
+    assert hasher.pending == 0
+
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_hash_many():
+    hasher = PasswordHasher(max_workers=2, max_pending=4)
+    passwords = [f'{MockUser.password}{i}' for i in range(3)]
+
+    hashes = await hasher.hash_many(passwords)
+
+    assert len(hashes) == len(passwords)
+    for password, password_hash in zip(passwords, hashes):
+        assert verify_password(password, password_hash)
+    # Partes de 2 senhas: um lote por worker na primeira, um na segunda
+    assert hasher.stats['hash_many'].count == 3  # noqa: PLR2004
+    assert await hasher.hash_many([]) == []
+
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_hash_many_leaves_room_for_others():
+    hasher = PasswordHasher(max_workers=1, max_pending=4)
+    passwords = [f'{MockUser.password}{i}' for i in range(5)]
+
+    task = asyncio.create_task(hasher.hash_many(passwords))
+    await asyncio.sleep(0)
+
+    # Só a primeira parte ocupa a fila, com uma vaga por senha
+    assert hasher.pending == hasher.max_pending // 2
+    assert await hasher.hash(MockUser.password)
+
+    assert len(await task) == len(passwords)
+    assert hasher.pending == 0
+    assert hasher.rejected == 0
+
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_hash_many_rejects_when_saturated():
+    hasher = PasswordHasher(max_workers=1, max_pending=2)
+    passwords = [f'{MockUser.password}{i}' for i in range(3)]
+
+    busy = [
+        asyncio.create_task(hasher.hash(MockUser.password)) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher.hash_many(passwords)
+
+    assert exc_info.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert hasher.rejected == 1
+    assert hasher.stats['hash_many'].count == 0
+
+    await asyncio.gather(*busy)
+    assert hasher.pending == 0
+
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_verify_and_update():
+    hasher = PasswordHasher(max_workers=1, max_pending=2)
+    current_hash = get_password_hash(MockUser.password)
+    outdated_hash = Argon2Hasher(
+        time_cost=1, memory_cost=8192, parallelism=1
+    ).hash(MockUser.password)
+
+    assert await hasher.verify_and_update(MockUser.password, current_hash) == (
+        True,
+        None,
+    )
+    assert await hasher.verify_and_update(
+        MockUser.password + '1', outdated_hash
+    ) == (False, None)
+
+    valid, new_hash = await hasher.verify_and_update(
+        MockUser.password, outdated_hash
+    )
+    assert valid
+    assert new_hash != outdated_hash
+    assert verify_and_update_password(MockUser.password, new_hash) == (
+        True,
+        None,
+    )
+    assert hasher.stats['verify_and_update'].count == 3  # noqa: PLR2004
+
+    hasher.shutdown()
@@ -0,0 +1,178 @@
+import json
+import threading
+
+import pytest
+
+from app.infrastructure.tracing.exporters import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+)
+from app.infrastructure.tracing.span import Span, Trace
+from app.infrastructure.tracing.tracer import (
+    Tracer,
+    trace_methods,
+    traced,
+    tracer,
+)
+from app.use_cases.interfaces.use_case import UseCase
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    memory = InMemorySpanExporter()
+    monkeypatch.setattr(tracer, 'exporter', memory)
+    return memory
+
+
+@traced('helper.sync', layer='test')
+def sync_helper():
+    return 'sync'
+
+
+@traced('helper.async', layer='test')
+async def async_helper():
+    return sync_helper()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_spans_nest_under_root(exporter):
+    with tracer.start_span('root', root=True) as root:
+        assert await async_helper() == 'sync'
+
+    sync_span, async_span, root_span = exporter.spans
+    assert [span.name for span in exporter.spans] == [
+        'helper.sync',
+        'helper.async',
+        'root',
+    ]
+    assert root_span is root
+    assert root_span.parent_id is None
+    assert async_span.parent_id == root_span.span_id
+    assert sync_span.parent_id == async_span.span_id
+    assert {span.trace.trace_id for span in exporter.spans} == {
+        root.trace.trace_id
+    }
+    assert async_span.attributes == {'layer': 'test'}
+    assert root.trace.spans == list(exporter.spans)
+    assert all(span.status == 'OK' for span in exporter.spans)
+    assert all(span.duration_ms >= 0 for span in exporter.spans)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_spans_outside_root_are_not_recorded(exporter):
+    assert await async_helper() == 'sync'
+
+    with tracer.start_span('orphan') as span:
+        assert span is None
+
+    assert not exporter.spans
+
+
+@pytest.mark.order(3)
+def test_span_marks_errors(exporter):
+    @traced('helper.fails')
+    def fails():
+        raise ValueError('falhou')
+
+    with (
+        pytest.raises(ValueError, match='falhou'),
+        tracer.start_span('root', root=True),
+    ):
+        fails()
+
+    assert [span.status for span in exporter.spans] == ['ERROR', 'ERROR']
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_trace_methods_and_use_case_spans(exporter):
+    @trace_methods(layer='repository')
+    class Repository:
+        value = 'found'
+
+        async def find(self):
+            return self.value
+
+        async def stream(self):
+            yield self.value
+
+        async def _private(self):
+            return self.value
+
+    class FindUseCase(UseCase[None, str]):
+        def __init__(self, repository: Repository):
+            self.repository = repository
+
+        async def execute(self, input_data: None) -> str:
+            await self.repository._private()
+            [item async for item in self.repository.stream()]
+            return await self.repository.find()
+
+    with tracer.start_span('root', root=True):
+        assert await FindUseCase(Repository()).execute(None) == 'found'
+
+    assert [span.name for span in exporter.spans] == [
+        'Repository.find',
+        'FindUseCase.execute',
+        'root',
+    ]
+    assert exporter.spans[0].attributes == {'layer': 'repository'}
+    assert exporter.spans[1].attributes == {'layer': 'use_case'}
+
+
+@pytest.mark.order(5)
+def test_file_exporter_writes_json_lines(tmp_path):
+    path = tmp_path / 'traces.jsonl'
+    file_tracer = Tracer(FileSpanExporter(str(path)))
+
+    with (
+        file_tracer.start_span('root', root=True, route='/v1/users/'),
+        file_tracer.start_span('child'),
+    ):
+        pass
+
+    file_tracer.exporter.flush()
+    child, root = [json.loads(line) for line in path.read_text().splitlines()]
+    assert child['name'] == 'child'
+    assert child['parent_id'] == root['span_id']
+    assert child['trace_id'] == root['trace_id']
+    assert root['attributes'] == {'route': '/v1/users/'}
+    file_tracer.shutdown()
+
+
+@pytest.mark.order(6)
+def test_file_exporter_drops_spans_when_the_queue_is_full(tmp_path):
+    path = tmp_path / 'traces.jsonl'
+    exporter = FileSpanExporter(str(path), max_queue=1)
+    writing, release = threading.Event(), threading.Event()
+
+    class SlowValue:
+        def __str__(self) -> str:
+            writing.set()
+            release.wait()
+            return 'lento'
+
+    def span(name: str, **attributes) -> Span:
+        return Span(
+            name=name,
+            trace=Trace(trace_id='trace'),
+            span_id=name,
+            parent_id=None,
+            start_ns=0,
+            attributes=attributes,
+        )
+
+    # A thread fica presa gravando o primeiro span; o chamador não espera
+    exporter.export(span('first', value=SlowValue()))
+    assert writing.wait(timeout=5)
+    exporter.export(span('second'))
+    exporter.export(span('third'))
+    assert exporter.dropped == 1
+
+    release.set()
+    exporter.shutdown()
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line['name'] for line in lines] == ['first', 'second']
+    assert lines[0]['attributes'] == {'value': 'lento'}
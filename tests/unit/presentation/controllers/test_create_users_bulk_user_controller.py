@@ -0,0 +1,77 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.entities.user import User
+from app.infrastructure.dependencies.auth_dependencies import get_current_user
+from app.presentation.controllers.user_controller import (
+    create_users_bulk,
+    router,
+)
+from app.presentation.schemas.user.request import UserCreateRequest
+from app.presentation.schemas.user.response import (
+    BulkUserCreateResponse,
+    BulkUserStatus,
+)
+from app.use_cases.user.create_users_bulk import (
+    CreateUsersBulkInput,
+    CreateUsersBulkOutput,
+    CreateUsersBulkResult,
+)
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_create_users_bulk_endpoint():
+    now = datetime.now()
+    requests = [
+        UserCreateRequest(
+            name=user_mock.name,
+            email=f'{i}.{user_mock.email}',
+            password=user_mock.password,
+        )
+        for i in range(2)
+    ]
+    user = User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=requests[0].email,
+        password=user_mock.password,
+        created_at=now,
+    )
+
+    mock_use_case = AsyncMock()
+    mock_use_case.execute.return_value = CreateUsersBulkOutput(
+        results=[
+            CreateUsersBulkResult(email=requests[0].email, user=user),
+            CreateUsersBulkResult(email=requests[1].email),
+        ]
+    )
+
+    response = await create_users_bulk(requests, use_case=mock_use_case)
+
+    assert isinstance(response, BulkUserCreateResponse)
+    assert response.created == 1
+    assert response.conflicts == 1
+    assert response.items[0].status == BulkUserStatus.CREATED
+    assert response.items[0].user.id == user_mock.id
+    assert response.items[1].index == 1
+    assert response.items[1].status == BulkUserStatus.CONFLICT
+    assert response.items[1].user is None
+
+    mock_use_case.execute.assert_called_once_with(
+        input_data=CreateUsersBulkInput(users=requests)
+    )
+
+
+def test_create_users_bulk_requires_authentication():
+    route = next(route for route in router.routes if route.path == '/bulk')
+
+    assert any(
+        dependency.call is get_current_user
+        for dependency in route.dependant.dependencies
+    )
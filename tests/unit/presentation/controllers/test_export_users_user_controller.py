@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fastapi.responses import StreamingResponse
+
+from app.constants import ExportFormat
+from app.domain.entities.user import User
+from app.presentation.controllers.user_controller import export_users
+from app.use_cases.user.export_users import ExportUsersOutput
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+def _users(total: int) -> list[User]:
+    now = datetime.now()
+    return [
+        User(
+            id=uuid4(),
+            name=f'{user_mock.name} {i}',
+            email=f'user{i}.{user_mock.email}',
+            password=user_mock.password,
+            created_at=now,
+        )
+        for i in range(total)
+    ]
+
+
+async def _as_stream(users: list[User]):
+    for user in users:
+        yield user
+
+
+async def _read_body(response: StreamingResponse) -> str:
+    chunks = [chunk async for chunk in response.body_iterator]
+    return b''.join(chunks).decode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_export_users_ndjson():
+    users = _users(3)
+    mock_use_case = AsyncMock()
+    mock_use_case.execute.return_value = ExportUsersOutput(
+        users=_as_stream(users)
+    )
+
+    response = await export_users(
+        format=ExportFormat.NDJSON, use_case=mock_use_case
+    )
+
+    assert isinstance(response, StreamingResponse)
+    assert response.media_type == 'application/x-ndjson'
+    assert 'users.ndjson' in response.headers['content-disposition']
+
+    lines = (await _read_body(response)).splitlines()
+    assert len(lines) == len(users)
+    for line, user in zip(lines, users):
+        item = json.loads(line)
+        assert item['id'] == str(user.id)
+        assert item['email'] == user.email
+        assert 'password' not in item
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_export_users_csv():
+    users = _users(2)
+    mock_use_case = AsyncMock()
+    mock_use_case.execute.return_value = ExportUsersOutput(
+        users=_as_stream(users)
+    )
+
+    response = await export_users(
+        format=ExportFormat.CSV, use_case=mock_use_case
+    )
+
+    assert response.media_type.startswith('text/csv')
+
+    rows = list(csv.reader(io.StringIO(await _read_body(response))))
+    assert rows[0] == ['id', 'name', 'email', 'created_at']
+    assert [row[0] for row in rows[1:]] == [str(user.id) for user in users]
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_export_users_empty_csv_has_header():
+    mock_use_case = AsyncMock()
+    mock_use_case.execute.return_value = ExportUsersOutput(
+        users=_as_stream([])
+    )
+
+    response = await export_users(
+        format=ExportFormat.CSV, use_case=mock_use_case
+    )
+
+    assert await _read_body(response) == 'id,name,email,created_at\r\n'
@@ -4,12 +4,18 @@ from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 
 from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserVersion
 from app.presentation.controllers.user_controller import get_user
 from app.presentation.schemas.user.response import UserResponse
+from app.presentation.serializers.etag import user_etag
 from app.use_cases.user.get_user import GetUserInput, GetUserOutput
+from app.use_cases.user.get_user_version import (
+    GetUserVersionInput,
+    GetUserVersionOutput,
+)
 from tests.mocks.user import User as MockUser
 
 user_mock = MockUser()
@@ -36,6 +42,9 @@ async def test_get_user_success():
     response = await get_user(
         user_id=user_id,
         use_case=mock_use_case,
+        version_use_case=AsyncMock(),
+        response=Response(),
+        if_none_match=None,
     )
 
     assert response == UserResponse(
@@ -66,6 +75,9 @@ async def test_get_user_not_found():
         await get_user(
             user_id=user_id,
             use_case=mock_use_case,
+            version_use_case=AsyncMock(),
+            response=Response(),
+            if_none_match=None,
         )
 
     assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
@@ -73,3 +85,60 @@ async def test_get_user_not_found():
     mock_use_case.execute.assert_called_once_with(
         input_data=GetUserInput(user_id=user_id)
     )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_get_user_sets_validators():
+    user = User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        password=user_mock.password,
+    )
+    mock_use_case = AsyncMock()
+    mock_use_case.execute.return_value = GetUserOutput(user=user)
+    mock_version_use_case = AsyncMock()
+    mock_version_use_case.execute.return_value = GetUserVersionOutput(
+        version=UserVersion.from_user(user)
+    )
+    response = Response()
+
+    # ETag antigo: a versão mudou, então o usuário é buscado por inteiro
+    result = await get_user(
+        user_id=user.id,
+        use_case=mock_use_case,
+        version_use_case=mock_version_use_case,
+        response=response,
+        if_none_match='W/"antigo"',
+    )
+
+    assert result.id == user.id
+    assert response.headers['etag'] == user_etag(UserVersion.from_user(user))
+    assert 'last-modified' in response.headers
+    mock_version_use_case.execute.assert_called_once_with(
+        input_data=GetUserVersionInput(user_id=user.id)
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_get_user_not_modified():
+    version = UserVersion(id=user_mock.id, updated_at=datetime.now())
+    mock_use_case = AsyncMock()
+    mock_version_use_case = AsyncMock()
+    mock_version_use_case.execute.return_value = GetUserVersionOutput(
+        version=version
+    )
+
+    result = await get_user(
+        user_id=version.id,
+        use_case=mock_use_case,
+        version_use_case=mock_version_use_case,
+        response=Response(),
+        if_none_match=user_etag(version),
+    )
+
+    assert result.status_code == HTTPStatus.NOT_MODIFIED
+    assert result.headers['etag'] == user_etag(version)
+    mock_use_case.execute.assert_not_called()
@@ -1,14 +1,33 @@
+import base64
 from datetime import datetime
+from http import HTTPStatus
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
+from fastapi import HTTPException, Response
 
+from app.constants import CountMode, PaginationMode
 from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserCursor, UserVersion
+from app.infrastructure.cache.user_list_cache import UserListCache
 from app.presentation.controllers.user_controller import list_users
-from app.presentation.schemas.common.pagination import PaginatedResponse
+from app.presentation.schemas.common.cursor import (
+    decode_cursor,
+    encode_cursor,
+)
+from app.presentation.schemas.common.pagination import (
+    CursorPaginatedResponse,
+    PaginatedResponse,
+)
 from app.presentation.schemas.user.response import UserResponse
+from app.presentation.serializers.etag import page_etag
 from app.use_cases.user.list_users import ListUsersInput, ListUsersOutput
+from app.use_cases.user.list_users_by_cursor import (
+    ListUsersByCursorInput,
+    ListUsersByCursorOutput,
+)
+from app.use_cases.user.list_users_version import ListUsersVersionOutput
 from tests.mocks.user import User as MockUser
 
 user_mock = MockUser()
@@ -47,7 +66,15 @@ async def test_list_users_endpoint():
     response = await list_users(
         page=page,
         page_size=page_size,
+        count_mode=CountMode.EXACT,
+        pagination=PaginationMode.OFFSET,
+        cursor=None,
         use_case=mock_use_case,
+        cursor_use_case=AsyncMock(),
+        version_use_case=AsyncMock(),
+        list_cache=None,
+        response=Response(),
+        if_none_match=None,
     )
 
     assert isinstance(response, PaginatedResponse)
@@ -89,7 +116,15 @@ async def test_list_users_empty():
     response = await list_users(
         page=page,
         page_size=page_size,
+        count_mode=CountMode.EXACT,
+        pagination=PaginationMode.OFFSET,
+        cursor=None,
         use_case=mock_use_case,
+        cursor_use_case=AsyncMock(),
+        version_use_case=AsyncMock(),
+        list_cache=None,
+        response=Response(),
+        if_none_match=None,
     )
 
     assert isinstance(response, PaginatedResponse)
@@ -107,3 +142,201 @@ async def test_list_users_empty():
             page_size=page_size,
         )
     )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_list_users_by_cursor():
+    now = datetime.now()
+
+    mock_users = [
+        User(
+            id=uuid4(),
+            name=user_mock.name,
+            email=user_mock.email,
+            password=user_mock.password,
+            created_at=now,
+        )
+        for _ in range(2)
+    ]
+    cursor = UserCursor(created_at=now, id=uuid4())
+
+    mock_cursor_use_case = AsyncMock()
+    mock_cursor_use_case.execute.return_value = ListUsersByCursorOutput(
+        users=mock_users,
+        next_cursor=UserCursor.from_user(mock_users[-1]),
+        prev_cursor=UserCursor.from_user(mock_users[0]),
+    )
+
+    response = await list_users(
+        page=1,
+        page_size=2,
+        count_mode=CountMode.EXACT,
+        pagination=PaginationMode.OFFSET,
+        cursor=encode_cursor(cursor),
+        use_case=AsyncMock(),
+        cursor_use_case=mock_cursor_use_case,
+        version_use_case=AsyncMock(),
+        list_cache=None,
+        response=Response(),
+        if_none_match=None,
+    )
+
+    assert isinstance(response, CursorPaginatedResponse)
+    assert [item.id for item in response.items] == [
+        user.id for user in mock_users
+    ]
+    assert decode_cursor(response.next_cursor) == (
+        UserCursor.from_user(mock_users[-1]),
+        False,
+    )
+    assert decode_cursor(response.prev_cursor) == (
+        UserCursor.from_user(mock_users[0]),
+        True,
+    )
+
+    mock_cursor_use_case.execute.assert_called_once_with(
+        input_data=ListUsersByCursorInput(page_size=2, cursor=cursor)
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_list_users_invalid_cursor():
+    payloads = [
+        b'["2024-01-01T00:00:00",123,0]',
+        b'["2024-01-01T00:00:00",null,0]',
+        b'[123,"%s",0]' % str(uuid4()).encode(),
+        b'["2024-01-01T00:00:00","%s",2]' % str(uuid4()).encode(),
+        b'["2024-01-01T00:00:00"]',
+        b'{"id":1}',
+        b'\xff',
+    ]
+    cursors = ['invalid'] + [
+        base64.urlsafe_b64encode(payload).decode().rstrip('=')
+        for payload in payloads
+    ]
+
+    for cursor in cursors:
+        with pytest.raises(HTTPException) as exc_info:
+            await list_users(
+                page=1,
+                page_size=10,
+                count_mode=CountMode.EXACT,
+                pagination=PaginationMode.CURSOR,
+                cursor=cursor,
+                use_case=AsyncMock(),
+                cursor_use_case=AsyncMock(),
+                version_use_case=AsyncMock(),
+                list_cache=None,
+                response=Response(),
+                if_none_match=None,
+            )
+
+        assert exc_info.value.status_code == HTTPStatus.BAD_REQUEST, cursor
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_list_users_not_modified():
+    now = datetime.now()
+    total = 7
+    mock_users = [
+        User(
+            id=uuid4(),
+            name=user_mock.name,
+            email=user_mock.email,
+            password=user_mock.password,
+            created_at=now,
+            updated_at=now,
+        )
+        for _ in range(2)
+    ]
+    versions = [UserVersion.from_user(user) for user in mock_users]
+
+    mock_use_case = AsyncMock()
+    mock_use_case.execute.return_value = ListUsersOutput(
+        users=mock_users, total=total, total_pages=1
+    )
+    mock_version_use_case = AsyncMock()
+    mock_version_use_case.execute.return_value = ListUsersVersionOutput(
+        versions=versions, total=total
+    )
+    arguments = {
+        'page': 1,
+        'page_size': 10,
+        'count_mode': CountMode.EXACT,
+        'pagination': PaginationMode.OFFSET,
+        'cursor': None,
+        'use_case': mock_use_case,
+        'cursor_use_case': AsyncMock(),
+        'version_use_case': mock_version_use_case,
+        'list_cache': None,
+    }
+
+    response = Response()
+    result = await list_users(
+        **arguments, response=response, if_none_match=None
+    )
+    etag = response.headers['etag']
+
+    assert isinstance(result, PaginatedResponse)
+    assert etag == page_etag(versions, total)
+    mock_version_use_case.execute.assert_not_called()
+
+    result = await list_users(
+        **arguments, response=Response(), if_none_match=etag
+    )
+
+    assert result.status_code == HTTPStatus.NOT_MODIFIED
+    assert mock_use_case.execute.await_count == 1
+    mock_version_use_case.execute.assert_called_once_with(
+        input_data=ListUsersInput(page=1, page_size=10)
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(6)
+async def test_list_users_served_from_cache():
+    mock_users = [
+        User(
+            id=uuid4(),
+            name=user_mock.name,
+            email=user_mock.email,
+            password=user_mock.password,
+        )
+    ]
+    mock_use_case = AsyncMock()
+    mock_use_case.execute.return_value = ListUsersOutput(
+        users=mock_users, total=1, total_pages=1
+    )
+    list_cache = UserListCache(max_size=10, ttl=60)
+    arguments = {
+        'page': 1,
+        'page_size': 10,
+        'count_mode': CountMode.EXACT,
+        'pagination': PaginationMode.OFFSET,
+        'cursor': None,
+        'use_case': mock_use_case,
+        'cursor_use_case': AsyncMock(),
+        'version_use_case': AsyncMock(),
+        'list_cache': list_cache,
+        'response': Response(),
+    }
+
+    first = await list_users(**arguments, if_none_match=None)
+    second = await list_users(**arguments, if_none_match=None)
+    etag = second.headers['etag']
+    not_modified = await list_users(**arguments, if_none_match=etag)
+
+    assert first.body == second.body
+    assert etag == first.headers['etag']
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert mock_use_case.execute.await_count == 1
+    assert list_cache.stats.hits == 2  # noqa: PLR2004
+
+    # Uma escrita muda a versão: a próxima página vem do banco
+    await list_cache.on_user_created(mock_users[0])
+    await list_users(**arguments, if_none_match=None)
+
+    assert mock_use_case.execute.await_count == 2  # noqa: PLR2004
@@ -0,0 +1,118 @@
+from http import HTTPStatus
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+
+from app.domain.entities.user import User
+from app.infrastructure.repositories.in_memory_refresh_token_repository import (  # noqa: E501
+    InMemoryRefreshTokenRepository,
+)
+from app.infrastructure.security.login_throttle import (
+    InMemoryThrottleStore,
+    LoginThrottle,
+)
+from app.infrastructure.security.password import get_password_hash
+from app.presentation.controllers.auth_controller import login, refresh
+from app.presentation.schemas.auth.request import RefreshTokenRequest
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+EMAIL_LIMIT = 2
+
+
+def _throttle() -> LoginThrottle:
+    return LoginThrottle(
+        InMemoryThrottleStore(),
+        email_limit=EMAIL_LIMIT,
+        ip_limit=10,
+        window_seconds=60,
+    )
+
+
+def _form(password: str) -> OAuth2PasswordRequestForm:
+    return OAuth2PasswordRequestForm(
+        username=user_mock.email, password=password
+    )
+
+
+async def _login(repository, throttle, password, refresh_repository=None):
+    return await login(
+        request=SimpleNamespace(client=SimpleNamespace(host='10.0.0.1')),
+        form_data=_form(password),
+        user_repository=repository,
+        throttle=throttle,
+        refresh_token_repository=refresh_repository,
+        list_cache=None,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_login_throttled_before_lookup():
+    repository = AsyncMock()
+    repository.find_by_email.return_value = None
+    throttle = _throttle()
+
+    for _ in range(EMAIL_LIMIT):
+        with pytest.raises(HTTPException) as exc_info:
+            await _login(repository, throttle, 'Wrong-Pass1')
+        assert exc_info.value.status_code == HTTPStatus.UNAUTHORIZED
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _login(repository, throttle, 'Wrong-Pass1')
+
+    assert exc_info.value.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert repository.find_by_email.await_count == EMAIL_LIMIT
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_successful_login_resets_email_counter():
+    repository = AsyncMock()
+    repository.find_by_email.return_value = User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        password=get_password_hash(user_mock.password),
+    )
+    throttle = _throttle()
+
+    for _ in range(EMAIL_LIMIT + 1):
+        response = await _login(repository, throttle, user_mock.password)
+        assert response.access_token
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_refresh_rotates_token():
+    repository = AsyncMock()
+    repository.find_by_email.return_value = User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        password=get_password_hash(user_mock.password),
+    )
+    refresh_repository = InMemoryRefreshTokenRepository()
+
+    response = await _login(
+        repository, _throttle(), user_mock.password, refresh_repository
+    )
+    refreshed = await refresh(
+        body=RefreshTokenRequest(refresh_token=response.refresh_token),
+        refresh_token_repository=refresh_repository,
+    )
+
+    assert refreshed.access_token
+    assert refreshed.refresh_token != response.refresh_token
+
+    # Reusar o token antigo falha e revoga o que acabou de ser emitido
+    for token in (response.refresh_token, refreshed.refresh_token):
+        with pytest.raises(HTTPException) as exc_info:
+            await refresh(
+                body=RefreshTokenRequest(refresh_token=token),
+                refresh_token_repository=refresh_repository,
+            )
+        assert exc_info.value.status_code == HTTPStatus.UNAUTHORIZED
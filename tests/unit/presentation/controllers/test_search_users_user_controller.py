@@ -0,0 +1,42 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.entities.user import UserReadModel
+from app.presentation.controllers.user_controller import search_users
+from app.presentation.schemas.user.response import (
+    UserResponse,
+    UserSearchResponse,
+)
+from app.use_cases.user.search_users import (
+    SearchUsersInput,
+    SearchUsersOutput,
+)
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_search_users():
+    now = datetime.now()
+    user = UserReadModel(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        created_at=now,
+        updated_at=now,
+    )
+    mock_use_case = AsyncMock()
+    mock_use_case.execute.return_value = SearchUsersOutput(users=[user])
+
+    response = await search_users(q='ana', limit=10, use_case=mock_use_case)
+
+    assert isinstance(response, UserSearchResponse)
+    assert response.query == 'ana'
+    assert response.items == [UserResponse.from_user(user)]
+    mock_use_case.execute.assert_called_once_with(
+        input_data=SearchUsersInput(query='ana', limit=10)
+    )
@@ -0,0 +1,87 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from app.presentation.controllers.metrics_controller import (
+    metrics,
+)
+from app.presentation.controllers.metrics_controller import (
+    router as metrics_router,
+)
+from app.presentation.middlewares.metrics_middleware import (
+    UNMATCHED_ROUTE,
+    MetricsMiddleware,
+)
+
+
+def _count(method: str, route: str, status: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            'http_request_duration_seconds_count',
+            {'method': method, 'route': route, 'status': status},
+        )
+        or 0.0
+    )
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get('/items/{item_id}/')
+    async def get_item(item_id: int):
+        return {'id': item_id}
+
+    app.include_router(metrics_router)
+    return app
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_metrics_middleware_labels_route_template():
+    route = '/items/{item_id}/'
+    before_ok = _count('GET', route, '200')
+    before_invalid = _count('GET', route, '422')
+    before_unmatched = _count('GET', UNMATCHED_ROUTE, '404')
+
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://test'
+    ) as client:
+        await client.get('/items/1/')
+        await client.get('/items/2/')
+        await client.get('/items/abc/')
+        await client.get('/missing')
+
+    requests = 2
+    assert _count('GET', route, '200') == before_ok + requests
+    assert _count('GET', route, '422') == before_invalid + 1
+    assert _count('GET', UNMATCHED_ROUTE, '404') == before_unmatched + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_metrics_endpoint_exposes_prometheus_text():
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://test'
+    ) as client:
+        await client.get('/items/1/')
+        response = await client.get('/metrics')
+
+    assert response.status_code == httpx.codes.OK
+    assert response.headers['content-type'].startswith('text/plain')
+    assert 'http_request_duration_seconds_bucket' in response.text
+    assert 'db_pool_checkout_wait_seconds' in response.text
+    assert 'password_hash_duration_seconds' in response.text
+
+
+@pytest.mark.order(3)
+def test_metrics_aggregates_multiprocess_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+
+    response = metrics()
+
+    # Sem arquivos de workers no diretório não há séries para agregar
+    assert b'http_request_duration_seconds_bucket' not in response.body
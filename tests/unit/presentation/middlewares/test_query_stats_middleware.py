@@ -0,0 +1,61 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.infrastructure.metrics.query_stats import (
+    assert_max_queries,
+    record_query,
+)
+from app.presentation.middlewares.query_stats_middleware import (
+    QueryStatsMiddleware,
+)
+
+QUERIES = 3
+
+
+def _app(expose_headers: bool) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, expose_headers=expose_headers)
+
+    @app.get('/items/')
+    async def list_items():
+        for _ in range(QUERIES):
+            record_query('SELECT 1', {}, 0.002)
+        return []
+
+    return app
+
+
+async def _get(app: FastAPI) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://test'
+    ) as client:
+        return await client.get('/items/')
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_query_stats_headers():
+    response = await _get(_app(expose_headers=True))
+
+    assert response.headers['x-db-queries'] == str(QUERIES)
+    assert float(response.headers['x-db-time']) == pytest.approx(6.0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_query_stats_headers_disabled():
+    response = await _get(_app(expose_headers=False))
+
+    assert 'x-db-queries' not in response.headers
+    assert 'x-db-time' not in response.headers
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_query_budget_sees_requests_through_middleware():
+    with assert_max_queries(QUERIES) as stats:
+        await _get(_app(expose_headers=False))
+
+    assert stats.queries == QUERIES
@@ -0,0 +1,63 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.infrastructure.config.read_after_write import (
+    COOKIE_NAME,
+    mark_written,
+    written_recently,
+)
+from app.presentation.middlewares.read_after_write_middleware import (
+    ReadAfterWriteMiddleware,
+)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ReadAfterWriteMiddleware)
+
+    @app.post('/items/')
+    async def create_item():
+        mark_written()
+        return {}
+
+    @app.get('/items/')
+    async def list_items():
+        return {'primary': written_recently()}
+
+    return app
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url='http://test'
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_only_the_writing_client_reads_from_primary():
+    app = _app()
+
+    async with _client(app) as writer, _client(app) as other:
+        assert (await writer.get('/items/')).json() == {'primary': False}
+
+        response = await writer.post('/items/')
+        assert COOKIE_NAME in response.cookies
+
+        assert (await writer.get('/items/')).json() == {'primary': True}
+        # Mesmo worker, outro cliente: continua na réplica
+        assert (await other.get('/items/')).json() == {'primary': False}
+        assert COOKIE_NAME not in other.cookies
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_invalid_or_future_cookies_are_ignored():
+    app = _app()
+
+    for value in ('abc', 'nan', '9999999999'):
+        async with _client(app) as client:
+            client.cookies.set(COOKIE_NAME, value)
+            response = await client.get('/items/')
+            assert response.json() == {'primary': False}
@@ -0,0 +1,79 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.infrastructure.tracing.span import Span, Trace
+from app.infrastructure.tracing.tracer import traced
+from app.presentation.middlewares.tracing_middleware import (
+    TracingMiddleware,
+    server_timing,
+)
+
+
+@traced('repository.find')
+async def find():
+    return {'id': 1}
+
+
+def _app(enabled: bool) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, server_timing=enabled)
+
+    @app.get('/items/{item_id}/')
+    async def get_item(item_id: int):
+        await find()
+        return await find()
+
+    return app
+
+
+async def _get(app: FastAPI) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://test'
+    ) as client:
+        return await client.get('/items/1/')
+
+
+def _span(name: str, duration_ms: float) -> Span:
+    return Span(
+        name=name,
+        trace=Trace(trace_id='trace'),
+        span_id=name,
+        parent_id=None,
+        start_ns=0,
+        end_ns=int(duration_ms * 1e6),
+    )
+
+
+@pytest.mark.order(1)
+def test_server_timing_sums_spans_by_name():
+    spans = [
+        _span('repository.find', 1.5),
+        _span('password.verify', 200),
+        _span('repository.find', 0.5),
+    ]
+
+    assert server_timing(spans, 210) == (
+        'repository.find;dur=2.00;desc="2x", '
+        'password.verify;dur=200.00, total;dur=210.00'
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_tracing_middleware_adds_server_timing():
+    response = await _get(_app(enabled=True))
+
+    header = response.headers['server-timing']
+    assert header.startswith('repository.find;dur=')
+    assert ';desc="2x"' in header
+    assert 'total;dur=' in header
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_tracing_middleware_without_server_timing():
+    response = await _get(_app(enabled=False))
+
+    assert 'server-timing' not in response.headers
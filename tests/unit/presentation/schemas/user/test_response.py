@@ -0,0 +1,31 @@
+from datetime import datetime
+
+import pytest
+
+from app.domain.entities.user import User
+from app.presentation.schemas.user.response import UserResponse
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+@pytest.mark.order(1)
+def test_user_response_from_user_matches_validated_response():
+    now = datetime.now()
+    user = User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        password=user_mock.password,
+        created_at=now,
+    )
+
+    response = UserResponse.from_user(user)
+
+    assert response == UserResponse(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        created_at=now,
+    )
+    assert 'password' not in response.model_dump()
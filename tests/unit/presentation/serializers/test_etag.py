@@ -0,0 +1,70 @@
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+
+from app.domain.repositories.user_repository import UserVersion
+from app.presentation.serializers.etag import (
+    etag_matches,
+    last_modified,
+    not_modified,
+    page_etag,
+    user_etag,
+)
+
+now = datetime(2024, 5, 6, 7, 8, 9, 123456)
+
+
+def _version(updated_at: datetime = now) -> UserVersion:
+    return UserVersion(id=uuid4(), updated_at=updated_at)
+
+
+@pytest.mark.order(1)
+def test_user_etag_changes_with_updated_at():
+    version = _version()
+    etag = user_etag(version)
+
+    assert etag.startswith('W/"')
+    assert etag == user_etag(UserVersion(version.id, now.replace(tzinfo=UTC)))
+    assert etag != user_etag(
+        UserVersion(version.id, now + timedelta(microseconds=1))
+    )
+
+
+@pytest.mark.order(2)
+def test_page_etag_changes_with_items_and_total():
+    versions = [_version(), _version()]
+    etag = page_etag(versions, 10)
+
+    assert etag == page_etag(list(versions), 10)
+    assert etag != page_etag(versions, 11)
+    assert etag != page_etag(versions[:1], 10)
+    assert etag != page_etag([versions[0], _version()], 10)
+
+
+@pytest.mark.order(3)
+def test_etag_matches_uses_weak_comparison():
+    etag = 'W/"abc"'
+
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"x", W/"abc"', etag)
+    assert etag_matches('*', etag)
+    assert not etag_matches('W/"abcd"', etag)
+    assert not etag_matches(None, etag)
+
+
+@pytest.mark.order(4)
+def test_not_modified_has_validators_and_no_body():
+    versions = [_version(), _version(now + timedelta(days=1))]
+
+    response = not_modified(page_etag(versions), last_modified(versions))
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.body == b''
+    assert response.headers['etag'] == page_etag(versions)
+    assert response.headers['last-modified'] == (
+        'Tue, 07 May 2024 07:08:09 GMT'
+    )
+    assert last_modified([]) is None
@@ -0,0 +1,103 @@
+from datetime import datetime
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, field_validator
+
+from app.presentation.controllers.user_controller import router
+from app.presentation.schemas.user.response import UserResponse
+from app.presentation.serializers.orjson_response import (
+    ORJSONModelResponse,
+    ORJSONModelRoute,
+)
+
+validations = []
+
+
+class ItemResponse(BaseModel):
+    name: str
+
+    @field_validator('name')
+    @classmethod
+    def track(cls, value):
+        validations.append(value)
+        return value
+
+
+def _client() -> TestClient:
+    fast_router = APIRouter(route_class=ORJSONModelRoute)
+
+    @fast_router.post(
+        '/items', response_model=ItemResponse, status_code=HTTPStatus.CREATED
+    )
+    async def create_item():
+        return ItemResponse(name='item')
+
+    @fast_router.get('/sync', response_model=ItemResponse)
+    def sync_item():
+        return ItemResponse(name='sync')
+
+    @fast_router.get('/headers', response_model=ItemResponse)
+    async def item_with_headers(response: Response):
+        response.headers['ETag'] = 'W/"1"'
+        return ItemResponse(name='headers')
+
+    @fast_router.get('/raw')
+    async def raw_item():
+        return {'name': 'raw'}
+
+    app = FastAPI()
+    app.include_router(fast_router)
+    return TestClient(app)
+
+
+@pytest.mark.order(1)
+def test_render_serializes_model_once_with_orjson():
+    user = UserResponse(
+        id=uuid4(),
+        name='Fulano',
+        email='fulano@example.com',
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+    )
+
+    body = ORJSONModelResponse(user).body
+
+    assert body == user.model_dump_json().encode()
+
+
+@pytest.mark.order(2)
+def test_route_skips_response_model_validation():
+    validations.clear()
+    client = _client()
+
+    response = client.post('/items')
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.headers['content-type'] == 'application/json'
+    assert response.json() == {'name': 'item'}
+    assert validations == ['item']
+
+
+@pytest.mark.order(3)
+def test_route_handles_sync_endpoints_and_plain_content():
+    client = _client()
+
+    assert client.get('/sync').json() == {'name': 'sync'}
+    assert client.get('/raw').json() == {'name': 'raw'}
+
+
+@pytest.mark.order(4)
+def test_user_router_uses_fast_route():
+    assert all(isinstance(route, ORJSONModelRoute) for route in router.routes)
+
+
+@pytest.mark.order(5)
+def test_route_keeps_headers_from_response_parameter():
+    response = _client().get('/headers')
+
+    assert response.json() == {'name': 'headers'}
+    assert response.headers['etag'] == 'W/"1"'
+    assert response.headers['content-length'] == str(len(response.content))
@@ -0,0 +1,138 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.domain.entities.user import User
+from app.infrastructure.repositories.in_memory_refresh_token_repository import (  # noqa: E501
+    InMemoryRefreshTokenRepository,
+)
+from app.infrastructure.security.jwt import decode_access_token
+from app.infrastructure.security.password import (
+    get_password_hash,
+    verify_and_update_password,
+)
+from app.infrastructure.security.refresh_token import hash_refresh_token
+from app.use_cases.auth.login_user import LoginUserInput, LoginUserUseCase
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_login_user_use_case_success():
+    mock_repo = AsyncMock()
+    mock_repo.find_by_email.return_value = User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        password=get_password_hash(user_mock.password),
+    )
+
+    use_case = LoginUserUseCase(mock_repo)
+
+    result = await use_case.execute(
+        LoginUserInput(email=user_mock.email, password=user_mock.password)
+    )
+
+    assert result.success
+    assert decode_access_token(result.access_token).sub == str(user_mock.id)
+
+    mock_repo.find_by_email.assert_called_once_with(user_mock.email)
+    mock_repo.update_password.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_login_user_use_case_wrong_password():
+    mock_repo = AsyncMock()
+    mock_repo.find_by_email.return_value = User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        password=get_password_hash(user_mock.password),
+    )
+
+    use_case = LoginUserUseCase(mock_repo)
+
+    result = await use_case.execute(
+        LoginUserInput(email=user_mock.email, password='Wrong-Pass1')
+    )
+
+    assert not result.success
+    assert result.access_token is None
+    mock_repo.update_password.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_login_user_use_case_user_not_found():
+    mock_repo = AsyncMock()
+    mock_repo.find_by_email.return_value = None
+
+    use_case = LoginUserUseCase(mock_repo)
+
+    result = await use_case.execute(
+        LoginUserInput(email=user_mock.email, password=user_mock.password)
+    )
+
+    assert not result.success
+    assert result.access_token is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_login_user_use_case_rehashes_outdated_hash():
+    mock_repo = AsyncMock()
+    outdated_hash = Argon2Hasher(
+        time_cost=1, memory_cost=8192, parallelism=1
+    ).hash(user_mock.password)
+    mock_repo.find_by_email.return_value = User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        password=outdated_hash,
+    )
+
+    use_case = LoginUserUseCase(mock_repo)
+
+    result = await use_case.execute(
+        LoginUserInput(email=user_mock.email, password=user_mock.password)
+    )
+
+    assert result.success
+    mock_repo.update_password.assert_awaited_once()
+    user_id, new_hash = mock_repo.update_password.await_args.args
+    assert user_id == user_mock.id
+    assert verify_and_update_password(user_mock.password, new_hash) == (
+        True,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_login_user_use_case_issues_refresh_token():
+    mock_repo = AsyncMock()
+    mock_repo.find_by_email.return_value = User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        password=get_password_hash(user_mock.password),
+    )
+    refresh_repo = InMemoryRefreshTokenRepository()
+
+    use_case = LoginUserUseCase(mock_repo, refresh_repo)
+
+    result = await use_case.execute(
+        LoginUserInput(email=user_mock.email, password=user_mock.password)
+    )
+
+    assert result.success
+    stored = await refresh_repo.find_by_hash(
+        hash_refresh_token(result.refresh_token)
+    )
+    assert stored is not None
+    assert stored.user_id == user_mock.id
+    assert stored.revoked_at is None
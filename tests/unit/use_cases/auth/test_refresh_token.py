@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.domain.entities.refresh_token import RefreshToken
+from app.infrastructure.repositories.in_memory_refresh_token_repository import (  # noqa: E501
+    InMemoryRefreshTokenRepository,
+)
+from app.infrastructure.security.jwt import decode_access_token
+from app.infrastructure.security.refresh_token import (
+    generate_refresh_token,
+    hash_refresh_token,
+)
+from app.use_cases.auth.refresh_token import (
+    RefreshTokenInput,
+    RefreshTokenUseCase,
+)
+
+
+async def _issue(repository) -> tuple[str, RefreshToken]:
+    token = generate_refresh_token()
+    stored = await repository.create(
+        RefreshToken(
+            user_id=uuid4(),
+            family_id=uuid4(),
+            token_hash=hash_refresh_token(token),
+            expires_at=datetime.now(ZoneInfo('UTC')) + timedelta(days=1),
+        )
+    )
+    return token, stored
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_refresh_token_use_case_success():
+    repository = InMemoryRefreshTokenRepository()
+    token, stored = await _issue(repository)
+
+    result = await RefreshTokenUseCase(repository).execute(
+        RefreshTokenInput(refresh_token=token)
+    )
+
+    assert result.success
+    assert result.refresh_token != token
+    assert decode_access_token(result.access_token).sub == str(stored.user_id)
+    assert stored.revoked_at is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_refresh_token_use_case_unknown_token():
+    repository = InMemoryRefreshTokenRepository()
+
+    result = await RefreshTokenUseCase(repository).execute(
+        RefreshTokenInput(refresh_token='desconhecido')
+    )
+
+    assert not result.success
+    assert result.access_token is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_refresh_token_reuse_revokes_family():
+    repository = InMemoryRefreshTokenRepository()
+    token, _ = await _issue(repository)
+    use_case = RefreshTokenUseCase(repository)
+
+    first = await use_case.execute(RefreshTokenInput(refresh_token=token))
+    reused = await use_case.execute(RefreshTokenInput(refresh_token=token))
+
+    assert first.success
+    assert not reused.success
+
+    # O token emitido na primeira rotação também deixa de valer
+    second = await use_case.execute(
+        RefreshTokenInput(refresh_token=first.refresh_token)
+    )
+    assert not second.success
@@ -0,0 +1,105 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.entities.user import User
+from app.infrastructure.cache.token_cache import VerifiedTokenCache
+from app.infrastructure.cache.user_cache import AuthenticatedUserCache
+from app.infrastructure.security.jwt import create_access_token
+from app.use_cases.auth.verify_token import (
+    VerifyTokenInput,
+    VerifyTokenUseCase,
+)
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+def make_user() -> User:
+    return User(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        password=user_mock.password,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_verify_token_use_case_caches_user():
+    mock_repo = AsyncMock()
+    mock_repo.find_by_id.return_value = make_user()
+    user_cache = AuthenticatedUserCache(max_size=10, ttl=60)
+
+    use_case = VerifyTokenUseCase(mock_repo, user_cache=user_cache)
+    input_data = VerifyTokenInput(token=create_access_token(str(user_mock.id)))
+
+    first = await use_case.execute(input_data)
+    second = await use_case.execute(input_data)
+
+    assert first.is_valid
+    assert second.is_valid
+    assert second.user.id == user_mock.id
+    assert user_cache.stats.hits == 1
+    assert user_cache.stats.misses == 1
+
+    mock_repo.find_by_id.assert_called_once_with(user_mock.id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_verify_token_use_case_reloads_after_invalidation():
+    mock_repo = AsyncMock()
+    mock_repo.find_by_id.return_value = make_user()
+    user_cache = AuthenticatedUserCache(max_size=10, ttl=60)
+
+    use_case = VerifyTokenUseCase(mock_repo, user_cache=user_cache)
+    input_data = VerifyTokenInput(token=create_access_token(str(user_mock.id)))
+
+    await use_case.execute(input_data)
+    user_cache.on_user_deleted(user_mock.id)
+    mock_repo.find_by_id.return_value = None
+
+    result = await use_case.execute(input_data)
+
+    assert not result.is_valid
+    assert mock_repo.find_by_id.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_verify_token_use_case_invalid_token():
+    mock_repo = AsyncMock()
+
+    use_case = VerifyTokenUseCase(
+        mock_repo, user_cache=AuthenticatedUserCache(max_size=10, ttl=60)
+    )
+
+    result = await use_case.execute(VerifyTokenInput(token='invalid'))
+
+    assert not result.is_valid
+    assert result.user is None
+
+    mock_repo.find_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_verify_token_use_case_caches_verified_token():
+    mock_repo = AsyncMock()
+    mock_repo.find_by_id.return_value = make_user()
+    token_cache = VerifiedTokenCache(max_size=10, ttl=3600)
+
+    use_case = VerifyTokenUseCase(
+        mock_repo,
+        user_cache=AuthenticatedUserCache(max_size=10, ttl=60),
+        token_cache=token_cache,
+    )
+    input_data = VerifyTokenInput(token=create_access_token(str(user_mock.id)))
+
+    await use_case.execute(input_data)
+    result = await use_case.execute(input_data)
+
+    assert result.is_valid
+    assert token_cache.stats.hits == 1
+    assert token_cache.stats.misses == 1
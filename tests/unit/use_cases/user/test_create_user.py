@@ -1,9 +1,11 @@
+from http import HTTPStatus
 from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import HTTPException
 
 from app.domain.entities.user import User
+from app.infrastructure.cache.user_list_cache import UserListCache
 from app.infrastructure.security.password import get_password_hash
 from app.use_cases.user.create_user import CreateUserUseCase
 from tests.mocks.user import User as MockUser
@@ -12,7 +14,6 @@ from tests.mocks.user import User as MockUser
 @pytest.mark.order(1)
 async def test_create_user_use_case_success():
     mock_repo = AsyncMock()
-    mock_repo.find_by_email.return_value = None
 
     user_mock = MockUser()
 
@@ -24,7 +25,9 @@ async def test_create_user_use_case_success():
     )
     mock_repo.create.return_value = created_user
 
-    use_case = CreateUserUseCase(mock_repo)
+    list_cache = UserListCache(max_size=10, ttl=60)
+    use_case = CreateUserUseCase(mock_repo, list_cache)
+    version = await list_cache.versions.current()
 
     result = await use_case.execute(user_mock)
 
@@ -32,18 +35,21 @@ async def test_create_user_use_case_success():
     assert result.user.name == user_mock.name
     assert result.user.email == user_mock.email
 
-    mock_repo.find_by_email.assert_called_once_with(user_mock.email)
+    mock_repo.find_by_email.assert_not_called()
     mock_repo.create.assert_called_once()
+    assert await list_cache.versions.current() > version
 
 
 @pytest.mark.order(2)
 async def test_create_user_use_case_email_already_exists():
     mock_repo = AsyncMock()
-    mock_repo.find_by_email.return_value = User()
+    mock_repo.create.return_value = None
 
     use_case = CreateUserUseCase(mock_repo)
 
-    with pytest.raises(HTTPException, match='User already exists'):
+    with pytest.raises(HTTPException, match='User already exists') as exc:
         await use_case.execute(MockUser())
 
-    mock_repo.find_by_email.assert_called_once_with(MockUser().email)
+    assert exc.value.status_code == HTTPStatus.CONFLICT
+    mock_repo.find_by_email.assert_not_called()
+    mock_repo.create.assert_called_once()
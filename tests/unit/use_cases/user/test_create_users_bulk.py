@@ -0,0 +1,83 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.user import User
+from app.use_cases.user.create_user import CreateUserInput
+from app.use_cases.user.create_users_bulk import (
+    CreateUsersBulkInput,
+    CreateUsersBulkUseCase,
+)
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+def make_input(prefix: str) -> CreateUserInput:
+    return CreateUserInput(
+        name=user_mock.name,
+        email=f'{prefix}.{user_mock.email}',
+        password=user_mock.password,
+    )
+
+
+async def fake_create_many(users: list[User]) -> list[User]:
+    for user in users:
+        user.id = uuid4()
+    return users
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_create_users_bulk_use_case_reports_conflicts():
+    existing = make_input('existing')
+    new = make_input('new')
+
+    mock_repo = AsyncMock()
+    mock_repo.find_by_emails.return_value = [
+        User(
+            id=uuid4(),
+            name=existing.name,
+            email=existing.email,
+            password='hash',
+        )
+    ]
+    mock_repo.create_many.side_effect = fake_create_many
+    list_cache = AsyncMock()
+
+    use_case = CreateUsersBulkUseCase(mock_repo, list_cache)
+
+    result = await use_case.execute(
+        CreateUsersBulkInput(users=[existing, new, new])
+    )
+
+    assert [item.created for item in result.results] == [False, True, False]
+    assert result.results[1].user.email == new.email
+    assert result.results[1].user.password != new.password
+
+    mock_repo.find_by_emails.assert_called_once_with([
+        existing.email,
+        new.email,
+    ])
+    created_users = mock_repo.create_many.call_args.args[0]
+    assert [user.email for user in created_users] == [new.email]
+    # Uma única versão nova para o lote inteiro
+    list_cache.invalidate.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_create_users_bulk_use_case_conflict_on_insert():
+    item = make_input('race')
+
+    mock_repo = AsyncMock()
+    mock_repo.find_by_emails.return_value = []
+    mock_repo.create_many.return_value = []
+
+    use_case = CreateUsersBulkUseCase(mock_repo)
+
+    result = await use_case.execute(CreateUsersBulkInput(users=[item]))
+
+    assert not result.results[0].created
+    assert result.results[0].user is None
@@ -3,6 +3,7 @@ from uuid import uuid4
 
 import pytest
 
+from app.constants import CountMode
 from app.domain.entities.user import User
 from app.use_cases.user.list_users import ListUsersInput, ListUsersUseCase
 from tests.mocks.user import User as MockUser
@@ -27,7 +28,8 @@ async def test_list_users_use_case_success():
         for i in range(15)
     ]
 
-    mock_repo.index.return_value = mock_users
+    mock_repo.index.return_value = mock_users[10:]
+    mock_repo.count.return_value = len(mock_users)
 
     page = 2
     page_size = 10
@@ -37,11 +39,12 @@ async def test_list_users_use_case_success():
 
     result = await use_case.execute(input_data)
 
-    assert result.users == mock_users
+    assert result.users == mock_users[10:]
     assert result.total == len(mock_users)
     assert result.total_pages == page
 
     mock_repo.index.assert_called_once_with(page, page_size)
+    mock_repo.count.assert_called_once_with(estimated=False)
 
 
 @pytest.mark.asyncio
@@ -50,6 +53,7 @@ async def test_list_users_use_case_empty_result():
     mock_repo = AsyncMock()
 
     mock_repo.index.return_value = []
+    mock_repo.count.return_value = 0
 
     page = 1
     page_size = 10
@@ -85,6 +89,7 @@ async def test_list_users_use_case_exact_page_size():
     ]
 
     mock_repo.index.return_value = mock_users
+    mock_repo.count.return_value = len(mock_users)
 
     page = 1
 
@@ -98,3 +103,52 @@ async def test_list_users_use_case_exact_page_size():
     assert result.total_pages == page
 
     mock_repo.index.assert_called_once_with(page, page_size)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_list_users_use_case_estimated_count_never_below_seen():
+    mock_repo = AsyncMock()
+
+    mock_repo.index.return_value = [
+        User(
+            id=uuid4(),
+            name=user_mock.name,
+            email=user_mock.email,
+            password=user_mock.password,
+        )
+    ] * 5
+    mock_repo.count.return_value = 12
+
+    use_case = ListUsersUseCase(mock_repo)
+    input_data = ListUsersInput(
+        page=3, page_size=10, count_mode=CountMode.ESTIMATED
+    )
+
+    result = await use_case.execute(input_data)
+
+    assert result.total == 25  # noqa: PLR2004
+    assert result.total_pages == 3  # noqa: PLR2004
+
+    mock_repo.count.assert_called_once_with(estimated=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_list_users_use_case_count_disabled():
+    mock_repo = AsyncMock()
+
+    mock_repo.index.return_value = []
+
+    use_case = ListUsersUseCase(mock_repo)
+    input_data = ListUsersInput(
+        page=1, page_size=10, count_mode=CountMode.NONE
+    )
+
+    result = await use_case.execute(input_data)
+
+    assert result.users == []
+    assert result.total is None
+    assert result.total_pages is None
+
+    mock_repo.count.assert_not_called()
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserCursor
+from app.use_cases.user.list_users_by_cursor import (
+    ListUsersByCursorInput,
+    ListUsersByCursorUseCase,
+)
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+start = datetime(2025, 1, 1)
+
+mock_users = [
+    User(
+        id=uuid4(),
+        name=user_mock.name,
+        email=user_mock.email,
+        password=user_mock.password,
+        created_at=start + timedelta(minutes=i),
+    )
+    for i in range(3)
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_list_users_by_cursor_first_page():
+    mock_repo = AsyncMock()
+    mock_repo.index_by_cursor.return_value = mock_users
+
+    use_case = ListUsersByCursorUseCase(mock_repo)
+
+    result = await use_case.execute(ListUsersByCursorInput(page_size=2))
+
+    assert result.users == mock_users[:2]
+    assert result.next_cursor == UserCursor.from_user(mock_users[1])
+    assert result.prev_cursor is None
+
+    mock_repo.index_by_cursor.assert_called_once_with(
+        3, cursor=None, backwards=False
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_list_users_by_cursor_last_page():
+    mock_repo = AsyncMock()
+    mock_repo.index_by_cursor.return_value = mock_users[2:]
+
+    cursor = UserCursor.from_user(mock_users[1])
+    use_case = ListUsersByCursorUseCase(mock_repo)
+
+    result = await use_case.execute(
+        ListUsersByCursorInput(page_size=2, cursor=cursor)
+    )
+
+    assert result.users == mock_users[2:]
+    assert result.next_cursor is None
+    assert result.prev_cursor == UserCursor.from_user(mock_users[2])
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(3)
+async def test_list_users_by_cursor_backwards():
+    mock_repo = AsyncMock()
+    mock_repo.index_by_cursor.return_value = mock_users
+
+    cursor = UserCursor(created_at=start + timedelta(hours=1), id=uuid4())
+    use_case = ListUsersByCursorUseCase(mock_repo)
+
+    result = await use_case.execute(
+        ListUsersByCursorInput(page_size=2, cursor=cursor, backwards=True)
+    )
+
+    assert result.users == mock_users[1:]
+    assert result.next_cursor == UserCursor.from_user(mock_users[2])
+    assert result.prev_cursor == UserCursor.from_user(mock_users[1])
+
+    mock_repo.index_by_cursor.assert_called_once_with(
+        3, cursor=cursor, backwards=True
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(4)
+async def test_list_users_by_cursor_empty():
+    mock_repo = AsyncMock()
+    mock_repo.index_by_cursor.return_value = []
+
+    use_case = ListUsersByCursorUseCase(mock_repo)
+
+    result = await use_case.execute(ListUsersByCursorInput(page_size=2))
+
+    assert result.users == []
+    assert result.next_cursor is None
+    assert result.prev_cursor is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(5)
+async def test_list_users_by_cursor_empty_backwards_page():
+    mock_repo = AsyncMock()
+    mock_repo.index_by_cursor.return_value = []
+    cursor = UserCursor(created_at=datetime.now(), id=uuid4())
+
+    use_case = ListUsersByCursorUseCase(mock_repo)
+
+    result = await use_case.execute(
+        ListUsersByCursorInput(page_size=2, cursor=cursor, backwards=True)
+    )
+
+    assert result.users == []
+    assert result.next_cursor == cursor
+    assert result.prev_cursor is None
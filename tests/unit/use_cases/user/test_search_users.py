@@ -0,0 +1,46 @@
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.entities.user import UserReadModel
+from app.use_cases.user.search_users import (
+    SearchUsersInput,
+    SearchUsersUseCase,
+)
+from tests.mocks.user import User as MockUser
+
+user_mock = MockUser()
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(1)
+async def test_search_users_use_case():
+    now = datetime.now()
+    user = UserReadModel(
+        id=user_mock.id,
+        name=user_mock.name,
+        email=user_mock.email,
+        created_at=now,
+        updated_at=now,
+    )
+    mock_repo = AsyncMock()
+    mock_repo.search.return_value = [user]
+
+    use_case = SearchUsersUseCase(mock_repo)
+    result = await use_case.execute(SearchUsersInput(query='ana', limit=5))
+
+    assert result.users == [user]
+    mock_repo.search.assert_awaited_once_with('ana', 5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.order(2)
+async def test_search_users_use_case_blank_query():
+    mock_repo = AsyncMock()
+
+    use_case = SearchUsersUseCase(mock_repo)
+    result = await use_case.execute(SearchUsersInput(query='   '))
+
+    assert result.users == []
+    mock_repo.search.assert_not_called()